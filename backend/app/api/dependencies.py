@@ -1,29 +1,37 @@
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from ..core.config import Settings, get_settings
+from ..core.config import Settings
 from ..core.security import UserRole
-from ..repositories.audit_repository import AuditRepository
-from ..repositories.drive_repository import DriveRepository
-from ..repositories.sheets_repository import SheetsRepository
 from ..services.auth_service import AuthService, UserIdentity
+from ..services.blocking_executor import BlockingExecutor
+from ..services.bulk_import import BulkImportService
+from ..services.container import ServiceContainer
+from ..services.event_hub import EventHub
 from ..services.ingestion_service import IngestionService
+from ..services.nlp_registry import NLPModelRegistry
+from ..services.ocr_service import OCRService
 from ..services.parsing_service import ParsingService
 from ..services.storage_service import StorageService
 from ..services.whatsapp_service import WhatsAppService
-
+from ..workers.job_queue import JobQueue
+from ..workers.runner import JobWorker
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_app_settings() -> Settings:
-    return get_settings()
+def get_container(request: Request) -> ServiceContainer:
+    return request.app.state.container
+
+
+def get_app_settings(container: ServiceContainer = Depends(get_container)) -> Settings:
+    return container.settings
 
 
-def get_auth_service(settings: Settings = Depends(get_app_settings)) -> AuthService:
-    return AuthService(settings=settings)
+def get_auth_service(container: ServiceContainer = Depends(get_container)) -> AuthService:
+    return container.auth_service
 
 
 def get_current_user(
@@ -58,38 +66,45 @@ def require_any_role(roles: list[UserRole]):
     return _enforce
 
 
-def get_parsing_service(
-    settings: Settings = Depends(get_app_settings),
-) -> ParsingService:
-    return ParsingService(settings=settings)
-
-
-def get_storage_service(
-    settings: Settings = Depends(get_app_settings),
-) -> StorageService:
-    sheets_repo = SheetsRepository(settings=settings)
-    drive_repo = DriveRepository(settings=settings)
-    audit_repo = AuditRepository()
-    return StorageService(
-        sheets_repository=sheets_repo,
-        drive_repository=drive_repo,
-        audit_repository=audit_repo,
-        settings=settings,
-    )
-
-
-def get_ingestion_service(
-    parsing_service: ParsingService = Depends(get_parsing_service),
-    storage_service: StorageService = Depends(get_storage_service),
-) -> IngestionService:
-    return IngestionService(
-        parsing_service=parsing_service,
-        storage_service=storage_service,
-    )
-
-
-def get_whatsapp_service(
-    settings: Settings = Depends(get_app_settings),
-    ingestion_service: IngestionService = Depends(get_ingestion_service),
-) -> WhatsAppService:
-    return WhatsAppService(settings=settings, ingestion_service=ingestion_service)
+def get_model_registry(container: ServiceContainer = Depends(get_container)) -> NLPModelRegistry:
+    return container.nlp_registry
+
+
+def get_parsing_service(container: ServiceContainer = Depends(get_container)) -> ParsingService:
+    return container.parsing_service
+
+
+def get_ocr_service(container: ServiceContainer = Depends(get_container)) -> OCRService:
+    return container.ocr_service
+
+
+def get_event_hub(container: ServiceContainer = Depends(get_container)) -> EventHub:
+    return container.event_hub
+
+
+def get_storage_service(container: ServiceContainer = Depends(get_container)) -> StorageService:
+    return container.storage_service
+
+
+def get_ingestion_service(container: ServiceContainer = Depends(get_container)) -> IngestionService:
+    return container.ingestion_service
+
+
+def get_bulk_import(container: ServiceContainer = Depends(get_container)) -> BulkImportService:
+    return container.bulk_import
+
+
+def get_blocking_executor(container: ServiceContainer = Depends(get_container)) -> BlockingExecutor:
+    return container.blocking_executor
+
+
+def get_whatsapp_service(container: ServiceContainer = Depends(get_container)) -> WhatsAppService:
+    return container.whatsapp_service
+
+
+def get_job_queue(container: ServiceContainer = Depends(get_container)) -> JobQueue:
+    return container.job_queue
+
+
+def get_job_worker(container: ServiceContainer = Depends(get_container)) -> JobWorker | None:
+    return container.job_worker if container.settings.job_worker_embedded else None
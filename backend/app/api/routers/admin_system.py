@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from ...core.security import UserRole
+from ...models.request_models import NLPReloadRequest
+from ...models.response_models import NLPModelStatsResponse
+from ...services.auth_service import AuthService
+from ...services.blocking_executor import BlockingExecutor
+from ...services.bulk_import import BulkImportService
+from ...services.event_hub import EventHub
+from ...services.nlp_registry import NLPModelRegistry
+from ...services.ocr_service import OCRService
+from ...services.parsing_service import ParsingService
+from ...services.whatsapp_service import WhatsAppService
+from ...workers.job_queue import JobQueue
+from ..dependencies import (
+    get_auth_service,
+    get_blocking_executor,
+    get_bulk_import,
+    get_event_hub,
+    get_job_queue,
+    get_model_registry,
+    get_ocr_service,
+    get_parsing_service,
+    get_whatsapp_service,
+    require_role,
+)
+
+router = APIRouter(prefix="/admin/system", dependencies=[Depends(require_role(UserRole.admin))])
+
+
+@router.get("/nlp", response_model=NLPModelStatsResponse)
+async def nlp_model_stats(
+    registry: NLPModelRegistry = Depends(get_model_registry),
+) -> NLPModelStatsResponse:
+    return _stats_response(registry)
+
+
+@router.post("/nlp/reload", response_model=NLPModelStatsResponse)
+def reload_nlp_model(
+    payload: NLPReloadRequest,
+    registry: NLPModelRegistry = Depends(get_model_registry),
+) -> NLPModelStatsResponse:
+    try:
+        registry.reload(payload.model_name)
+    except OSError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return _stats_response(registry)
+
+
+@router.get("/metrics", response_model=dict)
+def runtime_metrics(
+    auth_service: AuthService = Depends(get_auth_service),
+    event_hub: EventHub = Depends(get_event_hub),
+    job_queue: JobQueue = Depends(get_job_queue),
+    whatsapp_service: WhatsAppService = Depends(get_whatsapp_service),
+    ocr_service: OCRService = Depends(get_ocr_service),
+    executor: BlockingExecutor = Depends(get_blocking_executor),
+    bulk_import: BulkImportService = Depends(get_bulk_import),
+    parsing_service: ParsingService = Depends(get_parsing_service),
+) -> dict:
+    dedup = whatsapp_service.dedup_store
+    return {
+        "token_cache": auth_service.token_cache_stats(),
+        "event_stream": event_hub.stats(),
+        "job_queue": job_queue.stats(),
+        "message_dedup": dedup.stats() if dedup else None,
+        "ocr": ocr_service.stats(),
+        "media_fetch": whatsapp_service.media_fetcher.stats(),
+        "executor": executor.stats(),
+        "bulk_import": bulk_import.stats(),
+        "nlp_batching": parsing_service.batcher.stats() if parsing_service.batcher else None,
+    }
+
+
+def _stats_response(registry: NLPModelRegistry) -> NLPModelStatsResponse:
+    stats = registry.stats()
+    if stats is None:
+        return NLPModelStatsResponse(loaded=False, model_name=registry.model_name)
+    return NLPModelStatsResponse(
+        loaded=True,
+        model_name=stats.model_name,
+        pipeline=stats.pipeline,
+        load_seconds=stats.load_seconds,
+        rss_delta_bytes=stats.rss_delta_bytes,
+        rss_after_bytes=stats.rss_after_bytes,
+    )
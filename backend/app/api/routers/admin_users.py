@@ -12,7 +12,7 @@ router = APIRouter(prefix="/admin/users", dependencies=[Depends(require_role(Use
 
 
 @router.get("", response_model=RecruiterListResponse)
-async def list_recruiters(
+def list_recruiters(
     auth_service: AuthService = Depends(get_auth_service),
 ) -> RecruiterListResponse:
     users = auth_service.list_users(roles=[UserRole.recruiter])
@@ -26,7 +26,7 @@ async def list_recruiters(
 
 
 @router.post("", response_model=UserProfile, status_code=status.HTTP_201_CREATED)
-async def create_recruiter(
+def create_recruiter(
     payload: RecruiterCreateRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> UserProfile:
@@ -43,7 +43,7 @@ async def create_recruiter(
 
 
 @router.delete("/{email}", status_code=status.HTTP_200_OK, response_model=dict[str, str])
-async def delete_recruiter(
+def delete_recruiter(
     email: str,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> None:
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/auth")
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+def login(
     payload: LoginRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> TokenResponse:
@@ -20,7 +20,9 @@ async def login(
     except ValueError as exc:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
     token = auth_service.issue_token(identity)
-    return TokenResponse(access_token=token, token_type="bearer", user=_profile_from_identity(identity))
+    return TokenResponse(
+        access_token=token, token_type="bearer", user=_profile_from_identity(identity)
+    )
 
 
 @router.get("/me", response_model=UserProfile)
@@ -1,38 +1,264 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Literal, Optional
 
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi import status as http_status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from ...core.config import Settings
+from ...core.security import UserRole
 from ...models.request_models import CandidateStatusUpdateRequest
-from ...models.response_models import CandidateBoardResponse, CandidateListResponse, CandidateRecord, CandidateStatus
-from ...services.storage_service import StorageService
+from ...models.response_models import (
+    BulkImportItemResult,
+    BulkImportResponse,
+    CandidateBoardResponse,
+    CandidateChangesResponse,
+    CandidateListResponse,
+    CandidateRecord,
+    CandidateStatus,
+)
 from ...services.auth_service import UserIdentity
-from ..dependencies import get_storage_service, require_any_role
-from ...core.security import UserRole
+from ...services.bulk_import import BulkImportService, ImportJob
+from ...services.event_hub import EventHub, HubEvent, Subscription
+from ...services.storage_service import StorageService
+from ...utils.attachment_blob import AttachmentBlob
+from ...utils.file_utils import FileDownloadError
+from ...utils.pagination import InvalidCursorError
+from ..dependencies import (
+    get_app_settings,
+    get_bulk_import,
+    get_event_hub,
+    get_storage_service,
+    require_any_role,
+)
 
 router = APIRouter(prefix="/candidates")
 
 
+def _conditional(request: Request, response: Response, tag: str) -> Response | None:
+    """Tag the response with the storage change tag; short-circuit to 304 if the client has it."""
+
+    etag = f'W/"{tag}"'
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    presented = {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}
+    if etag in presented or "*" in presented:
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+        )
+    return None
+
+
 @router.get("", response_model=CandidateListResponse)
-async def list_candidates(
+def list_candidates(
+    request: Request,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=200),
     status: CandidateStatus | None = Query(default=None),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
+    sort: Literal["received_at", "full_name", "confidence"] = Query(default="received_at"),
+    order: Literal["asc", "desc"] = Query(default="desc"),
     storage_service: StorageService = Depends(get_storage_service),
     _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
-) -> CandidateListResponse:
-    records = storage_service.list_candidates(status=status, limit=limit)
-    return CandidateListResponse(items=records, count=len(records))
+) -> CandidateListResponse | Response:
+    not_modified = _conditional(request, response, storage_service.change_tag())
+    if not_modified is not None:
+        return not_modified
+    try:
+        records, next_cursor = storage_service.page_candidates(
+            status=status, limit=limit, cursor=cursor, sort=sort, descending=order == "desc"
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response.headers["X-Total-Count"] = str(storage_service.count_candidates(status=status))
+    return CandidateListResponse(items=records, count=len(records), next_cursor=next_cursor)
 
 
 @router.get("/board", response_model=CandidateBoardResponse)
-async def candidate_board(
+def candidate_board(
+    request: Request,
+    response: Response,
+    per_column_limit: int | None = Query(default=None, ge=1, le=500),
+    counts_only: bool = Query(default=False),
+    storage_service: StorageService = Depends(get_storage_service),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> CandidateBoardResponse | Response:
+    not_modified = _conditional(request, response, storage_service.change_tag())
+    if not_modified is not None:
+        return not_modified
+    return storage_service.get_candidate_board(
+        per_column_limit=per_column_limit, counts_only=counts_only
+    )
+
+
+@router.get("/changes", response_model=CandidateChangesResponse)
+def candidate_changes(
+    since: int = Query(
+        ...,
+        ge=0,
+        description="`version` from the previous poll (the part after the dash in the list/board ETag)",
+    ),
+    epoch: str
+    | None = Query(
+        default=None, description="`epoch` from the previous poll; a different epoch forces a reset"
+    ),
+    limit: int = Query(default=500, ge=1, le=2000),
+    storage_service: StorageService = Depends(get_storage_service),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> CandidateChangesResponse:
+    return storage_service.changes_since(since, limit=limit, epoch=epoch)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def candidate_stream(
+    request: Request,
     storage_service: StorageService = Depends(get_storage_service),
+    event_hub: EventHub = Depends(get_event_hub),
+    settings: Settings = Depends(get_app_settings),
     _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
-) -> CandidateBoardResponse:
-    return storage_service.get_candidate_board()
+) -> StreamingResponse:
+    """Server-sent events: candidate_ingested, status_updated and deleted, with keep-alive comments."""
+
+    subscription = event_hub.subscribe()
+    try:
+        # In Google mode this may reload the sheet index, so keep it off the event loop.
+        tag = await run_in_threadpool(storage_service.change_tag)
+    except BaseException:
+        event_hub.unsubscribe(subscription)
+        raise
+    last_seen = request.headers.get("last-event-id")
+    resync = None
+    if last_seen is not None and last_seen != tag:
+        # Reconnected after missing events; the client should catch up via /changes.
+        epoch, _, version = tag.rpartition("-")
+        resync = HubEvent(
+            event="resync",
+            data={"since": last_seen, "epoch": epoch, "version": int(version)},
+            id=tag,
+        )
+    return StreamingResponse(
+        _event_stream(
+            request, event_hub, subscription, settings.event_stream_heartbeat_seconds, resync
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _event_stream(
+    request: Request,
+    event_hub: EventHub,
+    subscription: Subscription,
+    heartbeat: float,
+    resync: HubEvent | None,
+) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        if resync is not None:
+            yield resync.encode()
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                break
+            yield event.encode()
+    finally:
+        event_hub.unsubscribe(subscription)
+
+
+@router.post(
+    "/import", response_model=BulkImportResponse, status_code=http_status.HTTP_202_ACCEPTED
+)
+def import_candidates(
+    files: List[UploadFile] = File(..., description="Resumes, or ZIP archives of resumes"),
+    bulk_import: BulkImportService = Depends(get_bulk_import),
+    settings: Settings = Depends(get_app_settings),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> BulkImportResponse:
+    """Start a bulk import; poll ``GET /candidates/import/{id}`` for progress and per-file results."""
+
+    if len(files) > settings.bulk_import_max_files:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Import has {len(files)} files; the limit is {settings.bulk_import_max_files}",
+        )
+    uploads: List[AttachmentBlob] = []
+    job: Optional[ImportJob] = None
+    try:
+        remaining = settings.bulk_import_max_total_bytes
+        for upload in files:
+            if remaining <= 0:
+                raise ValueError(
+                    f"Import exceeds the {settings.bulk_import_max_total_bytes} byte total limit"
+                )
+            try:
+                blob = AttachmentBlob.from_stream(
+                    iter(lambda: upload.file.read(1024 * 1024), b""),
+                    filename=upload.filename,
+                    content_type=upload.content_type,
+                    spool_threshold=settings.attachment_spool_threshold_bytes,
+                    max_bytes=min(settings.bulk_import_max_upload_bytes, remaining),
+                )
+            except FileDownloadError as exc:
+                if remaining < settings.bulk_import_max_upload_bytes:
+                    raise ValueError(
+                        f"Import exceeds the {settings.bulk_import_max_total_bytes} "
+                        "byte total limit"
+                    ) from exc
+                raise
+            uploads.append(blob)
+            remaining -= blob.size
+        job = bulk_import.submit(uploads)
+    except (ValueError, FileDownloadError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    finally:
+        if job is None:  # the import owns the blobs only once it has been accepted
+            for blob in uploads:
+                blob.close()
+    return _import_response(job, include_items=False)
+
+
+@router.get("/import/{import_id}", response_model=BulkImportResponse)
+def import_status(
+    import_id: str,
+    include_items: bool = Query(default=True),
+    bulk_import: BulkImportService = Depends(get_bulk_import),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> BulkImportResponse:
+    job = bulk_import.get(import_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return _import_response(job, include_items=include_items)
+
+
+def _import_response(job: ImportJob, include_items: bool) -> BulkImportResponse:
+    def _ts(value: float) -> datetime:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+
+    items = list(job.items)
+    return BulkImportResponse(
+        id=job.id,
+        status=job.status,
+        total=len(items),
+        processed=job.processed,
+        succeeded=job.succeeded,
+        failed=job.failed,
+        created_at=_ts(job.created_at),
+        finished_at=_ts(job.finished_at) if job.finished_at else None,
+        error=job.error,
+        items=[BulkImportItemResult(**vars(item)) for item in items] if include_items else None,
+    )
 
 
 @router.patch("/{candidate_id}/status", response_model=CandidateRecord)
-async def update_candidate_status(
+def update_candidate_status(
     candidate_id: str,
     request: CandidateStatusUpdateRequest,
     storage_service: StorageService = Depends(get_storage_service),
@@ -45,7 +271,7 @@ async def update_candidate_status(
 
 
 @router.delete("/{candidate_id}", response_model=CandidateRecord)
-async def delete_candidate(
+def delete_candidate(
     candidate_id: str,
     storage_service: StorageService = Depends(get_storage_service),
     _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
@@ -57,7 +283,7 @@ async def delete_candidate(
 
 
 @router.delete("", response_model=dict)
-async def delete_candidates_by_status(
+def delete_candidates_by_status(
     status: CandidateStatus = Query(...),
     storage_service: StorageService = Depends(get_storage_service),
     _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ...core.security import UserRole
+from ...models.response_models import JobQueueStatsResponse, JobStatusResponse
+from ...services.auth_service import UserIdentity
+from ...workers.job_queue import QUEUED, Job, JobQueue
+from ...workers.runner import JobWorker
+from ..dependencies import get_job_queue, get_job_worker, require_any_role, require_role
+
+router = APIRouter(prefix="/jobs")
+
+
+@router.get("/stats", response_model=JobQueueStatsResponse)
+def queue_stats(
+    job_queue: JobQueue = Depends(get_job_queue),
+    job_worker: JobWorker | None = Depends(get_job_worker),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> JobQueueStatsResponse:
+    return JobQueueStatsResponse(
+        **job_queue.stats(), worker=job_worker.stats() if job_worker else None
+    )
+
+
+@router.get("/dead", response_model=List[JobStatusResponse])
+def dead_letters(
+    limit: int = Query(default=50, ge=1, le=500),
+    job_queue: JobQueue = Depends(get_job_queue),
+    _: UserIdentity = Depends(require_role(UserRole.admin)),
+) -> List[JobStatusResponse]:
+    return [_job_response(job) for job in job_queue.dead_letters(limit=limit)]
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+def job_status(
+    job_id: str,
+    job_queue: JobQueue = Depends(get_job_queue),
+    _: UserIdentity = Depends(require_any_role([UserRole.recruiter, UserRole.admin])),
+) -> JobStatusResponse:
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return _job_response(job)
+
+
+@router.post("/{job_id}/retry", response_model=JobStatusResponse)
+def retry_dead_letter(
+    job_id: str,
+    job_queue: JobQueue = Depends(get_job_queue),
+    _: UserIdentity = Depends(require_role(UserRole.admin)),
+) -> JobStatusResponse:
+    if not job_queue.retry_dead(job_id):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Dead-lettered job not found")
+    return _job_response(job_queue.get(job_id))
+
+
+def _job_response(job: Job) -> JobStatusResponse:
+    def _ts(value: float) -> datetime:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+
+    return JobStatusResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        created_at=_ts(job.created_at),
+        updated_at=_ts(job.updated_at),
+        next_attempt_at=_ts(job.available_at) if job.status == QUEUED else None,
+        last_error=job.last_error,
+        result=job.result,
+    )
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from ...models.request_models import ManualIngestRequest
 from ...models.response_models import IngestResponse
+from ...services.blocking_executor import BlockingExecutor
 from ...services.ingestion_service import IngestionService
 from ...services.whatsapp_service import WhatsAppService
-from ..dependencies import get_ingestion_service, get_whatsapp_service
+from ...workers.job_queue import JobQueue
+from ...workers.tasks import WHATSAPP_MESSAGE
+from ..dependencies import (
+    get_blocking_executor,
+    get_ingestion_service,
+    get_job_queue,
+    get_whatsapp_service,
+)
 
 router = APIRouter(prefix="/whatsapp")
 
@@ -14,9 +23,9 @@ router = APIRouter(prefix="/whatsapp")
 @router.post("/webhook", include_in_schema=False)
 async def whatsapp_webhook(
     request: Request,
-    background_tasks: BackgroundTasks,
     twilio_signature: str | None = Header(default=None, alias="X-Twilio-Signature"),
     whatsapp_service: WhatsAppService = Depends(get_whatsapp_service),
+    job_queue: JobQueue = Depends(get_job_queue),
 ) -> Response:
     form = await request.form()
     payload = {key: value for key, value in form.multi_items()}
@@ -28,16 +37,27 @@ async def whatsapp_webhook(
     ):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid Twilio signature")
 
-    background_tasks.add_task(whatsapp_service.process_incoming_message, payload)
-    return Response(content="Message received", media_type="text/plain")
+    # Persist before acknowledging so a crash or restart cannot lose the message. The SQLite
+    # write can wait on busy_timeout, so keep it off the event loop.
+    job_id = await run_in_threadpool(job_queue.enqueue, WHATSAPP_MESSAGE, payload)
+    return Response(
+        content="Message received", media_type="text/plain", headers={"X-Job-Id": job_id}
+    )
 
 
-@router.post("/manual-ingest", response_model=IngestResponse, summary="Developer helper to ingest resumes")
+@router.post(
+    "/manual-ingest", response_model=IngestResponse, summary="Developer helper to ingest resumes"
+)
 async def manual_ingest(
     request: ManualIngestRequest,
     ingestion_service: IngestionService = Depends(get_ingestion_service),
+    executor: BlockingExecutor = Depends(get_blocking_executor),
 ) -> IngestResponse:
-    record = ingestion_service.ingest_payload(
+    # The async pipeline runs OCR, spaCy and storage in worker threads; the executor caps
+    # how many ingests run at once and how many may wait (429 beyond that).
+    record = await executor.run_async(
+        "ingest",
+        ingestion_service.ingest_payload_async,
         source="manual",
         body=request.body,
         attachments=request.attachments or [],
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
-from pathlib import Path
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     jwt_secret: str = "change-me"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expires: int = 60 * 60  # seconds
+    token_cache_size: int = 2048
 
     admin_email: str = "admin@example.com"
     admin_password: str = "admin123"
@@ -41,14 +42,185 @@ class Settings(BaseSettings):
     openai_api_key: str | None = None
     openai_model: str | None = "gpt-4o-mini"
 
+    spacy_model: str = "en_core_web_lg"
+    spacy_fallback_model: str | None = "en_core_web_sm"
+    nlp_warm_on_startup: bool = True
+    nlp_batch_size: int = Field(
+        default=32,
+        description="Documents per nlp.pipe batch in ParsingService.parse_many.",
+    )
+    nlp_n_process: int = Field(
+        default=1,
+        description="spaCy worker processes for large parse_many batches (bulk imports).",
+    )
+    nlp_micro_batch_size: int = Field(
+        default=1,
+        description="Concurrent single-document parses coalesced into one nlp.pipe call (1 disables).",
+    )
+    nlp_micro_batch_wait_ms: float = Field(
+        default=25.0,
+        description="Longest a document waits for a micro-batch to fill before it is parsed alone.",
+    )
+
     google_service_account_json: str | None = None
     google_sheets_id: str | None = None
     google_drive_folder_id: str | None = None
 
     storage_mode: str = Field(
         default="google",
-        description="google|local. If local, write extracts to data/dev/ for demo without credentials.",
+        description=(
+            "google|local|sqlite. If local, write extracts to data/dev/ for demo without credentials; "
+            "sqlite keeps candidates in a local database and can mirror them to Sheets."
+        ),
+    )
+    sqlite_path: str = "data/dev/smarthire.db"
+    sqlite_mirror_to_sheets: bool = Field(
+        default=False,
+        description="In sqlite mode, replay candidate changes into Google Sheets in the background.",
+    )
+    sqlite_mirror_interval_seconds: float = 10.0
+    sqlite_mirror_batch_size: int = 200
+    local_candidate_log_path: str = Field(
+        default="data/dev/candidates.log.jsonl",
+        description="Append-only operation log used as the candidate store in local mode.",
+    )
+    local_log_compact_threshold: int = Field(
+        default=1000,
+        description="Number of superseded log lines that triggers a background compaction.",
+    )
+    change_journal_size: int = Field(
+        default=10000,
+        description="Recent candidate changes kept for /api/candidates/changes before clients must reload.",
+    )
+    event_stream_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Idle interval after which /api/candidates/stream sends an SSE comment to keep proxies open.",
+    )
+    event_stream_queue_size: int = Field(
+        default=100,
+        description="Events buffered per stream subscriber before it is disconnected as a slow consumer.",
+    )
+    job_queue_path: str = Field(
+        default="data/dev/jobs.db",
+        description="SQLite database holding queued ingestion jobs and dead letters.",
+    )
+    job_worker_embedded: bool = Field(
+        default=True,
+        description="Run job workers inside the API process; disable when running `python -m backend.app.workers.runner`.",
+    )
+    job_worker_concurrency: int = 2
+    job_max_attempts: int = 5
+    job_retry_base_seconds: float = Field(
+        default=5.0,
+        description="Delay before the first retry; doubled on every further attempt (capped at 10 minutes).",
+    )
+    job_lease_seconds: float = Field(
+        default=300.0,
+        description=(
+            "Job lease length. Running workers renew it every third of this period, so it bounds "
+            "how long a crashed or hung worker's job waits before redelivery."
+        ),
+    )
+    job_retention_seconds: float = 7 * 24 * 3600
+    message_dedup_path: str = Field(
+        default="data/dev/processed_messages.db",
+        description="SQLite store of ingested Twilio MessageSids used to drop webhook retries.",
+    )
+    message_dedup_ttl_seconds: float = 24 * 3600
+    message_dedup_cache_size: int = 10000
+    extraction_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse extracted attachment text for byte-identical files (keyed by SHA-256 and extractor version).",
+    )
+    extraction_cache_dir: str = "data/dev/extraction_cache"
+    extraction_cache_max_bytes: int = 256 * 1024 * 1024
+    extraction_cache_memory_entries: int = 256
+    extraction_cache_rescan_seconds: float = Field(
+        default=60.0,
+        description="How often the cache directory (shared by every process) is rescanned before eviction.",
+    )
+    ocr_pool_workers: int = Field(
+        default=2,
+        description="Processes rendering and recognizing scanned PDF pages in parallel (0 runs OCR inline).",
+    )
+    ocr_document_budget_seconds: float = Field(
+        default=120.0,
+        description="OCR time budget per document; remaining pages are skipped once it is spent.",
+    )
+    ocr_max_pages: int = Field(
+        default=20,
+        description="Pages of a scanned PDF that are OCRed; later pages are skipped.",
+    )
+    ocr_max_dpi: int = 300
+    ocr_min_dpi: int = 150
+    ocr_max_page_pixels: int = Field(
+        default=12_000_000,
+        description="Pixel cap per rendered page; DPI is lowered for large pages to stay under it.",
+    )
+    attachment_spool_threshold_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        description="Attachments larger than this are spooled to a temporary file instead of kept in memory.",
+    )
+    media_fetch_concurrency: int = Field(
+        default=4,
+        description="Twilio media downloads run in parallel across all messages.",
+    )
+    media_fetch_per_host_connections: int = Field(
+        default=4,
+        description="Pooled keep-alive connections per media host.",
+    )
+    media_fetch_timeout_seconds: float = 30.0
+    media_max_bytes: int = Field(
+        default=25 * 1024 * 1024,
+        description="Media larger than this is rejected while downloading.",
+    )
+    ingest_executor_concurrency: int = Field(
+        default=2,
+        description="Manual ingests (each fanning out OCR, NLP and storage to threads) running at once.",
+    )
+    ingest_executor_queue_size: int = Field(
+        default=8,
+        description="Manual ingests allowed to wait for a slot before requests get 429.",
+    )
+    executor_retry_after_seconds: int = 5
+    ingest_extract_concurrency: int = Field(
+        default=4,
+        description="Attachments fetched and extracted at once by the async ingest pipeline.",
+    )
+    ingest_parse_concurrency: int = 2
+    ingest_append_concurrency: int = 2
+    ingest_archive_concurrency: int = Field(
+        default=4,
+        description="Drive/local attachment uploads running alongside the candidate append.",
+    )
+    bulk_import_workers: int = Field(
+        default=4,
+        description="Threads extracting and archiving files of a bulk import in parallel.",
+    )
+    bulk_import_batch_size: int = Field(
+        default=32,
+        description="Files per bulk-import batch: one nlp.pipe call and one storage append per batch.",
+    )
+    bulk_import_max_files: int = 1000
+    bulk_import_max_upload_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Largest single upload (resume or ZIP archive) a bulk import accepts.",
+    )
+    bulk_import_max_total_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Largest combined size of all uploads in one bulk-import request.",
+    )
+    sheets_index_ttl_seconds: float = Field(
+        default=30.0,
+        description="Maximum age of the in-memory candidate index before the sheet is probed for changes.",
+    )
+    sheets_write_behind: bool = Field(
+        default=False,
+        description="Queue appends and write them to Google Sheets in batches (spilled to disk until flushed).",
     )
+    sheets_append_batch_size: int = 50
+    sheets_append_flush_seconds: float = 2.0
+    sheets_append_spill_path: str = "data/dev/sheets_append_spill.jsonl"
 
     allowed_origins: list[str] = Field(default_factory=list)
 
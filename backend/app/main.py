@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from .api.routers import include_all_routers
 from .core.config import Settings, get_settings
 from .core.logging_config import configure_logging
+from .services.blocking_executor import ExecutorSaturatedError
+from .services.container import ServiceContainer
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
@@ -38,6 +41,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     )
 
     app.logger = logging.getLogger("smarthire.app")  # type: ignore[attr-defined]
+    app.state.settings = current_settings
+    app.state.container = ServiceContainer(current_settings)
 
     if current_settings.allowed_origins:
         app.add_middleware(
@@ -46,14 +51,28 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["X-Total-Count", "ETag", "Retry-After"],
         )
 
     include_all_routers(app, current_settings)
 
+    @app.exception_handler(ExecutorSaturatedError)
+    async def on_executor_saturated(request: Request, exc: ExecutorSaturatedError) -> JSONResponse:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.on_event("startup")
     async def on_startup() -> None:
         if current_settings.debug:
             app.logger.info("SmartHire Gateway starting in debug mode.")
+        app.state.container.startup()
+
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        app.state.container.shutdown()
 
     @app.get("/", include_in_schema=False)
     async def root() -> dict[str, str]:
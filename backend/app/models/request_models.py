@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl
 
 from .response_models import CandidateStatus
 
@@ -35,3 +35,12 @@ class RecruiterCreateRequest(BaseModel):
 
 class CandidateStatusUpdateRequest(BaseModel):
     status: CandidateStatus
+
+
+class NLPReloadRequest(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
+    model_name: Optional[str] = Field(
+        default=None,
+        description="spaCy package or path to load; defaults to the currently configured model.",
+    )
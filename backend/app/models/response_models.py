@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserProfile(BaseModel):
@@ -50,6 +50,10 @@ class CandidateRecord(BaseModel):
 class CandidateListResponse(BaseModel):
     count: int
     items: List[CandidateRecord]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the following page; absent on the last page.",
+    )
 
 
 class CandidateBoardResponse(BaseModel):
@@ -58,6 +62,79 @@ class CandidateBoardResponse(BaseModel):
     interview: List[CandidateRecord] = Field(default_factory=list)
     selected: List[CandidateRecord] = Field(default_factory=list)
     rejected: List[CandidateRecord] = Field(default_factory=list)
+    archived: List[CandidateRecord] = Field(default_factory=list)
+    counts: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Total candidates per status, including those beyond the per-column limit.",
+    )
+
+
+class CandidateChange(BaseModel):
+    version: int
+    op: Literal["insert", "update", "delete"]
+    candidate_id: str
+    candidate: Optional[CandidateRecord] = None
+
+
+class CandidateChangesResponse(BaseModel):
+    version: int = Field(description="Pass as `since` on the next poll.")
+    epoch: str = Field(default="", description="Pass as `epoch` on the next poll.")
+    reset: bool = Field(
+        default=False,
+        description="The requested version is no longer covered; reload the full list and board.",
+    )
+    has_more: bool = False
+    changes: List[CandidateChange] = Field(default_factory=list)
+
+
+class JobStatusResponse(BaseModel):
+    id: str
+    kind: str
+    status: Literal["queued", "running", "succeeded", "dead"]
+    attempts: int
+    max_attempts: int
+    created_at: datetime
+    updated_at: datetime
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+
+class JobQueueStatsResponse(BaseModel):
+    depth: int = Field(description="Jobs queued or running.")
+    queued: int
+    running: int
+    succeeded: int
+    dead: int
+    oldest_ready_age_seconds: float
+    worker: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Embedded worker counters; null when workers run as a separate process.",
+    )
+
+
+class BulkImportItemResult(BaseModel):
+    filename: str
+    status: Literal["pending", "succeeded", "failed"]
+    candidate_id: Optional[str] = None
+    full_name: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkImportResponse(BaseModel):
+    id: str
+    status: Literal["queued", "running", "completed", "failed"]
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    items: Optional[List[BulkImportItemResult]] = Field(
+        default=None,
+        description="Per-file results; omitted when the request sets include_items=false.",
+    )
 
 
 class IngestResponse(BaseModel):
@@ -68,3 +145,14 @@ class IngestResponse(BaseModel):
 class RecruiterListResponse(BaseModel):
     count: int
     items: List[UserProfile]
+
+
+class NLPModelStatsResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
+    loaded: bool
+    model_name: str
+    pipeline: List[str] = Field(default_factory=list)
+    load_seconds: Optional[float] = None
+    rss_delta_bytes: Optional[int] = None
+    rss_after_bytes: Optional[int] = None
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Protocol, Tuple
+
+from ..models.response_models import CandidateRecord, CandidateStatus
+from .change_journal import ChangeEntry
+
+
+class CandidateRepository(Protocol):
+    """Storage surface shared by the Sheets/local and SQLite candidate backends."""
+
+    def append_candidate(self, record: CandidateRecord) -> None:
+        ...
+
+    def append_candidates(self, records: List[CandidateRecord]) -> None:
+        ...
+
+    def list_recent(self, limit: int = 20) -> List[CandidateRecord]:
+        ...
+
+    def list_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int | None = None,
+    ) -> List[CandidateRecord]:
+        ...
+
+    def page_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int = 20,
+        sort: str = "received_at",
+        descending: bool = True,
+        after: Optional[Tuple[object, str]] = None,
+    ) -> List[CandidateRecord]:
+        ...
+
+    def count_candidates(self, status: CandidateStatus | None = None) -> int:
+        ...
+
+    def status_counts(self) -> Dict[CandidateStatus, int]:
+        ...
+
+    def change_version(self) -> int:
+        ...
+
+    def change_epoch(self) -> str:
+        """Identifies the sequence ``change_version`` counts in; versions from other epochs are unrelated."""
+        ...
+
+    def changes_since(self, version: int, limit: int = 500) -> Optional[List[ChangeEntry]]:
+        ...
+
+    def get_candidate(self, candidate_id: str) -> Optional[CandidateRecord]:
+        ...
+
+    def update_status(self, candidate_id: str, status: CandidateStatus) -> CandidateRecord:
+        ...
+
+    def delete_candidate(self, candidate_id: str) -> CandidateRecord:
+        ...
+
+    def delete_by_status(self, status: CandidateStatus) -> int:
+        ...
+
+    def close(self) -> None:
+        ...
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..models.response_models import CandidateRecord, CandidateStatus
+
+# Newest first: ascending order over (-timestamp, candidate_id).
+OrderKey = Tuple[float, str]
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def received_at_timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def order_key(record: CandidateRecord) -> OrderKey:
+    return (-received_at_timestamp(record.received_at), record.candidate_id)
+
+
+class _Descending:
+    """Wraps a value so it sorts in reverse; lets string sort keys share the canonical order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and other.value == self.value
+
+
+# Sortable fields and the normalized value each one sorts on. The values match
+# the SQL expressions used by ``SQLiteCandidateRepository`` (SQLite's ``lower``
+# only folds ASCII), so cursors behave identically on every backend.
+SORT_FIELDS: Dict[str, Callable[[CandidateRecord], object]] = {
+    "received_at": lambda record: received_at_timestamp(record.received_at),
+    "full_name": lambda record: (record.full_name or "").translate(_ASCII_LOWER),
+    "confidence": lambda record: record.confidence if record.confidence is not None else -1.0,
+}
+
+
+def sort_value(record: CandidateRecord, field: str) -> object:
+    return SORT_FIELDS[field](record)
+
+
+def sort_key(field: str, value: object, candidate_id: str) -> tuple:
+    """
+    Canonical key for ``field``: ascending key order is ``value DESC, candidate_id ASC``.
+
+    Ascending pages walk the same order backwards (``value ASC, candidate_id DESC``).
+    """
+
+    if field == "full_name":
+        return (_Descending(value), candidate_id)
+    return (-value, candidate_id)
+
+
+class CandidateIndex:
+    """
+    Process-local materialized view of the candidate store.
+
+    Records are addressable by ``candidate_id`` and by status, remember the
+    sheet row they live on, and are kept sorted on every field in
+    ``SORT_FIELDS`` so listing and keyset pagination never re-sort the full
+    data set. Records are copied on the way in and out, so callers can modify
+    what they get back without corrupting the index.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, CandidateRecord] = {}
+        self._rows: Dict[str, int] = {}
+        # field -> status (None for all) -> canonical sorted keys
+        self._orders: Dict[str, Dict[Optional[CandidateStatus], List[tuple]]] = {
+            field: defaultdict(list) for field in SORT_FIELDS
+        }
+        self._lock = threading.RLock()
+
+    def replace(self, records: Iterable[CandidateRecord]) -> None:
+        with self._lock:
+            self._records.clear()
+            self._rows.clear()
+            for orders in self._orders.values():
+                orders.clear()
+            for record in records:
+                self._records[record.candidate_id] = _copy(record)  # later duplicates win
+            for record in self._records.values():
+                if record.sheet_row:
+                    self._rows[record.candidate_id] = record.sheet_row
+            # Build every order with one sort instead of an insort per record.
+            for field, orders in self._orders.items():
+                for record in self._records.values():
+                    key = sort_key(field, sort_value(record, field), record.candidate_id)
+                    orders[None].append(key)
+                    orders[record.status].append(key)
+                for keys in orders.values():
+                    keys.sort()
+
+    def upsert(self, record: CandidateRecord) -> None:
+        with self._lock:
+            if record.candidate_id in self._records:
+                self._discard(record.candidate_id)
+            self._insert(_copy(record))
+
+    def remove(self, candidate_id: str) -> Optional[CandidateRecord]:
+        with self._lock:
+            if candidate_id not in self._records:
+                return None
+            return _copy(self._discard(candidate_id))
+
+    def set_status(self, candidate_id: str, status: CandidateStatus) -> CandidateRecord:
+        with self._lock:
+            current = self._records.get(candidate_id)
+            if current is None:
+                raise KeyError(candidate_id)
+            updated = current.model_copy(update={"status": status})
+            self._discard(candidate_id)
+            self._insert(updated)
+            return _copy(updated)
+
+    def get(self, candidate_id: str) -> Optional[CandidateRecord]:
+        with self._lock:
+            record = self._records.get(candidate_id)
+            return _copy(record) if record is not None else None
+
+    def row_of(self, candidate_id: str) -> Optional[int]:
+        return self._rows.get(candidate_id)
+
+    def set_row(self, candidate_id: str, row: int) -> None:
+        with self._lock:
+            record = self._records.get(candidate_id)
+            if record is None:
+                return
+            self._rows[candidate_id] = row
+            record.sheet_row = row
+
+    def shift_rows_after_delete(self, deleted_rows: Iterable[int]) -> None:
+        """Renumber rows after the given sheet rows were removed."""
+
+        removed = sorted(set(deleted_rows))
+        if not removed:
+            return
+        with self._lock:
+            for candidate_id, row in list(self._rows.items()):
+                offset = bisect_left(removed, row)
+                if offset:
+                    self._rows[candidate_id] = row - offset
+                    self._records[candidate_id].sheet_row = row - offset
+
+    def ids_with_status(self, status: CandidateStatus) -> List[str]:
+        with self._lock:
+            return [candidate_id for _, candidate_id in self._orders["received_at"].get(status, [])]
+
+    def list(
+        self, status: CandidateStatus | None = None, limit: int | None = None
+    ) -> List[CandidateRecord]:
+        with self._lock:
+            keys = self._orders["received_at"].get(status, [])
+            if limit is not None:
+                keys = keys[:limit]
+            return [_copy(self._records[candidate_id]) for _, candidate_id in keys]
+
+    def page(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int = 20,
+        sort: str = "received_at",
+        descending: bool = True,
+        after: Optional[Tuple[object, str]] = None,
+    ) -> List[CandidateRecord]:
+        """Return up to ``limit`` records following the ``(sort value, candidate_id)`` cursor."""
+
+        with self._lock:
+            keys = self._orders[sort].get(status, [])
+            if descending:
+                start = bisect_right(keys, sort_key(sort, *after)) if after else 0
+                window = keys[start : start + limit]
+            else:
+                end = bisect_left(keys, sort_key(sort, *after)) if after else len(keys)
+                window = keys[max(end - limit, 0) : end][::-1]
+            return [_copy(self._records[candidate_id]) for _, candidate_id in window]
+
+    def count(self, status: CandidateStatus | None = None) -> int:
+        with self._lock:
+            return len(self._orders["received_at"].get(status, []))
+
+    def counts(self) -> Dict[CandidateStatus, int]:
+        with self._lock:
+            orders = self._orders["received_at"]
+            return {
+                status: len(keys) for status, keys in orders.items() if status is not None and keys
+            }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _insert(self, record: CandidateRecord) -> None:
+        self._records[record.candidate_id] = record
+        if record.sheet_row:
+            self._rows[record.candidate_id] = record.sheet_row
+        for field, orders in self._orders.items():
+            key = sort_key(field, sort_value(record, field), record.candidate_id)
+            insort(orders[None], key)
+            insort(orders[record.status], key)
+
+    def _discard(self, candidate_id: str) -> CandidateRecord:
+        record = self._records.pop(candidate_id)
+        self._rows.pop(candidate_id, None)
+        for field, orders in self._orders.items():
+            key = sort_key(field, sort_value(record, field), candidate_id)
+            self._remove_key(orders[None], key)
+            self._remove_key(orders[record.status], key)
+        return record
+
+    @staticmethod
+    def _remove_key(keys: List[tuple], key: tuple) -> None:
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+
+def _copy(record: CandidateRecord) -> CandidateRecord:
+    # ``skills`` is the only mutable field; everything else is replaced, not mutated.
+    return record.model_copy(update={"skills": list(record.skills)})
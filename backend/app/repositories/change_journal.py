@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+from uuid import uuid4
+
+
+@dataclass(frozen=True)
+class ChangeEntry:
+    version: int
+    candidate_id: str
+    op: str  # insert | update | delete
+
+
+class ChangeJournal:
+    """
+    Bounded, in-memory history of candidate changes keyed by a monotonic version.
+
+    ``since`` returns the entries newer than a version a client already holds,
+    or ``None`` when that version is no longer covered (too old, or issued
+    before this journal's baseline) and the client has to reload in full.
+    Versions are only meaningful within one journal, so each instance gets a
+    random ``epoch`` that callers publish alongside them.
+    """
+
+    def __init__(self, maxlen: int = 10000) -> None:
+        self._entries: Deque[ChangeEntry] = deque(maxlen=max(maxlen, 1))
+        self.epoch = uuid4().hex[:12]
+        self._version = 0
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def reset(self, version: int) -> None:
+        """Start a new baseline: history before ``version`` is unknown."""
+
+        with self._lock:
+            self._entries.clear()
+            self._version = max(self._version, version)
+            self._floor = self._version
+
+    def record(self, candidate_id: str, op: str, version: Optional[int] = None) -> int:
+        with self._lock:
+            version = self._version + 1 if version is None else max(version, self._version)
+            if len(self._entries) == self._entries.maxlen:
+                self._floor = self._entries[0].version
+            self._entries.append(ChangeEntry(version, candidate_id, op))
+            self._version = version
+            return version
+
+    def since(self, version: int, limit: int = 500) -> Optional[List[ChangeEntry]]:
+        with self._lock:
+            if version < self._floor or version > self._version:
+                return None
+            newer: List[ChangeEntry] = []
+            for entry in reversed(self._entries):
+                if entry.version <= version:
+                    break
+                newer.append(entry)
+        newer.reverse()
+        if len(newer) <= limit:
+            return newer
+        # Never split a version: a client resuming from it would skip the rest.
+        cut = limit
+        while cut > 0 and newer[cut - 1].version == newer[cut].version:
+            cut -= 1
+        if cut == 0:
+            cut = limit
+            while cut < len(newer) and newer[cut].version == newer[0].version:
+                cut += 1
+        return newer[:cut]
@@ -2,18 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import shutil
 from pathlib import Path
 
 try:
+    from google.oauth2.service_account import Credentials
     from googleapiclient.discovery import build
     from googleapiclient.http import MediaIoBaseUpload
-    from google.oauth2.service_account import Credentials
 except ImportError:  # pragma: no cover - optional dependency
     build = None  # type: ignore
     MediaIoBaseUpload = None  # type: ignore
     Credentials = None  # type: ignore
 
 from ..core.config import Settings, get_settings
+from ..utils.attachment_blob import AttachmentBlob
 
 logger = logging.getLogger("smarthire.drive")
 
@@ -36,12 +38,20 @@ class DriveRepository:
         try:
             info = self._load_service_account_info(self.settings.google_service_account_json)
         except (FileNotFoundError, ValueError) as exc:
-            logger.warning("Unable to load Google Drive credentials (%s); falling back to local archive.", exc)
+            logger.warning(
+                "Unable to load Google Drive credentials (%s); falling back to local archive.", exc
+            )
             return None
 
-        credentials = Credentials.from_service_account_info(info, scopes=["https://www.googleapis.com/auth/drive.file"])
+        credentials = Credentials.from_service_account_info(
+            info, scopes=["https://www.googleapis.com/auth/drive.file"]
+        )
         return build("drive", "v3", credentials=credentials)
 
+    def close(self) -> None:
+        if self._service is not None:
+            self._service.close()
+
     def _load_service_account_info(self, raw: str) -> dict:
         if not raw or not raw.strip():
             raise ValueError("Google service account configuration is empty")
@@ -52,7 +62,9 @@ class DriveRepository:
             try:
                 return json.loads(cleaned)
             except json.JSONDecodeError:
-                logger.debug("Provided Google credentials string is not valid JSON; trying as path.")
+                logger.debug(
+                    "Provided Google credentials string is not valid JSON; trying as path."
+                )
 
         candidates: list[Path] = []
         raw_path = Path(cleaned)
@@ -83,30 +95,47 @@ class DriveRepository:
         try:
             return json.loads(cleaned)
         except json.JSONDecodeError as exc:
-            raise ValueError("Provided Google service account value is not valid JSON or path") from exc
+            raise ValueError(
+                "Provided Google service account value is not valid JSON or path"
+            ) from exc
 
-    def archive_bytes(self, filename: str, data: bytes, mime_type: str = "application/octet-stream") -> str:
-        if self._service:
-            from io import BytesIO
+    def archive_bytes(
+        self, filename: str, data: bytes, mime_type: str = "application/octet-stream"
+    ) -> str:
+        return self.archive_blob(AttachmentBlob.from_bytes(data, filename, mime_type))
 
+    def archive_blob(self, blob: AttachmentBlob) -> str:
+        """Upload the blob's bytes as-is (streamed from its buffer or spool file)."""
+
+        mime_type = blob.content_type or "application/octet-stream"
+        if self._service:
             try:
-                media = MediaIoBaseUpload(BytesIO(data), mimetype=mime_type)
-                file_metadata = {"name": filename, "parents": [self.settings.google_drive_folder_id]}
-                file = (
-                    self._service.files()
-                    .create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields="id,webViewLink",
-                        supportsAllDrives=True,
+                with blob.open() as stream:
+                    media = MediaIoBaseUpload(
+                        stream, mimetype=mime_type, resumable=not blob.in_memory
+                    )
+                    file_metadata = {
+                        "name": blob.filename,
+                        "parents": [self.settings.google_drive_folder_id],
+                    }
+                    file = (
+                        self._service.files()
+                        .create(
+                            body=file_metadata,
+                            media_body=media,
+                            fields="id,webViewLink",
+                            supportsAllDrives=True,
+                        )
+                        .execute()
                     )
-                    .execute()
-                )
                 return file.get("webViewLink") or file.get("id")
             except Exception as exc:  # pragma: no cover - runtime protection
                 logger.warning("Google Drive upload failed (%s); storing locally instead.", exc)
 
         self._local_dir.mkdir(parents=True, exist_ok=True)
-        destination = self._local_dir / filename
-        destination.write_bytes(data)
+        destination = self._local_dir / blob.filename
+        if blob.in_memory:
+            destination.write_bytes(blob.read_bytes())
+        else:
+            shutil.copyfile(blob.path(), destination)
         return str(destination)
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from ..utils import file_lock
+
+logger = logging.getLogger("smarthire.local_log")
+
+
+class CandidateLogStore:
+    """
+    Append-only JSONL operation log backing local storage mode.
+
+    Each line is one operation (``insert``, ``status``, ``delete``) stamped with
+    a monotonically increasing ``seq``. The store keeps an in-memory
+    materialized view (``candidate_id -> entry``) and tails the log to pick up
+    operations written by other processes. Writers serialize on an exclusive
+    lock of ``<log>.lock`` (``flock``, or ``msvcrt.locking`` on Windows);
+    compaction rewrites the live view to a temp file and swaps it in with
+    ``os.replace`` so readers never see a partial log. A compacted log starts
+    with a ``compaction`` header carrying an increasing ``generation``; readers
+    compare it to the generation they loaded and rebuild when it changes,
+    since inode numbers and file sizes can repeat across swaps.
+
+    Operations applied to the view (local or foreign) are queued for the owner
+    and handed out by ``drain``; ``None`` means the view was rebuilt and the
+    owner should reload everything.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        legacy_path: Optional[Path] = None,
+        compact_threshold: int = 1000,
+    ) -> None:
+        self.log_path = log_path
+        self.lock_path = log_path.with_name(log_path.name + ".lock")
+        self.compact_threshold = compact_threshold
+        self._entries: Dict[str, dict] = {}
+        self._seq = 0
+        self._offset = 0
+        self._generation: Optional[int] = None
+        self._log_lines = 0
+        self._feed: List[dict] = []
+        self._reset = True
+        self._lock = threading.RLock()
+        self._compacting = threading.Lock()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        if not file_lock.SUPPORTED:  # pragma: no cover - exotic platforms
+            logger.warning(
+                "No file locking available; %s must not be shared between processes", log_path
+            )
+        with self._file_lock():
+            if not self.log_path.exists():
+                self._bootstrap(legacy_path)
+            self._catch_up()
+
+    # Public API ------------------------------------------------------------------
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def entries(self) -> List[dict]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def sync(self) -> None:
+        """Apply operations appended by other processes since the last call."""
+
+        with self._lock:
+            self._catch_up()
+
+    def drain(self) -> Optional[List[dict]]:
+        with self._lock:
+            if self._reset:
+                self._reset = False
+                self._feed.clear()
+                return None
+            ops, self._feed = self._feed, []
+            return ops
+
+    def insert(self, entry: dict) -> None:
+        self._write({"op": "insert", "entry": entry})
+
+    def insert_many(self, entries: List[dict]) -> None:
+        """Insert several entries under one lock and one append to the log file."""
+
+        if entries:
+            self._write(*({"op": "insert", "entry": entry} for entry in entries))
+
+    def update_status(self, candidate_id: str, status: str) -> None:
+        self._write({"op": "status", "id": candidate_id, "status": status})
+
+    def delete(self, candidate_ids: List[str]) -> None:
+        if candidate_ids:
+            self._write({"op": "delete", "ids": list(candidate_ids)})
+
+    def compact(self) -> None:
+        with self._lock, self._file_lock():
+            self._catch_up()
+            generation = (self._generation or 0) + 1
+            temp_path = self.log_path.with_name(self.log_path.name + ".compact")
+            with temp_path.open("w", encoding="utf-8") as handle:
+                header = {"seq": self._seq, "op": "compaction", "generation": generation}
+                handle.write(json.dumps(header) + "\n")
+                for entry in self._entries.values():
+                    handle.write(
+                        json.dumps({"seq": self._seq, "op": "insert", "entry": entry}) + "\n"
+                    )
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, self.log_path)
+            self._generation = generation
+            self._offset = self.log_path.stat().st_size
+            self._log_lines = len(self._entries)
+        logger.info("Compacted %s to %s live candidates", self.log_path.name, len(self._entries))
+
+    # Internals -------------------------------------------------------------------
+
+    def _write(self, *ops: dict) -> None:
+        with self._lock, self._file_lock():
+            self._catch_up()
+            numbered = [{"seq": self._seq + offset, **op} for offset, op in enumerate(ops, start=1)]
+            chunk = "".join(json.dumps(op) + "\n" for op in numbered)
+            with self.log_path.open("a", encoding="utf-8") as handle:
+                handle.write(chunk)
+                handle.flush()
+            self._offset += len(chunk.encode("utf-8"))
+            for op in numbered:
+                self._apply(op)
+                self._feed.append(op)
+            garbage = self._log_lines - len(self._entries)
+        if garbage >= self.compact_threshold:
+            self._compact_in_background()
+
+    def _catch_up(self) -> None:
+        try:
+            handle = self.log_path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            # fstat the open handle so a concurrent compaction cannot swap files under us.
+            stat = os.fstat(handle.fileno())
+            generation = self._read_generation(handle)
+            if generation != self._generation or stat.st_size < self._offset:
+                # First load, or another process compacted the log: rebuild the view.
+                self._entries.clear()
+                self._offset = 0
+                self._log_lines = 0
+                self._generation = generation
+                self._reset = True
+            if stat.st_size == self._offset:
+                return
+            handle.seek(self._offset)
+            chunk = handle.read(stat.st_size - self._offset)
+        complete = chunk[: chunk.rfind(b"\n") + 1]  # ignore a line still being written
+        self._offset += len(complete)
+        for raw in complete.splitlines():
+            if not raw.strip():
+                continue
+            try:
+                op = json.loads(raw)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt line in %s", self.log_path)
+                continue
+            self._apply(op)
+            if not self._reset:
+                self._feed.append(op)
+
+    @staticmethod
+    def _read_generation(handle) -> int:
+        """Generation in the header of the open log; logs never compacted have none (0)."""
+
+        handle.seek(0)
+        first = handle.readline()
+        if not first.endswith(b"\n"):
+            return 0
+        try:
+            header = json.loads(first)
+        except json.JSONDecodeError:
+            return 0
+        if header.get("op") != "compaction":
+            return 0
+        return int(header.get("generation", 0))
+
+    def _apply(self, op: dict) -> None:
+        self._seq = max(self._seq, int(op.get("seq", 0)))
+        kind = op.get("op")
+        if kind == "compaction":
+            return
+        self._log_lines += 1
+        if kind == "insert":
+            entry = op["entry"]
+            self._entries[entry["candidate_id"]] = entry
+        elif kind == "status":
+            entry = self._entries.get(op["id"])
+            if entry is not None:
+                entry["status"] = op["status"]
+        elif kind == "delete":
+            for candidate_id in op["ids"]:
+                self._entries.pop(candidate_id, None)
+
+    def _bootstrap(self, legacy_path: Optional[Path]) -> None:
+        """Create the log, importing a legacy ``candidates.json`` array if present."""
+
+        entries: List[dict] = []
+        if legacy_path is not None and legacy_path.exists():
+            try:
+                entries = json.loads(legacy_path.read_text() or "[]")
+            except json.JSONDecodeError:
+                logger.warning("Legacy store %s is not valid JSON; starting empty.", legacy_path)
+        temp_path = self.log_path.with_name(self.log_path.name + ".compact")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            for seq, entry in enumerate(entries, start=1):
+                if not entry.get("candidate_id"):
+                    entry["candidate_id"] = uuid4().hex
+                handle.write(json.dumps({"seq": seq, "op": "insert", "entry": entry}) + "\n")
+        os.replace(temp_path, self.log_path)
+        if entries:
+            logger.info("Imported %s candidates from %s", len(entries), legacy_path)
+
+    def _compact_in_background(self) -> None:
+        if not self._compacting.acquire(blocking=False):
+            return
+
+        def _run() -> None:
+            try:
+                self.compact()
+            except Exception as exc:  # pragma: no cover - best effort
+                logger.warning("Candidate log compaction failed: %s", exc)
+            finally:
+                self._compacting.release()
+
+        threading.Thread(target=_run, name="candidate-log-compaction", daemon=True).start()
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        with self.lock_path.open("a") as handle:
+            file_lock.lock(handle)
+            try:
+                yield
+            finally:
+                file_lock.unlock(handle)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from ..utils.cache import LRUCache
+
+logger = logging.getLogger("smarthire.dedup")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_messages (
+    message_sid TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    candidate_id TEXT,
+    expires_at REAL NOT NULL,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_processed_messages_expiry ON processed_messages (expires_at);
+"""
+
+CLAIMED = "claimed"
+DUPLICATE = "duplicate"
+IN_PROGRESS = "in_progress"
+
+PRUNE_EVERY = 500
+
+
+class MessageInProgressError(RuntimeError):
+    """Another worker holds the claim for this message; retry once it finishes or expires."""
+
+    def __init__(self, message_sid: str) -> None:
+        super().__init__(f"Message {message_sid} is already being processed")
+        self.message_sid = message_sid
+
+
+class MessageDedupStore:
+    """
+    TTL store of inbound message ids (Twilio ``MessageSid``) that were already ingested.
+
+    ``claim`` marks a message as being processed and reports whether it is new,
+    a duplicate of a completed message, or currently in flight elsewhere. Completed
+    ids are cached in memory so webhook replays short-circuit without touching disk;
+    the SQLite table keeps them across restarts and between worker processes.
+    Processing claims expire after ``processing_timeout`` so a crashed worker does
+    not block the message forever. Each claim is tagged with the caller's
+    ``owner`` token; ``complete`` and ``release`` are ignored once the claim has
+    lapsed and another worker has taken the message over.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = 24 * 3600,
+        processing_timeout: float = 300.0,
+        cache_size: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.processing_timeout = processing_timeout
+        self._clock = clock
+        self._completed: LRUCache[str, str] = LRUCache(maxsize=max(cache_size, 1), clock=clock)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.claimed = 0
+        self.duplicates = 0
+        self.in_progress = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(processed_messages)")}
+        if "owner" not in columns:  # databases created before claims had owners
+            connection.execute("ALTER TABLE processed_messages ADD COLUMN owner TEXT")
+
+    def claim(self, message_sid: str, owner: str) -> str:
+        if self._completed.get(message_sid) is not None:
+            self._count("duplicates")
+            return DUPLICATE
+        now = self._clock()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT state, candidate_id, expires_at FROM processed_messages WHERE message_sid = ?",
+                (message_sid,),
+            ).fetchone()
+            if row is not None and row[2] > now:
+                if row[0] == "done":
+                    self._completed.set(message_sid, row[1] or "", expires_at=row[2])
+                    self._count("duplicates")
+                    return DUPLICATE
+                self._count("in_progress")
+                return IN_PROGRESS
+            connection.execute(
+                "INSERT OR REPLACE INTO processed_messages "
+                "(message_sid, state, candidate_id, expires_at, owner) VALUES (?, 'processing', NULL, ?, ?)",
+                (message_sid, now + self.processing_timeout, owner),
+            )
+            self._prune_if_due(connection, now)
+        self._count("claimed")
+        return CLAIMED
+
+    def complete(self, message_sid: str, owner: str, candidate_id: Optional[str] = None) -> bool:
+        """Mark the message done; ``False`` if another worker has since taken over the claim."""
+
+        expires_at = self._clock() + self.ttl_seconds
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT owner FROM processed_messages WHERE message_sid = ?", (message_sid,)
+            ).fetchone()
+            if row is not None and row[0] != owner:
+                logger.warning(
+                    "Not completing message %s: its claim passed to another worker", message_sid
+                )
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO processed_messages "
+                "(message_sid, state, candidate_id, expires_at, owner) VALUES (?, 'done', ?, ?, ?)",
+                (message_sid, candidate_id, expires_at, owner),
+            )
+        self._completed.set(message_sid, candidate_id or "", expires_at=expires_at)
+        return True
+
+    def release(self, message_sid: str, owner: str) -> bool:
+        """Drop ``owner``'s processing claim after a failure so a retry can process the message."""
+
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM processed_messages WHERE message_sid = ? AND state = 'processing' AND owner = ?",
+                (message_sid, owner),
+            )
+        return cursor.rowcount == 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            counters = {
+                "claimed": self.claimed,
+                "duplicates": self.duplicates,
+                "in_progress": self.in_progress,
+            }
+        return {**counters, "cache": self._completed.stats()}
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _prune_if_due(self, connection: sqlite3.Connection, now: float) -> None:
+        self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            connection.execute("DELETE FROM processed_messages WHERE expires_at <= ?", (now,))
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+from ..models.response_models import CandidateStatus
+from .sheets_repository import SheetsRepository
+from .sqlite_repository import SQLiteCandidateRepository
+
+logger = logging.getLogger("smarthire.sheets.mirror")
+
+
+class SheetsMirrorExporter:
+    """
+    Replays the SQLite change journal into Google Sheets in the background.
+
+    Sheets becomes a reporting sink: requests only touch SQLite, and this
+    exporter applies inserts, status changes and deletes to the sheet every
+    ``interval`` seconds. Progress is stored as an export cursor in the
+    database, so a restart resumes where the previous process stopped and a
+    failed batch is retried on the next pass.
+    """
+
+    cursor_name = "sheets_mirror"
+
+    def __init__(
+        self,
+        source: SQLiteCandidateRepository,
+        target: SheetsRepository,
+        interval: float = 10.0,
+        batch_size: int = 200,
+    ) -> None:
+        self.source = source
+        self.target = target
+        self.interval = interval
+        self.batch_size = max(batch_size, 1)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Register the cursor so journal pruning keeps changes not yet exported.
+        self.source.set_export_cursor(self.cursor_name, self.source.export_cursor(self.cursor_name))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sheets-mirror", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+        self._export_safely()
+
+    def export_pending(self) -> int:
+        """Apply every journal entry past the cursor; returns the number applied."""
+
+        exported = 0
+        cursor = self.source.export_cursor(self.cursor_name)
+        while True:
+            changes = self.source.changes_after(cursor, limit=self.batch_size)
+            if not changes:
+                return exported
+            for seq, candidate_id, op, status in changes:
+                self._apply(candidate_id, op, status)
+                cursor = seq
+            self.source.set_export_cursor(self.cursor_name, cursor)
+            exported += len(changes)
+
+    def _apply(self, candidate_id: str, op: str, status: Optional[str]) -> None:
+        if op == "insert":
+            record = self.source.get_candidate(candidate_id)
+            if record is not None and self.target.get_candidate(candidate_id) is None:
+                self.target.append_candidate(record)
+        elif op == "status":
+            try:
+                self.target.update_status(candidate_id, CandidateStatus(status))
+            except KeyError:
+                logger.debug("Mirror skipped status change for %s (not in sheet).", candidate_id)
+        elif op == "delete":
+            try:
+                self.target.delete_candidate(candidate_id)
+            except KeyError:
+                pass
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self._export_safely()
+
+    def _export_safely(self) -> None:
+        try:
+            exported = self.export_pending()
+        except Exception as exc:  # pragma: no cover - network dependent
+            logger.warning("Sheets mirror export failed (%s); will retry.", exc)
+            return
+        if exported:
+            logger.info("Mirrored %s candidate changes to Google Sheets", exported)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -10,12 +13,18 @@ from uuid import uuid4
 try:
     import gspread
     from google.oauth2.service_account import Credentials
+    from gspread.utils import rowcol_to_a1
 except ImportError:  # pragma: no cover - optional dependency for dev mode
     gspread = None  # type: ignore
+    rowcol_to_a1 = None  # type: ignore
     Credentials = None  # type: ignore
 
 from ..core.config import Settings, get_settings
 from ..models.response_models import CandidateRecord, CandidateStatus
+from .candidate_index import CandidateIndex
+from .change_journal import ChangeEntry, ChangeJournal
+from .local_candidate_log import CandidateLogStore
+from .sheets_write_buffer import AppendBuffer, SpillFileInUseError
 
 logger = logging.getLogger("smarthire.sheets")
 
@@ -40,14 +49,68 @@ SHEET_HEADER = [
     "Status",
 ]
 
+UPDATED_RANGE_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+def contiguous_runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Collapse row numbers into inclusive ``(first, last)`` runs, ascending."""
+
+    runs: List[Tuple[int, int]] = []
+    for row in sorted(set(rows)):
+        if runs and row == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+
 class SheetsRepository:
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
         base_dir = Path(__file__).resolve().parents[3]
+        self._client = None
+        self._spreadsheet = None
+        self._header: List[str] = list(SHEET_HEADER)
         self._worksheet = self._bootstrap_google_sheet()
-        self._local_path = base_dir / "data" / "dev" / "candidates.json"
+        self._log_store: Optional[CandidateLogStore] = None
         if not self._worksheet:
-            self._ensure_local_store()
+            log_path = base_dir / self.settings.local_candidate_log_path
+            # A candidates.json next to the log (the previous format) is imported on first start.
+            self._log_store = CandidateLogStore(
+                log_path,
+                legacy_path=log_path.with_name("candidates.json"),
+                compact_threshold=self.settings.local_log_compact_threshold,
+            )
+        # Process-local view of the sheet; refreshed lazily (see ``_current_index``).
+        self._index = CandidateIndex()
+        self._index_lock = threading.RLock()
+        self._index_refreshed_at: Optional[float] = None
+        self._source_version: Optional[object] = None
+        # Change versions: the log seq in local mode (shared by every worker), a
+        # process-local counter in Google mode.
+        self._changes = ChangeJournal(maxlen=self.settings.change_journal_size)
+        self._append_buffer: Optional[AppendBuffer] = None
+        # Latest wanted state of rows whose append_rows call is in flight (None: deleted meanwhile).
+        self._in_flight: Dict[str, Optional[CandidateRecord]] = {}
+        if self._worksheet and self.settings.sheets_write_behind:
+            try:
+                self._append_buffer = AppendBuffer(
+                    spill_path=base_dir / self.settings.sheets_append_spill_path,
+                    flush_callback=self._flush_pending_appends,
+                    batch_size=self.settings.sheets_append_batch_size,
+                    flush_interval=self.settings.sheets_append_flush_seconds,
+                )
+            except SpillFileInUseError as exc:
+                logger.warning(
+                    "%s; appending directly to the sheet. Give each process its own "
+                    "SHEETS_APPEND_SPILL_PATH.",
+                    exc,
+                )
+            if self._append_buffer is not None and len(self._append_buffer):
+                # Drop spilled rows that reached the sheet before a crash, then resume flushing.
+                with self._index_lock:
+                    self._refresh_index()
+                self._append_buffer.start()
 
     def _bootstrap_google_sheet(self):
         if not (self.settings.google_service_account_json and self.settings.google_sheets_id):
@@ -57,15 +120,21 @@ class SheetsRepository:
             logger.warning("gspread not installed; falling back to local storage.")
             return None
         try:
-            service_info = self._load_service_account_info(self.settings.google_service_account_json)
+            service_info = self._load_service_account_info(
+                self.settings.google_service_account_json
+            )
         except (ValueError, FileNotFoundError) as exc:
-            logger.warning("Failed to load Google credentials (%s); falling back to local storage.", exc)
+            logger.warning(
+                "Failed to load Google credentials (%s); falling back to local storage.", exc
+            )
             return None
 
         try:
             credentials = Credentials.from_service_account_info(service_info, scopes=SCOPES)
             client = gspread.authorize(credentials)
+            self._client = client
             spreadsheet = client.open_by_key(self.settings.google_sheets_id)
+            self._spreadsheet = spreadsheet
             worksheet = spreadsheet.sheet1
             self._ensure_header_row(worksheet)
             return worksheet
@@ -73,6 +142,17 @@ class SheetsRepository:
             logger.warning("Unable to connect to Google Sheet (%s); using local storage.", exc)
             return None
 
+    @property
+    def uses_google_sheets(self) -> bool:
+        return self._worksheet is not None
+
+    def close(self) -> None:
+        if self._append_buffer is not None:
+            self._append_buffer.close()
+        session = getattr(self._client, "session", None)
+        if session is not None:
+            session.close()
+
     def _load_service_account_info(self, raw: str) -> dict:
         if not raw or not raw.strip():
             raise ValueError("Empty Google service account configuration")
@@ -83,7 +163,9 @@ class SheetsRepository:
             try:
                 return json.loads(cleaned)
             except json.JSONDecodeError:
-                logger.debug("Service account string is not valid JSON; attempting to resolve as a path.")
+                logger.debug(
+                    "Service account string is not valid JSON; attempting to resolve as a path."
+                )
 
         candidates: list[Path] = []
         raw_path = Path(cleaned)
@@ -120,11 +202,8 @@ class SheetsRepository:
         header = worksheet.row_values(1)
         if header != SHEET_HEADER:
             worksheet.update("A1:M1", [SHEET_HEADER])
-
-    def _ensure_local_store(self) -> None:
-        self._local_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self._local_path.exists():
-            self._local_path.write_text(json.dumps([], indent=2))
+            header = list(SHEET_HEADER)
+        self._header = header
 
     @staticmethod
     def _sheet_safe(value: str | None, protect_prefix: bool = False) -> str:
@@ -137,8 +216,8 @@ class SheetsRepository:
             return f"'{text}"
         return text
 
-    def append_candidate(self, record: CandidateRecord) -> None:
-        row = [
+    def _row_values(self, record: CandidateRecord) -> list:
+        return [
             record.received_at.isoformat(),
             self._sheet_safe(record.full_name),
             self._sheet_safe(record.email),
@@ -153,28 +232,77 @@ class SheetsRepository:
             self._sheet_safe(record.candidate_id),
             record.status.value,
         ]
-        if self._worksheet:
-            self._worksheet.append_row(row, value_input_option="USER_ENTERED")
+
+    def append_candidate(self, record: CandidateRecord) -> None:
+        with self._index_lock:
+            index = self._current_index()
+            stored = record.model_copy()
+            if self._append_buffer is not None:
+                # Readers see the row immediately; its sheet row is assigned on flush.
+                stored.sheet_row = None
+                self._append_buffer.add(stored)
+                index.upsert(stored)
+                self._changes.record(stored.candidate_id, "insert")
+                return
+            if self._worksheet:
+                row = self._row_values(record)
+                response = self._worksheet.append_row(row, value_input_option="USER_ENTERED")
+                stored.sheet_row = self._appended_row(response)
+                if stored.sheet_row is None:
+                    # Unknown placement (e.g. concurrent writers); resync on next read.
+                    self._index_refreshed_at = None
+                index.upsert(stored)
+                self._changes.record(stored.candidate_id, "insert")
+                return
+            self._log_store.insert(self._local_entry(record))
+            self._apply_log_ops()
+
+    def append_candidates(self, records: List[CandidateRecord]) -> None:
+        """Append several candidates with one sheet ``append_rows`` call or one log write."""
+
+        if not records:
             return
-        data = json.loads(self._local_path.read_text())
-        data.append(
-            {
-                "timestamp": record.received_at.isoformat(),
-                "full_name": record.full_name,
-                "email": record.email,
-                "phone": record.phone,
-                "location": record.location,
-                "skills": record.skills,
-                "education": record.education,
-                "experience": record.experience,
-                "last_job_title": record.last_job_title,
-                "source": record.source,
-                "confidence": record.confidence,
-                "candidate_id": record.candidate_id,
-                "status": record.status.value,
-            }
-        )
-        self._local_path.write_text(json.dumps(data, indent=2))
+        with self._index_lock:
+            index = self._current_index()
+            if self._worksheet and self._append_buffer is None:
+                response = self._worksheet.append_rows(
+                    [self._row_values(record) for record in records],
+                    value_input_option="USER_ENTERED",
+                )
+                first_row = self._appended_row(response)
+                if first_row is None:
+                    self._index_refreshed_at = None
+                for offset, record in enumerate(records):
+                    stored = record.model_copy()
+                    stored.sheet_row = first_row + offset if first_row is not None else None
+                    index.upsert(stored)
+                    self._changes.record(stored.candidate_id, "insert")
+                return
+            if self._worksheet:
+                # The write-behind buffer already batches sheet appends.
+                for record in records:
+                    self.append_candidate(record)
+                return
+            self._log_store.insert_many([self._local_entry(record) for record in records])
+            self._apply_log_ops()
+
+    @staticmethod
+    def _local_entry(record: CandidateRecord) -> dict:
+        return {
+            "timestamp": record.received_at.isoformat(),
+            "full_name": record.full_name,
+            "email": record.email,
+            "phone": record.phone,
+            "location": record.location,
+            "skills": record.skills,
+            "education": record.education,
+            "experience": record.experience,
+            "last_job_title": record.last_job_title,
+            "source": record.source,
+            "confidence": record.confidence,
+            "candidate_id": record.candidate_id,
+            "status": record.status.value,
+        }
 
     def list_recent(self, limit: int = 20) -> List[CandidateRecord]:
         return self.list_candidates(limit=limit)
@@ -184,69 +312,360 @@ class SheetsRepository:
         status: CandidateStatus | None = None,
         limit: int | None = None,
     ) -> List[CandidateRecord]:
-        records = self._list_from_sheet() if self._worksheet else self._list_from_local()
-        if status:
-            records = [record for record in records if record.status == status]
-        if limit is not None:
-            records = records[:limit]
-        return records
+        with self._index_lock:
+            return self._current_index().list(status=status, limit=limit)
+
+    def page_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int = 20,
+        sort: str = "received_at",
+        descending: bool = True,
+        after: Optional[Tuple[object, str]] = None,
+    ) -> List[CandidateRecord]:
+        with self._index_lock:
+            return self._current_index().page(
+                status=status, limit=limit, sort=sort, descending=descending, after=after
+            )
+
+    def count_candidates(self, status: CandidateStatus | None = None) -> int:
+        with self._index_lock:
+            return self._current_index().count(status)
+
+    def status_counts(self) -> Dict[CandidateStatus, int]:
+        with self._index_lock:
+            return self._current_index().counts()
+
+    def change_version(self) -> int:
+        with self._index_lock:
+            self._current_index()
+            return self._changes.version
+
+    def change_epoch(self) -> str:
+        # Google mode counts changes per process, so versions restart with the process.
+        return self._changes.epoch
+
+    def changes_since(self, version: int, limit: int = 500) -> Optional[List[ChangeEntry]]:
+        with self._index_lock:
+            self._current_index()
+            return self._changes.since(version, limit)
 
     def get_candidate(self, candidate_id: str) -> Optional[CandidateRecord]:
-        for record in self.list_candidates():
-            if record.candidate_id == candidate_id:
-                return record
-        return None
+        with self._index_lock:
+            return self._current_index().get(candidate_id)
 
     def update_status(self, candidate_id: str, status: CandidateStatus) -> CandidateRecord:
-        record = self.get_candidate(candidate_id)
-        if record is None:
-            raise KeyError(candidate_id)
-        if self._worksheet and record.sheet_row:
-            header_index = self._header_index()
-            status_col = header_index.get("Status")
-            if status_col is not None:
-                self._worksheet.update_cell(record.sheet_row, status_col + 1, status.value)
-        else:
-            data = json.loads(self._local_path.read_text())
-            for item in data:
-                if item.get("candidate_id") == candidate_id:
-                    item["status"] = status.value
-                    break
-            self._local_path.write_text(json.dumps(data, indent=2))
-        record.status = status
-        return record
+        with self._index_lock:
+            index = self._current_index()
+            record = index.get(candidate_id)
+            if record is None:
+                raise KeyError(candidate_id)
+            if self._append_buffer is not None and self._append_buffer.get(candidate_id):
+                updated = index.set_status(candidate_id, status)
+                self._append_buffer.replace(updated)
+                if candidate_id in self._in_flight:
+                    self._in_flight[candidate_id] = updated
+                self._changes.record(candidate_id, "update")
+                return updated
+            if self._worksheet:
+                row = self._verified_rows([candidate_id]).get(candidate_id)
+                if row is None:  # deleted by another process
+                    raise KeyError(candidate_id)
+                status_col = self._header_index().get("Status")
+                if status_col is not None:
+                    self._worksheet.update_cell(row, status_col + 1, status.value)
+            else:
+                self._log_store.update_status(candidate_id, status.value)
+                self._apply_log_ops()
+                return index.get(candidate_id)
+            updated = index.set_status(candidate_id, status)
+            self._changes.record(candidate_id, "update")
+            return updated
 
     def delete_candidate(self, candidate_id: str) -> CandidateRecord:
-        record = self.get_candidate(candidate_id)
-        if record is None:
-            raise KeyError(candidate_id)
-        if self._worksheet and record.sheet_row:
-            self._worksheet.delete_rows(record.sheet_row)
-        else:
-            data = json.loads(self._local_path.read_text())
-            data = [item for item in data if item.get("candidate_id") != candidate_id]
-            self._local_path.write_text(json.dumps(data, indent=2))
-        return record
+        with self._index_lock:
+            index = self._current_index()
+            record = index.get(candidate_id)
+            if record is None:
+                raise KeyError(candidate_id)
+            if self._append_buffer is not None and self._append_buffer.remove(candidate_id):
+                if candidate_id in self._in_flight:
+                    self._in_flight[candidate_id] = None
+                index.remove(candidate_id)
+                self._changes.record(candidate_id, "delete")
+                return record
+            if self._worksheet:
+                row = self._verified_rows([candidate_id]).get(candidate_id)
+                if row is None:  # deleted by another process
+                    raise KeyError(candidate_id)
+                self._worksheet.delete_rows(row)
+                index.remove(candidate_id)
+                index.shift_rows_after_delete([row])
+                self._changes.record(candidate_id, "delete")
+            else:
+                self._log_store.delete([candidate_id])
+                self._apply_log_ops()
+            return record
 
     def delete_by_status(self, status: CandidateStatus) -> int:
-        records = self.list_candidates()
-        targets = [record for record in records if record.status == status]
-        if not targets:
-            return 0
-        if self._worksheet:
-            for record in sorted((rec for rec in targets if rec.sheet_row), key=lambda r: r.sheet_row or 0, reverse=True):
-                self._worksheet.delete_rows(record.sheet_row)
+        with self._index_lock:
+            index = self._current_index()
+            targets = [index.get(candidate_id) for candidate_id in index.ids_with_status(status)]
+            if not targets:
+                return 0
+            if self._worksheet:
+                if self._append_buffer is not None:
+                    for record in targets:
+                        self._append_buffer.remove(record.candidate_id)
+                        if record.candidate_id in self._in_flight:
+                            self._in_flight[record.candidate_id] = None
+                sheet_rows = self._verified_rows(
+                    [rec.candidate_id for rec in targets if rec.sheet_row]
+                )
+                # Re-resolve against the (possibly reloaded) index: statuses may have changed too.
+                targets = [
+                    index.get(candidate_id) for candidate_id in index.ids_with_status(status)
+                ]
+                rows = [
+                    sheet_rows[rec.candidate_id]
+                    for rec in targets
+                    if rec.candidate_id in sheet_rows
+                ]
+                self._delete_sheet_rows(rows)
+                version = self._changes.version + 1
+                for record in targets:
+                    index.remove(record.candidate_id)
+                    self._changes.record(record.candidate_id, "delete", version=version)
+                index.shift_rows_after_delete(rows)
+            else:
+                self._log_store.delete([record.candidate_id for record in targets])
+                self._apply_log_ops()
+            return len(targets)
+
+    def _verified_rows(self, candidate_ids: List[str]) -> Dict[str, int]:
+        """
+        Map candidate ids to their current sheet rows, read back right before a row write.
+
+        The index can be up to ``sheets_index_ttl_seconds`` old while other
+        processes insert and delete rows, so the ``Candidate ID`` column is read
+        (one small request) and compared with the index; on a mismatch the index
+        is reloaded. Ids missing from the sheet are absent from the result.
+        """
+
+        id_col = self._header_index().get("Candidate ID")
+        if id_col is None:
+            return {cid: row for cid in candidate_ids if (row := self._index.row_of(cid))}
+        column = self._worksheet.col_values(id_col + 1)
+        rows = {
+            value: number for number, value in enumerate(column, start=1) if number > 1 and value
+        }
+        if any(rows.get(cid) != self._index.row_of(cid) for cid in candidate_ids):
+            logger.info("Sheet rows moved since the last index load; reloading before the write.")
+            self._refresh_index()
+        return rows
+
+    def _delete_sheet_rows(self, rows: List[int]) -> None:
+        """Delete many rows in a single ``spreadsheets.batchUpdate`` call."""
+
+        if not rows:
+            return
+        # Requests run sequentially, so delete bottom-up to keep indices valid.
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": self._worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": first - 1,
+                        "endIndex": last,
+                    }
+                }
+            }
+            for first, last in reversed(contiguous_runs(rows))
+        ]
+        self._worksheet.spreadsheet.batch_update({"requests": requests})
+
+    # Index maintenance -------------------------------------------------------
+
+    def _current_index(self) -> CandidateIndex:
+        """
+        Return the candidate index, reloading it only when the source changed.
+
+        Google mode re-reads the sheet at most once per ``sheets_index_ttl_seconds``
+        and skips even that when the spreadsheet's modifiedTime is unchanged.
+        Local mode tails the operation log on every call and applies only the
+        new operations.
+        """
+
+        if self._log_store is not None:
+            self._log_store.sync()
+            self._apply_log_ops()
+        elif self._index_refreshed_at is None:
+            self._refresh_index()
+        elif self._worksheet:
+            ttl = self.settings.sheets_index_ttl_seconds
+            if time.monotonic() - self._index_refreshed_at >= ttl:
+                version = self._probe_source_version()
+                if version is not None and version == self._source_version:
+                    self._index_refreshed_at = time.monotonic()
+                else:
+                    self._refresh_index()
+        return self._index
+
+    def _apply_log_ops(self) -> None:
+        """Fold operations drained from the local log into the index."""
+
+        ops = self._log_store.drain()
+        if ops is None:
+            self._refresh_index()
+            return
+        for op in ops:
+            kind, seq = op.get("op"), int(op.get("seq", 0))
+            if kind == "insert":
+                record = self._from_local_row(op["entry"])[0]
+                self._index.upsert(record)
+                self._changes.record(record.candidate_id, "insert", version=seq)
+            elif kind == "status" and self._index.get(op["id"]) is not None:
+                try:
+                    status = CandidateStatus(op["status"])
+                except ValueError:
+                    status = CandidateStatus.NEW
+                self._index.set_status(op["id"], status)
+                self._changes.record(op["id"], "update", version=seq)
+            elif kind == "delete":
+                for candidate_id in op["ids"]:
+                    if self._index.remove(candidate_id) is not None:
+                        self._changes.record(candidate_id, "delete", version=seq)
+        self._source_version = self._log_store.seq
+
+    def _refresh_index(self) -> None:
+        records = self._list_from_sheet() if self._worksheet else self._list_from_local()
+        if self._append_buffer is not None:
+            stored_ids = {record.candidate_id for record in records}
+            flushed = [
+                item.candidate_id
+                for item in self._append_buffer.peek()
+                if item.candidate_id in stored_ids
+            ]
+            if flushed:
+                self._append_buffer.drop(flushed)
+            records.extend(self._append_buffer.peek())
+        first_load = self._index_refreshed_at is None and not len(self._index)
+        previous = {record.candidate_id: record for record in self._index.list()}
+        self._index.replace(records)
+        self._source_version = self._probe_source_version()
+        self._index_refreshed_at = time.monotonic()
+        log_seq = self._log_store.seq if self._log_store is not None else 0
+        if first_load:
+            self._changes.reset(log_seq)
         else:
-            data = json.loads(self._local_path.read_text())
-            data = [item for item in data if item.get("status") != status.value]
-            self._local_path.write_text(json.dumps(data, indent=2))
-        return len(targets)
+            self._record_reload_diff(previous, records, log_seq)
+
+    def _record_reload_diff(
+        self,
+        previous: Dict[str, CandidateRecord],
+        records: List[CandidateRecord],
+        log_seq: int,
+    ) -> None:
+        """Journal what a full reload changed so pollers get deltas instead of a reset."""
+
+        changes: List[Tuple[str, str]] = []
+        for record in records:
+            before = previous.pop(record.candidate_id, None)
+            if before is None:
+                changes.append((record.candidate_id, "insert"))
+            elif before.model_dump() != record.model_dump():
+                changes.append((record.candidate_id, "update"))
+        changes.extend((candidate_id, "delete") for candidate_id in previous)
+        if not changes:
+            return
+        version = max(log_seq, self._changes.version + 1)
+        for candidate_id, op in changes:
+            self._changes.record(candidate_id, op, version=version)
+
+    def _probe_source_version(self) -> Optional[object]:
+        if self._log_store is not None:
+            return self._log_store.seq
+        if self._spreadsheet is None:
+            return None
+        try:
+            self._spreadsheet.refresh_lastUpdateTime()
+            return self._spreadsheet.lastUpdateTime
+        except Exception as exc:  # pragma: no cover - depends on Drive scopes
+            logger.debug("Sheet change probe unavailable (%s); falling back to full refresh.", exc)
+            return None
+
+    def _flush_pending_appends(self) -> None:
+        """
+        Write buffered rows with one ``append_rows`` call (invoked by ``AppendBuffer``).
+
+        The call runs outside ``_index_lock`` so reads and writes do not wait on
+        Sheets latency. Rows whose status changed or that were deleted while the
+        call was in flight are corrected on the sheet once their rows are known.
+        """
+
+        with self._index_lock:
+            if self._in_flight:
+                return
+            batch = self._append_buffer.peek(self.settings.sheets_append_batch_size)
+            if not batch:
+                return
+            self._in_flight = {record.candidate_id: record for record in batch}
+        try:
+            response = self._worksheet.append_rows(
+                [self._row_values(record) for record in batch],
+                value_input_option="USER_ENTERED",
+            )
+        except BaseException:
+            with self._index_lock:
+                self._in_flight = {}
+            raise
+        with self._index_lock:
+            wanted, self._in_flight = self._in_flight, {}
+            self._append_buffer.drop(list(wanted))
+            first_row = self._appended_row(response)
+            if first_row is None:
+                # Unknown placement (e.g. concurrent writers): reload to find the rows.
+                self._refresh_index()
+                rows = {cid: getattr(self._index.get(cid), "sheet_row", None) for cid in wanted}
+            else:
+                rows = {record.candidate_id: first_row + n for n, record in enumerate(batch)}
+            deleted_rows: List[int] = []
+            for sent in batch:
+                candidate_id, row = sent.candidate_id, rows.get(sent.candidate_id)
+                current = wanted[candidate_id]
+                if current is None:
+                    if row:
+                        deleted_rows.append(row)
+                    if self._index.remove(candidate_id) is not None:
+                        self._changes.record(candidate_id, "delete")
+                    continue
+                if row and current.status != sent.status:
+                    status_col = self._header_index().get("Status")
+                    if status_col is not None:
+                        self._worksheet.update_cell(row, status_col + 1, current.status.value)
+                    self._index.set_status(candidate_id, current.status)
+                if row:
+                    self._index.set_row(candidate_id, row)
+            if deleted_rows:
+                self._delete_sheet_rows(deleted_rows)
+                self._index.shift_rows_after_delete(deleted_rows)
+
+    @staticmethod
+    def _appended_row(response) -> Optional[int]:
+        try:
+            updated_range = response["updates"]["updatedRange"]
+        except (TypeError, KeyError):
+            return None
+        match = UPDATED_RANGE_ROW.search(updated_range)
+        return int(match.group(1)) if match else None
 
     def _list_from_sheet(self) -> List[CandidateRecord]:
         values = self._worksheet.get_all_values()
         if not values:
             return []
         header = values[0]
+        self._header = header
         header_index = {name: idx for idx, name in enumerate(header)}
         records: List[CandidateRecord] = []
         updates: List[Tuple[int, str, str]] = []
@@ -260,21 +679,10 @@ class SheetsRepository:
             records.append(record)
         if updates:
             self._fill_missing_metadata(updates, header_index)
-        records.sort(key=lambda item: item.received_at, reverse=True)
         return records
 
     def _list_from_local(self) -> List[CandidateRecord]:
-        data = json.loads(self._local_path.read_text())
-        updated = False
-        records: List[CandidateRecord] = []
-        for entry in data:
-            record, changed = self._from_local_row(entry)
-            updated = updated or changed
-            records.append(record)
-        if updated:
-            self._local_path.write_text(json.dumps(data, indent=2))
-        records.sort(key=lambda item: item.received_at, reverse=True)
-        return records
+        return [self._from_local_row(entry)[0] for entry in self._log_store.entries()]
 
     def _row_dict_from_values(self, row: List[str], header: List[str]) -> Dict[str, str]:
         normalized_row = row + [""] * (len(header) - len(row))
@@ -285,13 +693,28 @@ class SheetsRepository:
         updates: List[Tuple[int, str, str]],
         header_index: Dict[str, int],
     ) -> None:
+        """Backfill Candidate ID / Status cells with one ``values.batchUpdate`` call."""
+
         if not self._worksheet:
             return
+        columns: Dict[int, Dict[int, str]] = {}
         for row_index, candidate_id, status_value in updates:
             if candidate_id and "Candidate ID" in header_index:
-                self._worksheet.update_cell(row_index, header_index["Candidate ID"] + 1, candidate_id)
+                columns.setdefault(header_index["Candidate ID"] + 1, {})[row_index] = candidate_id
             if status_value and "Status" in header_index:
-                self._worksheet.update_cell(row_index, header_index["Status"] + 1, status_value)
+                columns.setdefault(header_index["Status"] + 1, {})[row_index] = status_value
+        value_ranges = []
+        for column, cells in columns.items():
+            for first, last in contiguous_runs(list(cells)):
+                cell_range = f"{rowcol_to_a1(first, column)}:{rowcol_to_a1(last, column)}"
+                value_ranges.append(
+                    {
+                        "range": cell_range,
+                        "values": [[cells[row]] for row in range(first, last + 1)],
+                    }
+                )
+        if value_ranges:
+            self._worksheet.batch_update(value_ranges, value_input_option="RAW")
 
     def _from_sheet_row(self, row: Dict[str, str], row_index: int) -> Optional[CandidateRecord]:
         timestamp = self._parse_timestamp(row.get("Timestamp"))
@@ -350,16 +773,15 @@ class SheetsRepository:
             last_job_title=row.get("last_job_title"),
             source=row.get("source", "unknown"),
             received_at=self._parse_timestamp(row.get("timestamp")),
-            confidence=float(row.get("confidence") or 0) if row.get("confidence") not in {None, ""} else None,
+            confidence=float(row.get("confidence") or 0)
+            if row.get("confidence") not in {None, ""}
+            else None,
             status=status,
         )
         return record, updated
 
     def _header_index(self) -> Dict[str, int]:
-        if not self._worksheet:
-            return {name: idx for idx, name in enumerate(SHEET_HEADER)}
-        header = self._worksheet.row_values(1)
-        return {name: idx for idx, name in enumerate(header)}
+        return {name: idx for idx, name in enumerate(self._header)}
 
     @staticmethod
     def _parse_timestamp(value) -> datetime:
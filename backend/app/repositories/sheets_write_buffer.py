@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Callable, List, Optional
+
+from ..models.response_models import CandidateRecord
+from ..utils import file_lock
+
+logger = logging.getLogger("smarthire.sheets.buffer")
+
+
+class SpillFileInUseError(RuntimeError):
+    """Another process already owns the spill file."""
+
+
+class AppendBuffer:
+    """
+    Write-behind queue for candidate rows waiting to be appended to the sheet.
+
+    Every accepted record is first appended to a JSONL spill file, so rows that
+    were acknowledged but not yet flushed survive a crash and are replayed on the
+    next start (the owner calls ``start`` once it has reconciled them). A
+    background thread calls ``flush_callback`` when ``batch_size`` rows are
+    pending or ``flush_interval`` seconds have passed; the callback is
+    responsible for writing ``peek()`` to the sheet and then calling ``drop``.
+
+    The spill file mirrors this process's queue and is rewritten wholesale, so
+    it cannot be shared: the buffer holds an exclusive lock of
+    ``<spill>.lock`` from construction until ``close`` and raises
+    ``SpillFileInUseError`` if another process already holds it.
+    """
+
+    def __init__(
+        self,
+        spill_path: Path,
+        flush_callback: Callable[[], None],
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+    ) -> None:
+        self.spill_path = spill_path
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self._flush_callback = flush_callback
+        self._pending: "OrderedDict[str, CandidateRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_path = spill_path.with_name(spill_path.name + ".lock")
+        self._lock_handle = self._acquire_spill_lock()
+        self._load_spill()
+
+    # Queue operations ------------------------------------------------------------
+
+    def add(self, record: CandidateRecord) -> None:
+        line = record.model_dump_json() + "\n"
+        with self._lock:
+            with self.spill_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._pending[record.candidate_id] = record
+            size = len(self._pending)
+        self.start()
+        if size >= self.batch_size:
+            self._wakeup.set()
+
+    def get(self, candidate_id: str) -> Optional[CandidateRecord]:
+        return self._pending.get(candidate_id)
+
+    def replace(self, record: CandidateRecord) -> bool:
+        with self._lock:
+            if record.candidate_id not in self._pending:
+                return False
+            self._pending[record.candidate_id] = record
+            self._rewrite_spill()
+            return True
+
+    def remove(self, candidate_id: str) -> bool:
+        with self._lock:
+            if self._pending.pop(candidate_id, None) is None:
+                return False
+            self._rewrite_spill()
+            return True
+
+    def peek(self, limit: Optional[int] = None) -> List[CandidateRecord]:
+        with self._lock:
+            records = list(self._pending.values())
+        return records if limit is None else records[:limit]
+
+    def drop(self, candidate_ids: List[str]) -> None:
+        with self._lock:
+            for candidate_id in candidate_ids:
+                self._pending.pop(candidate_id, None)
+            self._rewrite_spill()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # Lifecycle -------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Flush synchronously until the queue is empty or the callback fails."""
+
+        while self._pending:
+            before = len(self._pending)
+            try:
+                self._flush_callback()
+            except Exception as exc:  # pragma: no cover - network dependent
+                logger.warning(
+                    "Sheets append flush failed (%s); %s rows stay spilled.", exc, before
+                )
+                return
+            if len(self._pending) >= before:
+                return
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+        if self._lock_handle is not None:
+            self._lock_handle.close()  # closing the descriptor releases the lock
+            self._lock_handle = None
+
+    def start(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sheets-append-buffer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.flush_interval)
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                return
+            self.flush()
+
+    # Spill file ------------------------------------------------------------------
+
+    def _acquire_spill_lock(self) -> Optional[IO[str]]:
+        if not file_lock.SUPPORTED:  # pragma: no cover - exotic platforms
+            logger.warning(
+                "No file locking available; %s is not guarded against other processes",
+                self.spill_path,
+            )
+            return None
+        handle = self.lock_path.open("a")
+        if not file_lock.lock(handle, blocking=False):
+            handle.close()
+            raise SpillFileInUseError(f"{self.spill_path} is in use by another process")
+        return handle
+
+    def _load_spill(self) -> None:
+        if not self.spill_path.exists():
+            return
+        for line in self.spill_path.read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = CandidateRecord.model_validate_json(line)
+            except ValueError:
+                logger.warning("Skipping corrupt spill entry in %s", self.spill_path)
+                continue
+            self._pending[record.candidate_id] = record
+        if self._pending:
+            logger.info(
+                "Recovered %s unflushed candidate rows from %s", len(self._pending), self.spill_path
+            )
+
+    def _rewrite_spill(self) -> None:
+        temp_path = self.spill_path.with_suffix(".tmp")
+        temp_path.write_text(
+            "".join(record.model_dump_json() + "\n" for record in self._pending.values()),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self.spill_path)
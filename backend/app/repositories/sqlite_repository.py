@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from ..core.config import Settings, get_settings
+from ..models.response_models import CandidateRecord, CandidateStatus
+from .candidate_index import received_at_timestamp
+from .change_journal import ChangeEntry
+
+logger = logging.getLogger("smarthire.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    candidate_id TEXT PRIMARY KEY,
+    full_name TEXT,
+    email TEXT,
+    phone TEXT,
+    location TEXT,
+    skills TEXT NOT NULL DEFAULT '[]',
+    education TEXT,
+    experience TEXT,
+    last_job_title TEXT,
+    source TEXT NOT NULL,
+    received_at TEXT NOT NULL,
+    received_ts REAL NOT NULL,
+    confidence REAL,
+    notes TEXT,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_received ON candidates (received_ts DESC, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates (status, received_ts DESC, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates (email);
+CREATE INDEX IF NOT EXISTS idx_candidates_name ON candidates (lower(coalesce(full_name, '')) DESC, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_candidates_status_name
+    ON candidates (status, lower(coalesce(full_name, '')) DESC, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_candidates_confidence ON candidates (coalesce(confidence, -1.0) DESC, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_candidates_status_confidence
+    ON candidates (status, coalesce(confidence, -1.0) DESC, candidate_id);
+CREATE TABLE IF NOT EXISTS status_counts (
+    status TEXT PRIMARY KEY,
+    total INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS trg_status_counts_insert AFTER INSERT ON candidates BEGIN
+    INSERT INTO status_counts (status, total) VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET total = total + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_status_counts_delete AFTER DELETE ON candidates BEGIN
+    UPDATE status_counts SET total = total - 1 WHERE status = OLD.status;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_status_counts_update AFTER UPDATE OF status ON candidates
+WHEN OLD.status <> NEW.status BEGIN
+    UPDATE status_counts SET total = total - 1 WHERE status = OLD.status;
+    INSERT INTO status_counts (status, total) VALUES (NEW.status, 1)
+        ON CONFLICT(status) DO UPDATE SET total = total + 1;
+END;
+CREATE TABLE IF NOT EXISTS candidate_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    candidate_id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS export_cursors (
+    name TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repository_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+COLUMNS = (
+    "candidate_id, full_name, email, phone, location, skills, education, experience, "
+    "last_job_title, source, received_at, received_ts, confidence, notes, status"
+)
+ORDER_BY = "ORDER BY received_ts DESC, candidate_id"
+PRUNE_EVERY = 500
+UPSERT_SET = ", ".join(
+    f"{column.strip()} = excluded.{column.strip()}" for column in COLUMNS.split(",")[1:]
+)
+
+# SQL twins of ``candidate_index.SORT_FIELDS``; each has a matching index above.
+SORT_EXPRESSIONS = {
+    "received_at": "received_ts",
+    "full_name": "lower(coalesce(full_name, ''))",
+    "confidence": "coalesce(confidence, -1.0)",
+}
+
+
+class SQLiteCandidateRepository:
+    """
+    Candidate store backed by a local SQLite database (``storage_mode=sqlite``).
+
+    Implements the same surface as ``SheetsRepository`` but filters, orders and
+    limits in SQL over covering indexes, so nothing is loaded that the caller
+    does not return. The database runs in WAL mode with one connection per
+    thread, letting readers proceed while a writer commits. Every write also
+    appends to ``candidate_changes`` in the same transaction; exporters such as
+    ``SheetsMirrorExporter`` consume that journal.
+    """
+
+    def __init__(self, settings: Settings | None = None, db_path: Path | None = None) -> None:
+        self.settings = settings or get_settings()
+        base_dir = Path(__file__).resolve().parents[3]
+        self.db_path = db_path or base_dir / self.settings.sqlite_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._journaled = 0
+        self._connection().executescript(SCHEMA)
+        self._backfill_status_counts()
+        self._epoch = self._load_epoch()
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    # Repository surface ------------------------------------------------------
+
+    def append_candidate(self, record: CandidateRecord) -> None:
+        with self._transaction() as connection:
+            # An upsert (not INSERT OR REPLACE) so the status_counts triggers see an UPDATE.
+            connection.execute(
+                f"INSERT INTO candidates ({COLUMNS}) VALUES ({', '.join('?' * 15)}) "
+                f"ON CONFLICT(candidate_id) DO UPDATE SET {UPSERT_SET}",
+                self._to_row(record),
+            )
+            self._journal(connection, record.candidate_id, "insert", record.status)
+
+    def append_candidates(self, records: List[CandidateRecord]) -> None:
+        """Insert several candidates in a single transaction."""
+
+        if not records:
+            return
+        with self._transaction() as connection:
+            connection.executemany(
+                f"INSERT INTO candidates ({COLUMNS}) VALUES ({', '.join('?' * 15)}) "
+                f"ON CONFLICT(candidate_id) DO UPDATE SET {UPSERT_SET}",
+                [self._to_row(record) for record in records],
+            )
+            for record in records:
+                self._journal(connection, record.candidate_id, "insert", record.status)
+
+    def list_recent(self, limit: int = 20) -> List[CandidateRecord]:
+        return self.list_candidates(limit=limit)
+
+    def list_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int | None = None,
+    ) -> List[CandidateRecord]:
+        query = f"SELECT {COLUMNS} FROM candidates"
+        params: list = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status.value)
+        query += f" {ORDER_BY}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connection().execute(query, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def page_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int = 20,
+        sort: str = "received_at",
+        descending: bool = True,
+        after: Optional[Tuple[object, str]] = None,
+    ) -> List[CandidateRecord]:
+        """
+        Keyset page over ``(sort value, candidate_id)``.
+
+        Descending pages run ``value DESC, candidate_id ASC`` and ascending pages
+        the exact reverse, so both directions walk one index and a deep page
+        costs the same as the first one.
+        """
+
+        expression = SORT_EXPRESSIONS[sort]
+        clauses: List[str] = []
+        params: list = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if after is not None:
+            value, candidate_id = after
+            if descending:
+                clauses.append(f"{expression} <= ? AND ({expression} < ? OR candidate_id > ?)")
+            else:
+                clauses.append(f"{expression} >= ? AND ({expression} > ? OR candidate_id < ?)")
+            params.extend([value, value, candidate_id])
+        query = f"SELECT {COLUMNS} FROM candidates"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if descending:
+            query += f" ORDER BY {expression} DESC, candidate_id ASC LIMIT ?"
+        else:
+            query += f" ORDER BY {expression} ASC, candidate_id DESC LIMIT ?"
+        params.append(limit)
+        rows = self._connection().execute(query, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def count_candidates(self, status: CandidateStatus | None = None) -> int:
+        if status is None:
+            row = (
+                self._connection()
+                .execute("SELECT COALESCE(SUM(total), 0) FROM status_counts")
+                .fetchone()
+            )
+        else:
+            row = (
+                self._connection()
+                .execute("SELECT total FROM status_counts WHERE status = ?", (status.value,))
+                .fetchone()
+            )
+        return row[0] if row else 0
+
+    def status_counts(self) -> Dict[CandidateStatus, int]:
+        """Per-status totals, maintained by triggers rather than counted per request."""
+
+        counts: Dict[CandidateStatus, int] = {}
+        for status_value, total in self._connection().execute(
+            "SELECT status, total FROM status_counts"
+        ):
+            try:
+                status = CandidateStatus(status_value)
+            except ValueError:
+                status = CandidateStatus.NEW
+            if total:
+                counts[status] = counts.get(status, 0) + total
+        return counts
+
+    def get_candidate(self, candidate_id: str) -> Optional[CandidateRecord]:
+        row = (
+            self._connection()
+            .execute(f"SELECT {COLUMNS} FROM candidates WHERE candidate_id = ?", (candidate_id,))
+            .fetchone()
+        )
+        return self._from_row(row) if row else None
+
+    def update_status(self, candidate_id: str, status: CandidateStatus) -> CandidateRecord:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE candidates SET status = ? WHERE candidate_id = ?",
+                (status.value, candidate_id),
+            )
+            if cursor.rowcount == 0:
+                raise KeyError(candidate_id)
+            self._journal(connection, candidate_id, "status", status)
+            row = connection.execute(
+                f"SELECT {COLUMNS} FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+        return self._from_row(row)
+
+    def delete_candidate(self, candidate_id: str) -> CandidateRecord:
+        with self._transaction() as connection:
+            row = connection.execute(
+                f"SELECT {COLUMNS} FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(candidate_id)
+            connection.execute("DELETE FROM candidates WHERE candidate_id = ?", (candidate_id,))
+            self._journal(connection, candidate_id, "delete")
+        return self._from_row(row)
+
+    def delete_by_status(self, status: CandidateStatus) -> int:
+        with self._transaction() as connection:
+            ids = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT candidate_id FROM candidates WHERE status = ?", (status.value,)
+                )
+            ]
+            if not ids:
+                return 0
+            connection.execute("DELETE FROM candidates WHERE status = ?", (status.value,))
+            for candidate_id in ids:
+                self._journal(connection, candidate_id, "delete")
+        return len(ids)
+
+    # Change journal ----------------------------------------------------------
+
+    def changes_after(
+        self, seq: int, limit: int = 500
+    ) -> List[Tuple[int, str, str, Optional[str]]]:
+        """Return ``(seq, candidate_id, op, status)`` journal rows newer than ``seq``."""
+
+        return (
+            self._connection()
+            .execute(
+                "SELECT seq, candidate_id, op, status FROM candidate_changes WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit),
+            )
+            .fetchall()
+        )
+
+    def change_version(self) -> int:
+        return self._current_seq(self._connection())
+
+    def change_epoch(self) -> str:
+        return self._epoch
+
+    def changes_since(self, version: int, limit: int = 500) -> Optional[List[ChangeEntry]]:
+        """Journal entries after ``version``; ``None`` if that version was pruned or is unknown."""
+
+        connection = self._connection()
+        current = self._current_seq(connection)
+        if version > current:
+            return None
+        if version < current:
+            (oldest,) = connection.execute("SELECT MIN(seq) FROM candidate_changes").fetchone()
+            if oldest is None or version < oldest - 1:
+                return None
+        return [
+            ChangeEntry(seq, candidate_id, "update" if op == "status" else op)
+            for seq, candidate_id, op, _ in self.changes_after(version, limit=limit)
+        ]
+
+    def export_cursor(self, name: str) -> int:
+        row = (
+            self._connection()
+            .execute("SELECT seq FROM export_cursors WHERE name = ?", (name,))
+            .fetchone()
+        )
+        return row[0] if row else 0
+
+    def set_export_cursor(self, name: str, seq: int) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO export_cursors (name, seq) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET seq = excluded.seq",
+                (name, seq),
+            )
+
+    # Internals ---------------------------------------------------------------
+
+    def _backfill_status_counts(self) -> None:
+        """Seed ``status_counts`` for databases created before the triggers existed."""
+
+        with self._transaction() as connection:
+            if connection.execute("SELECT 1 FROM status_counts LIMIT 1").fetchone():
+                return
+            connection.execute(
+                "INSERT INTO status_counts (status, total) SELECT status, COUNT(*) FROM candidates GROUP BY status"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _journal(
+        self,
+        connection: sqlite3.Connection,
+        candidate_id: str,
+        op: str,
+        status: CandidateStatus | None = None,
+    ) -> None:
+        connection.execute(
+            "INSERT INTO candidate_changes (candidate_id, op, status) VALUES (?, ?, ?)",
+            (candidate_id, op, status.value if status else None),
+        )
+        self._journaled += 1
+        if self._journaled % PRUNE_EVERY == 0:
+            self._prune_changes(connection)
+
+    def _prune_changes(self, connection: sqlite3.Connection) -> None:
+        """Trim the journal to ``change_journal_size`` entries, never past an export cursor."""
+
+        threshold = self._current_seq(connection) - self.settings.change_journal_size
+        (oldest_cursor,) = connection.execute("SELECT MIN(seq) FROM export_cursors").fetchone()
+        if oldest_cursor is not None:
+            threshold = min(threshold, oldest_cursor)
+        if threshold > 0:
+            connection.execute("DELETE FROM candidate_changes WHERE seq <= ?", (threshold,))
+
+    def _load_epoch(self) -> str:
+        """Random id stored with the database, so a recreated file never reuses old versions."""
+
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR IGNORE INTO repository_meta (key, value) VALUES ('epoch', ?)",
+            (uuid4().hex[:12],),
+        )
+        (epoch,) = connection.execute(
+            "SELECT value FROM repository_meta WHERE key = 'epoch'"
+        ).fetchone()
+        return epoch
+
+    @staticmethod
+    def _current_seq(connection: sqlite3.Connection) -> int:
+        row = connection.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'candidate_changes'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _to_row(record: CandidateRecord) -> tuple:
+        return (
+            record.candidate_id,
+            record.full_name,
+            record.email,
+            record.phone,
+            record.location,
+            json.dumps(record.skills),
+            record.education,
+            record.experience,
+            record.last_job_title,
+            record.source,
+            record.received_at.isoformat(),
+            received_at_timestamp(record.received_at),
+            record.confidence,
+            record.notes,
+            record.status.value,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> CandidateRecord:
+        try:
+            status = CandidateStatus(row[14])
+        except ValueError:
+            status = CandidateStatus.NEW
+        return CandidateRecord(
+            candidate_id=row[0],
+            full_name=row[1],
+            email=row[2],
+            phone=row[3],
+            location=row[4],
+            skills=json.loads(row[5] or "[]"),
+            education=row[6],
+            experience=row[7],
+            last_job_title=row[8],
+            source=row[9],
+            received_at=datetime.fromisoformat(row[10]),
+            confidence=row[12],
+            notes=row[13],
+            status=status,
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
 class UserRepository:
@@ -28,6 +28,14 @@ class UserRepository:
         raw = json.loads(self.storage_path.read_text())
         return {email.lower(): data for email, data in raw.items()}
 
+    def version(self) -> Optional[Tuple[int, int]]:
+        """Cheap change marker (mtime, size) used to detect edits from other processes."""
+
+        try:
+            stat = self.storage_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def save(self, users: Dict[str, dict]) -> None:
         self.storage_path.write_text(json.dumps(users, indent=2))
-
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import threading
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from ..core.config import Settings, get_settings
 from ..core.security import (
@@ -12,6 +14,7 @@ from ..core.security import (
     verify_password,
 )
 from ..repositories.user_repository import UserRepository
+from ..utils.cache import LRUCache
 
 
 @dataclass
@@ -23,6 +26,12 @@ class UserIdentity:
     active: bool = True
 
 
+@dataclass
+class VerifiedToken:
+    claims: Dict[str, Any]
+    identity: UserIdentity
+
+
 class AuthService:
     """
     Lightweight in-memory authentication service suitable for demos.
@@ -31,15 +40,28 @@ class AuthService:
     such as Cognito, Auth0, or a custom user database.
     """
 
-    def __init__(self, settings: Settings | None = None, repository: UserRepository | None = None) -> None:
+    def __init__(
+        self, settings: Settings | None = None, repository: UserRepository | None = None
+    ) -> None:
         self.settings = settings or get_settings()
         self.repository = repository or UserRepository()
         self._users: Dict[str, UserIdentity] = {}
-        self._load_users()
-        self._bootstrap_users()
+        # The service is shared across requests, so admin mutations are serialized.
+        self._lock = threading.RLock()
+        self._loaded_version: Optional[tuple[int, int]] = None
+        # Verified tokens keyed by SHA-256 digest; entries expire with the token's ``exp``.
+        self._token_cache: LRUCache[str, VerifiedToken] = LRUCache(
+            maxsize=self.settings.token_cache_size
+        )
+        with self._lock:
+            self._load_users()
+            if self._bootstrap_users():
+                self._persist()
 
     def _load_users(self) -> None:
+        version = self.repository.version()
         raw_users = self.repository.load()
+        users: Dict[str, UserIdentity] = {}
         for email, data in raw_users.items():
             hashed_password = data.get("hashed_password")
             if not hashed_password:
@@ -51,13 +73,25 @@ class AuthService:
             name = data.get("name")
             if not name:
                 name = "Administrator" if role == UserRole.admin else "Recruiter"
-            self._users[email] = UserIdentity(
+            users[email] = UserIdentity(
                 email=email,
                 role=role,
                 hashed_password=hashed_password,
                 name=name,
                 active=data.get("active", True),
             )
+        self._users = users
+        self._loaded_version = version
+        self._token_cache.clear()
+
+    def _refresh_if_stale(self) -> None:
+        """Reload users when users.json changed on disk (e.g. edited by another worker)."""
+
+        if self.repository.version() == self._loaded_version:
+            return
+        with self._lock:
+            if self.repository.version() != self._loaded_version:
+                self._load_users()
 
     def _persist(self) -> None:
         payload = {
@@ -70,10 +104,15 @@ class AuthService:
             for email, identity in self._users.items()
         }
         self.repository.save(payload)
+        self._loaded_version = self.repository.version()
+
+    def _bootstrap_users(self) -> bool:
+        """Create the admin and demo recruiter when missing; return True if anything changed."""
 
-    def _bootstrap_users(self) -> None:
+        changed = False
         admin_email = self.settings.admin_email.lower()
         if admin_email not in self._users:
+            changed = True
             self._users[admin_email] = UserIdentity(
                 email=admin_email,
                 role=UserRole.admin,
@@ -85,11 +124,13 @@ class AuthService:
         legacy_email = "recruiter@smarthire.local"
         recruiter_email = "recruiter@example.com"
         if legacy_email in self._users and recruiter_email not in self._users:
+            changed = True
             legacy_identity = self._users.pop(legacy_email)
             legacy_identity.email = recruiter_email
             legacy_identity.name = legacy_identity.name or "Demo Recruiter"
             self._users[recruiter_email] = legacy_identity
         if recruiter_email not in self._users:
+            changed = True
             self._users[recruiter_email] = UserIdentity(
                 email=recruiter_email,
                 role=UserRole.recruiter,
@@ -97,18 +138,31 @@ class AuthService:
                 name="Demo Recruiter",
                 active=True,
             )
-        self._persist()
+        return changed
 
     def authenticate(self, email: str, password: str) -> UserIdentity:
+        self._refresh_if_stale()
         identity = self._users.get(email.lower())
-        if not identity or not identity.active or not verify_password(password, identity.hashed_password):
+        if (
+            not identity
+            or not identity.active
+            or not verify_password(password, identity.hashed_password)
+        ):
             raise ValueError("Invalid credentials")
         return identity
 
     def issue_token(self, identity: UserIdentity) -> str:
-        return create_access_token(subject=identity.email, role=identity.role, settings=self.settings)
+        return create_access_token(
+            subject=identity.email, role=identity.role, settings=self.settings
+        )
 
     def verify_token(self, token: str) -> UserIdentity:
+        self._refresh_if_stale()
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._token_cache.get(digest)
+        if cached is not None:
+            return cached.identity
+
         payload = decode_access_token(token, settings=self.settings)
         email = payload.get("sub")
         role = payload.get("role")
@@ -119,17 +173,30 @@ class AuthService:
             raise ValueError("Unknown user")
         if identity.role.value != role:
             raise ValueError("Role mismatch")
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            self._token_cache.set(
+                digest,
+                VerifiedToken(claims=payload, identity=identity),
+                expires_at=float(expires_at),
+            )
         return identity
 
+    def token_cache_stats(self) -> Dict[str, int]:
+        return self._token_cache.stats()
+
     # Administrative helpers -------------------------------------------------
 
     def list_users(self, roles: Optional[Iterable[UserRole]] = None) -> Dict[str, UserIdentity]:
+        self._refresh_if_stale()
+        with self._lock:
+            users = list(self._users.items())
         if roles is None:
-            return {email: identity for email, identity in self._users.items() if identity.active}
+            return {email: identity for email, identity in users if identity.active}
         allowed = {role.value for role in roles}
         return {
             email: identity
-            for email, identity in self._users.items()
+            for email, identity in users
             if identity.active and identity.role.value in allowed
         }
 
@@ -154,16 +221,22 @@ class AuthService:
             name=clean_name,
             active=True,
         )
-        self._users[normalized] = identity
-        self._persist()
+        with self._lock:
+            self._refresh_if_stale()
+            if normalized in self._users:
+                raise ValueError("User already exists")
+            self._users[normalized] = identity
+            self._persist()
         return identity
 
     def delete_user(self, email: str) -> None:
         normalized = email.lower()
         if normalized == self.settings.admin_email.lower():
             raise ValueError("Cannot delete primary admin account")
-        if normalized not in self._users:
-            raise ValueError("User not found")
-        del self._users[normalized]
-        self._persist()
-
+        with self._lock:
+            self._refresh_if_stale()
+            if normalized not in self._users:
+                raise ValueError("User not found")
+            del self._users[normalized]
+            self._persist()
+            self._token_cache.remove_where(lambda entry: entry.identity.email == normalized)
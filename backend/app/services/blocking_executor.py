@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Mapping, Tuple, TypeVar
+
+logger = logging.getLogger("smarthire.executor")
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised instead of queueing work when a stage has no room; ``retry_after`` is in seconds."""
+
+    def __init__(self, stage: str, retry_after: int) -> None:
+        super().__init__(f"Stage '{stage}' is saturated; retry in {retry_after}s")
+        self.stage = stage
+        self.retry_after = retry_after
+
+
+class _Stage:
+    def __init__(self, name: str, concurrency: int, queue_size: int) -> None:
+        self.name = name
+        self.concurrency = max(concurrency, 1)
+        self.queue_size = max(queue_size, 0)
+        # asyncio semaphores are bound to one event loop, so keep one per loop.
+        self.semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.admitted = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.avg_seconds = 0.0
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self.semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        return semaphore
+
+
+class BlockingExecutor:
+    """
+    Bounds pipeline work awaited from the event loop, per stage.
+
+    Each stage (``stages`` maps name -> ``(concurrency, queue_size)``) runs at
+    most ``concurrency`` calls at once and lets ``queue_size`` more wait for a
+    slot. Past that, ``run_async`` raises :class:`ExecutorSaturatedError`
+    immediately instead of growing an unbounded backlog; its ``retry_after``
+    estimates when a slot frees up from the stage's average call duration.
+
+    A slot is released when the work itself finishes, not when the awaiting
+    request does: cancelling the await (e.g. the client disconnected) leaves
+    the call running, and it keeps counting against the stage until it returns.
+    """
+
+    def __init__(self, stages: Mapping[str, Tuple[int, int]], default_retry_after: int = 5) -> None:
+        self.default_retry_after = max(default_retry_after, 1)
+        self._stages: Dict[str, _Stage] = {
+            name: _Stage(name, concurrency, queue_size)
+            for name, (concurrency, queue_size) in stages.items()
+        }
+        self._lock = threading.Lock()
+
+    async def run_async(
+        self, stage: str, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await ``func(*args, **kwargs)`` once one of the stage's slots is free.
+
+        The coroutine (which schedules its own blocking work in threads) runs as
+        its own task, shielded from the caller's cancellation, so the threads it
+        started finish before the slot frees.
+        """
+
+        entry = self._stages[stage]
+        self._admit(entry)
+        task = asyncio.ensure_future(self._limited(entry, func, *args, **kwargs))
+        task.add_done_callback(functools.partial(self._settle, entry))
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                name: {
+                    "concurrency": entry.concurrency,
+                    "queue_size": entry.queue_size,
+                    "admitted": entry.admitted,
+                    "running": entry.running,
+                    "completed": entry.completed,
+                    "rejected": entry.rejected,
+                    "avg_seconds": round(entry.avg_seconds, 4),
+                }
+                for name, entry in self._stages.items()
+            }
+
+    def _admit(self, entry: _Stage) -> None:
+        with self._lock:
+            if entry.admitted >= entry.concurrency + entry.queue_size:
+                entry.rejected += 1
+                raise ExecutorSaturatedError(entry.name, self._retry_after(entry))
+            entry.admitted += 1
+
+    def _release(self, entry: _Stage) -> None:
+        with self._lock:
+            entry.admitted -= 1
+
+    def _settle(self, entry: _Stage, future: "asyncio.Future[Any]") -> None:
+        self._release(entry)
+        if not future.cancelled():
+            future.exception()  # retrieved here in case the awaiting caller was cancelled
+
+    async def _limited(
+        self, entry: _Stage, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        async with entry.semaphore():
+            with self._lock:
+                entry.running += 1
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self._observe(entry, time.perf_counter() - started)
+                with self._lock:
+                    entry.running -= 1
+
+    def _observe(self, entry: _Stage, elapsed: float) -> None:
+        with self._lock:
+            entry.completed += 1
+            # Exponential moving average keeps the Retry-After estimate current.
+            entry.avg_seconds = (
+                elapsed if entry.completed == 1 else 0.8 * entry.avg_seconds + 0.2 * elapsed
+            )
+
+    def _retry_after(self, entry: _Stage) -> int:
+        if not entry.completed:
+            return self.default_retry_after
+        waves = entry.admitted / entry.concurrency
+        return max(1, math.ceil(entry.avg_seconds * waves))
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import logging
+import mimetypes
+import threading
+import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from ..models.response_models import CandidateRecord
+from ..utils.attachment_blob import CHUNK_SIZE, DEFAULT_SPOOL_THRESHOLD, AttachmentBlob
+from ..utils.file_utils import FileDownloadError
+from .ocr_service import AttachmentResult
+from .parsing_service import ParsingService
+from .storage_service import StorageService
+
+logger = logging.getLogger("smarthire.bulk_import")
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+@dataclass
+class ImportItem:
+    filename: str
+    status: str = "pending"
+    candidate_id: Optional[str] = None
+    full_name: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportJob:
+    id: str
+    status: str
+    created_at: float
+    items: List[ImportItem] = field(default_factory=list)
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def processed(self) -> int:
+        return sum(item.status != "pending" for item in self.items)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(item.status == "succeeded" for item in self.items)
+
+    @property
+    def failed(self) -> int:
+        return sum(item.status == "failed" for item in self.items)
+
+
+def is_zip(blob: AttachmentBlob) -> bool:
+    content_type = (blob.content_type or "").split(";")[0].strip()
+    return content_type in ZIP_CONTENT_TYPES or blob.filename.lower().endswith(".zip")
+
+
+class BulkImportService:
+    """
+    Imports many resumes at once (a job-fair ZIP or a multipart list of files).
+
+    ``submit`` registers an import and returns immediately; a coordinator
+    thread then walks the files in batches of ``batch_size``. Within a batch,
+    text extraction and attachment archival fan out over a pool of
+    ``workers`` threads, NLP runs once per batch through ``nlp.pipe``
+    (``ParsingService.parse_many``) and candidates are appended with one
+    repository write. ZIP entries are read lazily, one batch at a time. A
+    batch whose parse or write fails marks only its own files as failed.
+    Progress and per-file results live only in this process's memory for
+    ``retention_seconds``: they are lost on restart and are not visible to
+    other API worker processes.
+    """
+
+    def __init__(
+        self,
+        parsing_service: ParsingService,
+        storage_service: StorageService,
+        workers: int = 4,
+        batch_size: int = 32,
+        max_files: int = 1000,
+        max_file_bytes: int = 25 * 1024 * 1024,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        retention_seconds: float = 24 * 3600,
+        source: str = "bulk_import",
+    ) -> None:
+        self.parsing_service = parsing_service
+        self.storage_service = storage_service
+        self.batch_size = max(batch_size, 1)
+        self.max_files = max(max_files, 1)
+        self.max_file_bytes = max_file_bytes
+        self.spool_threshold = spool_threshold
+        self.retention_seconds = retention_seconds
+        self.source = source
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="bulk-import"
+        )
+        self._coordinator = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bulk-import-coordinator"
+        )
+        self._jobs: Dict[str, ImportJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, uploads: Sequence[AttachmentBlob]) -> ImportJob:
+        """Register an import of ``uploads`` (ZIPs are expanded) and start it in the background."""
+
+        try:
+            entries = self._plan(uploads)
+            if not entries:
+                raise ValueError("Import contains no files")
+            if len(entries) > self.max_files:
+                raise ValueError(f"Import has {len(entries)} files; the limit is {self.max_files}")
+        except ValueError:
+            for upload in uploads:
+                upload.close()
+            raise
+        job = ImportJob(
+            id=uuid4().hex,
+            status=QUEUED,
+            created_at=time.time(),
+            items=[ImportItem(filename=name) for name, _ in entries],
+        )
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._coordinator.submit(self._run, job, uploads, entries)
+        return job
+
+    def get(self, import_id: str) -> Optional[ImportJob]:
+        with self._lock:
+            return self._jobs.get(import_id)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {
+            "imports": len(jobs),
+            "running": sum(job.status in {QUEUED, RUNNING} for job in jobs),
+            "files": sum(len(job.items) for job in jobs),
+            "succeeded": sum(job.succeeded for job in jobs),
+            "failed": sum(job.failed for job in jobs),
+        }
+
+    def close(self) -> None:
+        self._coordinator.shutdown(wait=False, cancel_futures=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # Planning ------------------------------------------------------------------
+
+    def _plan(
+        self, uploads: Sequence[AttachmentBlob]
+    ) -> List[Tuple[str, Tuple[int, Optional[str]]]]:
+        """Display name and ``(upload index, zip member or None)`` of every file to import."""
+
+        entries: List[Tuple[str, Tuple[int, Optional[str]]]] = []
+        for index, upload in enumerate(uploads):
+            if not is_zip(upload):
+                entries.append((upload.filename, (index, None)))
+                continue
+            try:
+                with upload.open() as handle, zipfile.ZipFile(handle) as archive:
+                    for info in archive.infolist():
+                        name = PurePosixPath(info.filename)
+                        if info.is_dir() or name.name.startswith(".") or "__MACOSX" in name.parts:
+                            continue
+                        entries.append(
+                            (f"{upload.filename}/{info.filename}", (index, info.filename))
+                        )
+            except zipfile.BadZipFile as exc:
+                raise ValueError(f"{upload.filename} is not a valid ZIP archive") from exc
+        return entries
+
+    def _iter_blobs(
+        self,
+        uploads: Sequence[AttachmentBlob],
+        entries: List[Tuple[str, Tuple[int, Optional[str]]]],
+    ) -> Iterator[Tuple[int, Optional[AttachmentBlob], Optional[str]]]:
+        """Yield ``(item index, blob, error)``, opening each ZIP once and reading members lazily."""
+
+        archives: Dict[int, zipfile.ZipFile] = {}
+        handles = []
+        try:
+            for position, (_, (upload_index, member)) in enumerate(entries):
+                upload = uploads[upload_index]
+                if member is None:
+                    if upload.size > self.max_file_bytes:
+                        yield position, None, f"File exceeds the {self.max_file_bytes} byte limit"
+                    else:
+                        yield position, upload, None
+                    continue
+                archive = archives.get(upload_index)
+                if archive is None:
+                    handles.append(upload.open())
+                    archive = archives[upload_index] = zipfile.ZipFile(handles[-1])
+                info = archive.getinfo(member)
+                if info.file_size > self.max_file_bytes:
+                    yield position, None, f"File exceeds the {self.max_file_bytes} byte limit"
+                    continue
+                try:
+                    with archive.open(info) as stream:
+                        blob = AttachmentBlob.from_stream(
+                            iter(lambda: stream.read(CHUNK_SIZE), b""),
+                            filename=PurePosixPath(member).name,
+                            content_type=mimetypes.guess_type(member)[0],
+                            spool_threshold=self.spool_threshold,
+                            max_bytes=self.max_file_bytes,
+                        )
+                except (zipfile.BadZipFile, FileDownloadError, OSError, RuntimeError) as exc:
+                    yield position, None, str(exc)
+                    continue
+                yield position, blob, None
+        finally:
+            for archive in archives.values():
+                archive.close()
+            for handle in handles:
+                handle.close()
+
+    # Processing ----------------------------------------------------------------
+
+    def _run(
+        self,
+        job: ImportJob,
+        uploads: Sequence[AttachmentBlob],
+        entries: List[Tuple[str, Tuple[int, Optional[str]]]],
+    ) -> None:
+        job.status = RUNNING
+        started = time.perf_counter()
+        try:
+            batch: List[Tuple[int, AttachmentBlob]] = []
+            for position, blob, error in self._iter_blobs(uploads, entries):
+                if blob is None:
+                    self._fail(job.items[position], error or "unreadable")
+                    continue
+                batch.append((position, blob))
+                if len(batch) >= self.batch_size:
+                    self._process_batch(job, batch, uploads)
+                    batch = []
+            if batch:
+                self._process_batch(job, batch, uploads)
+            job.status = COMPLETED
+        except Exception as exc:  # pragma: no cover - unexpected pipeline failure
+            logger.exception("Bulk import %s failed", job.id)
+            job.status, job.error = FAILED, str(exc)
+            for item in job.items:
+                if item.status == "pending":
+                    self._fail(item, "import aborted")
+        finally:
+            for upload in uploads:
+                upload.close()
+            job.finished_at = time.time()
+        logger.info(
+            "Bulk import %s: %s/%s files imported in %.1fs",
+            job.id,
+            job.succeeded,
+            len(job.items),
+            time.perf_counter() - started,
+        )
+
+    def _process_batch(
+        self,
+        job: ImportJob,
+        batch: List[Tuple[int, AttachmentBlob]],
+        uploads: Sequence[AttachmentBlob],
+    ) -> None:
+        try:
+            extractions = [
+                (position, blob, self._pool.submit(self._extract, blob)) for position, blob in batch
+            ]
+            parsed: List[Tuple[int, AttachmentBlob, AttachmentResult]] = []
+            for position, blob, future in extractions:
+                try:
+                    parsed.append((position, blob, future.result()))
+                except Exception as exc:
+                    self._fail(job.items[position], f"extraction failed: {exc}")
+            if not parsed:
+                return
+            try:
+                records = self.parsing_service.parse_many(
+                    [("", [result]) for _, _, result in parsed],
+                    source=self.source,
+                    batch_size=self.batch_size,
+                )
+                self.storage_service.append_new_candidates(records)
+            except Exception as exc:
+                # Only this batch is lost; later batches still run.
+                logger.exception("Bulk import %s: batch of %s files failed", job.id, len(parsed))
+                for position, _, _ in parsed:
+                    self._fail(job.items[position], f"import failed: {exc}")
+                return
+            archives: List[Future] = [
+                self._pool.submit(self.storage_service.archive_attachment, blob)
+                for _, blob, _ in parsed
+            ]
+            for (position, _, _), record, archive in zip(parsed, records, archives):
+                try:
+                    location = archive.result()
+                except Exception:
+                    # The candidate is already stored; it is only missing its archived file.
+                    logger.exception(
+                        "Bulk import %s: archiving %s failed", job.id, record.candidate_id
+                    )
+                    location = None
+                self.storage_service.record_ingested(record, [location] if location else [])
+                self._succeed(job.items[position], record)
+        finally:
+            for _, blob in batch:
+                if blob not in uploads:
+                    blob.close()
+
+    def _extract(self, blob: AttachmentBlob) -> AttachmentResult:
+        (result,) = self.parsing_service.ocr_service.extract_from_attachments([blob])
+        return result
+
+    @staticmethod
+    def _succeed(item: ImportItem, record: CandidateRecord) -> None:
+        item.status, item.candidate_id, item.full_name = (
+            "succeeded",
+            record.candidate_id,
+            record.full_name,
+        )
+
+    @staticmethod
+    def _fail(item: ImportItem, error: str) -> None:
+        item.status, item.error = "failed", error
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        for import_id in [
+            key for key, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff
+        ]:
+            del self._jobs[import_id]
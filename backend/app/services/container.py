@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, TypeVar
+
+from ..core.config import Settings
+from ..repositories.audit_repository import AuditRepository
+from ..repositories.base import CandidateRepository
+from ..repositories.drive_repository import DriveRepository
+from ..repositories.message_dedup import MessageDedupStore
+from ..repositories.sheets_mirror import SheetsMirrorExporter
+from ..repositories.sheets_repository import SheetsRepository
+from ..repositories.sqlite_repository import SQLiteCandidateRepository
+from ..utils.extraction_cache import ExtractionCache
+from ..workers.job_queue import JobQueue
+from ..workers.runner import JobWorker
+from ..workers.tasks import build_handlers
+from .auth_service import AuthService
+from .blocking_executor import BlockingExecutor
+from .bulk_import import BulkImportService
+from .event_hub import EventHub
+from .ingestion_service import IngestionService
+from .nlp_registry import NLPModelRegistry
+from .ocr_pool import OCRPool
+from .ocr_service import OCRService
+from .parsing_service import ParsingService
+from .storage_service import StorageService
+from .whatsapp_service import WhatsAppService
+
+logger = logging.getLogger("smarthire.container")
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """
+    Application-scoped owner of repositories and services.
+
+    Instances are created once (eagerly in ``startup`` or lazily on first
+    access) and shared by every request. ``shutdown`` releases network clients
+    in reverse construction order. Tests can swap any member via ``override``.
+    """
+
+    def __init__(self, settings: Settings, nlp_registry: NLPModelRegistry | None = None) -> None:
+        self.settings = settings
+        self.nlp_registry = nlp_registry or NLPModelRegistry(
+            settings.spacy_model, fallback_model=settings.spacy_fallback_model
+        )
+        self._instances: Dict[str, Any] = {}
+        self._build_order: List[str] = []
+        self._lock = threading.RLock()
+
+    # Lifecycle -----------------------------------------------------------------
+
+    def startup(self) -> None:
+        if self.settings.nlp_warm_on_startup:
+            try:
+                self.nlp_registry.warm()
+            except OSError as exc:
+                logger.error("spaCy model warm-up failed: %s", exc)
+        # Touch the top-level services so every dependency is built before traffic.
+        self.auth_service
+        self.whatsapp_service
+        if self.settings.storage_mode == "sqlite" and self.settings.sqlite_mirror_to_sheets:
+            self.sheets_mirror
+        if self.settings.job_worker_embedded:
+            self.job_worker.start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            names = list(reversed(self._build_order))
+            instances = [self._instances[name] for name in names]
+            self._instances.clear()
+            self._build_order.clear()
+        for name, instance in zip(names, instances):
+            close = getattr(instance, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception as exc:  # pragma: no cover - best effort teardown
+                logger.warning("Failed to close %s: %s", name, exc)
+
+    def override(self, name: str, instance: Any) -> None:
+        with self._lock:
+            if name not in self._instances:
+                self._build_order.append(name)
+            self._instances[name] = instance
+
+    # Members -------------------------------------------------------------------
+
+    @property
+    def sheets_repository(self) -> SheetsRepository:
+        return self._resolve("sheets_repository", lambda: SheetsRepository(settings=self.settings))
+
+    @property
+    def candidate_repository(self) -> CandidateRepository:
+        if self.settings.storage_mode == "sqlite":
+            return self._resolve(
+                "candidate_repository", lambda: SQLiteCandidateRepository(settings=self.settings)
+            )
+        return self.sheets_repository
+
+    @property
+    def sheets_mirror(self) -> SheetsMirrorExporter | None:
+        return self._resolve("sheets_mirror", self._build_sheets_mirror)
+
+    @property
+    def drive_repository(self) -> DriveRepository:
+        return self._resolve("drive_repository", lambda: DriveRepository(settings=self.settings))
+
+    @property
+    def audit_repository(self) -> AuditRepository:
+        return self._resolve("audit_repository", AuditRepository)
+
+    @property
+    def event_hub(self) -> EventHub:
+        return self._resolve(
+            "event_hub", lambda: EventHub(queue_size=self.settings.event_stream_queue_size)
+        )
+
+    @property
+    def auth_service(self) -> AuthService:
+        return self._resolve("auth_service", lambda: AuthService(settings=self.settings))
+
+    @property
+    def parsing_service(self) -> ParsingService:
+        return self._resolve(
+            "parsing_service",
+            lambda: ParsingService(
+                settings=self.settings,
+                ocr_service=self.ocr_service,
+                nlp_registry=self.nlp_registry,
+            ),
+        )
+
+    @property
+    def ocr_service(self) -> OCRService:
+        return self._resolve(
+            "ocr_service",
+            lambda: OCRService(
+                settings=self.settings, cache=self.extraction_cache, pool=self.ocr_pool
+            ),
+        )
+
+    @property
+    def ocr_pool(self) -> OCRPool:
+        return self._resolve(
+            "ocr_pool",
+            lambda: OCRPool(
+                workers=self.settings.ocr_pool_workers,
+                max_pages=self.settings.ocr_max_pages,
+                max_dpi=self.settings.ocr_max_dpi,
+                min_dpi=self.settings.ocr_min_dpi,
+                max_page_pixels=self.settings.ocr_max_page_pixels,
+            ),
+        )
+
+    @property
+    def extraction_cache(self) -> ExtractionCache | None:
+        return self._resolve("extraction_cache", self._build_extraction_cache)
+
+    @property
+    def storage_service(self) -> StorageService:
+        return self._resolve(
+            "storage_service",
+            lambda: StorageService(
+                candidate_repository=self.candidate_repository,
+                drive_repository=self.drive_repository,
+                audit_repository=self.audit_repository,
+                settings=self.settings,
+                event_hub=self.event_hub,
+            ),
+        )
+
+    @property
+    def ingestion_service(self) -> IngestionService:
+        return self._resolve(
+            "ingestion_service",
+            lambda: IngestionService(
+                parsing_service=self.parsing_service,
+                storage_service=self.storage_service,
+                stage_limits={
+                    "extract": self.settings.ingest_extract_concurrency,
+                    "parse": self.settings.ingest_parse_concurrency,
+                    "append": self.settings.ingest_append_concurrency,
+                    "archive": self.settings.ingest_archive_concurrency,
+                },
+                media_max_bytes=self.settings.media_max_bytes,
+            ),
+        )
+
+    @property
+    def bulk_import(self) -> BulkImportService:
+        return self._resolve(
+            "bulk_import",
+            lambda: BulkImportService(
+                parsing_service=self.parsing_service,
+                storage_service=self.storage_service,
+                workers=self.settings.bulk_import_workers,
+                batch_size=self.settings.bulk_import_batch_size,
+                max_files=self.settings.bulk_import_max_files,
+                max_file_bytes=self.settings.media_max_bytes,
+                spool_threshold=self.settings.attachment_spool_threshold_bytes,
+            ),
+        )
+
+    @property
+    def blocking_executor(self) -> BlockingExecutor:
+        return self._resolve(
+            "blocking_executor",
+            lambda: BlockingExecutor(
+                stages={
+                    "ingest": (
+                        self.settings.ingest_executor_concurrency,
+                        self.settings.ingest_executor_queue_size,
+                    ),
+                },
+                default_retry_after=self.settings.executor_retry_after_seconds,
+            ),
+        )
+
+    @property
+    def whatsapp_service(self) -> WhatsAppService:
+        return self._resolve(
+            "whatsapp_service",
+            lambda: WhatsAppService(
+                settings=self.settings,
+                ingestion_service=self.ingestion_service,
+                dedup_store=self.message_dedup,
+            ),
+        )
+
+    @property
+    def message_dedup(self) -> MessageDedupStore:
+        return self._resolve(
+            "message_dedup",
+            lambda: MessageDedupStore(
+                db_path=Path(__file__).resolve().parents[3] / self.settings.message_dedup_path,
+                ttl_seconds=self.settings.message_dedup_ttl_seconds,
+                processing_timeout=self.settings.job_lease_seconds,
+                cache_size=self.settings.message_dedup_cache_size,
+            ),
+        )
+
+    @property
+    def job_queue(self) -> JobQueue:
+        return self._resolve(
+            "job_queue",
+            lambda: JobQueue(
+                db_path=Path(__file__).resolve().parents[3] / self.settings.job_queue_path,
+                max_attempts=self.settings.job_max_attempts,
+                retry_base_seconds=self.settings.job_retry_base_seconds,
+            ),
+        )
+
+    @property
+    def job_worker(self) -> JobWorker:
+        return self._resolve("job_worker", self._build_job_worker)
+
+    def _build_job_worker(self) -> JobWorker:
+        return JobWorker(
+            queue=self.job_queue,
+            handlers=build_handlers(self),
+            concurrency=self.settings.job_worker_concurrency,
+            lease_seconds=self.settings.job_lease_seconds,
+            retention_seconds=self.settings.job_retention_seconds,
+        )
+
+    def _build_extraction_cache(self) -> ExtractionCache | None:
+        if not self.settings.extraction_cache_enabled:
+            return None
+        return ExtractionCache(
+            directory=Path(__file__).resolve().parents[3] / self.settings.extraction_cache_dir,
+            max_bytes=self.settings.extraction_cache_max_bytes,
+            memory_entries=self.settings.extraction_cache_memory_entries,
+            rescan_seconds=self.settings.extraction_cache_rescan_seconds,
+        )
+
+    def _build_sheets_mirror(self) -> SheetsMirrorExporter | None:
+        source = self.candidate_repository
+        if not isinstance(source, SQLiteCandidateRepository):
+            return None
+        if not self.sheets_repository.uses_google_sheets:
+            logger.warning(
+                "Sheets mirror enabled but Google Sheets is not configured; mirror disabled."
+            )
+            return None
+        mirror = SheetsMirrorExporter(
+            source=source,
+            target=self.sheets_repository,
+            interval=self.settings.sqlite_mirror_interval_seconds,
+            batch_size=self.settings.sqlite_mirror_batch_size,
+        )
+        mirror.start()
+        return mirror
+
+    def _resolve(self, name: str, factory: Callable[[], T]) -> T:
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+                self._build_order.append(name)
+            return self._instances[name]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger("smarthire.events")
+
+
+@dataclass(frozen=True)
+class HubEvent:
+    event: str
+    data: Dict[str, Any]
+    id: Optional[str] = None
+
+    def encode(self) -> str:
+        """Render as one server-sent events frame."""
+
+        lines = [f"event: {self.event}"]
+        if self.id is not None:
+            lines.append(f"id: {self.id}")
+        lines.append(f"data: {json.dumps(self.data, separators=(',', ':'))}")
+        return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    """One subscriber's bounded queue, owned by the event loop that created it."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[HubEvent]]" = asyncio.Queue(maxsize=maxsize + 1)
+        self._maxsize = maxsize
+        self.dropped = False
+        self._closed = False
+
+    async def get(self) -> Optional[HubEvent]:
+        """Next event, or ``None`` once the subscription was closed or dropped."""
+
+        return await self._queue.get()
+
+    def _offer(self, event: Optional[HubEvent]) -> None:
+        if self.dropped or self._closed:
+            return
+        if event is not None and self._queue.qsize() >= self._maxsize:
+            # Slow consumer: discard its backlog and end the stream; clients reconnect and resync.
+            self.dropped = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            event = None
+        self._closed = event is None
+        self._queue.put_nowait(event)
+
+    def _deliver(self, event: Optional[HubEvent]) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._offer, event)
+        except RuntimeError:  # pragma: no cover - loop already closed
+            self.dropped = True
+
+
+class EventHub:
+    """
+    In-process publish/subscribe hub for candidate events.
+
+    ``publish`` may be called from any thread (request handlers, worker
+    threads); delivery is marshalled onto each subscriber's event loop. Every
+    subscriber has a bounded queue and is disconnected instead of buffering
+    without limit when it falls behind.
+    """
+
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = max(queue_size, 1)
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+            if subscription.dropped:
+                self.dropped_subscribers += 1
+
+    def publish(self, event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> None:
+        message = HubEvent(event=event, data=data, id=event_id)
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        for subscription in subscribers:
+            subscription._deliver(message)
+
+    def close(self) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        for subscription in subscribers:
+            subscription._deliver(None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "dropped_subscribers": self.dropped_subscribers,
+            }
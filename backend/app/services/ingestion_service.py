@@ -1,51 +1,162 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Iterable, List, Optional, Tuple
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from ..models.request_models import AttachmentPayload
 from ..models.response_models import CandidateRecord
-from ..utils import file_utils
+from ..utils.attachment_blob import AttachmentBlob
+from .ocr_service import AttachmentResult
 from .parsing_service import ParsingService
 from .storage_service import StorageService
 
 logger = logging.getLogger("smarthire.ingestion")
 
+T = TypeVar("T")
+
+# Stages of ``ingest_payload_async`` and how many calls of each may run at once.
+DEFAULT_STAGE_LIMITS: Dict[str, int] = {"extract": 4, "parse": 2, "append": 2, "archive": 4}
+
 
 class IngestionService:
-    def __init__(self, parsing_service: ParsingService, storage_service: StorageService) -> None:
+    def __init__(
+        self,
+        parsing_service: ParsingService,
+        storage_service: StorageService,
+        stage_limits: Mapping[str, int] | None = None,
+        media_max_bytes: Optional[int] = None,
+    ) -> None:
         self.parsing_service = parsing_service
         self.storage_service = storage_service
+        self.media_max_bytes = media_max_bytes
+        self.stage_limits = {**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+        # asyncio semaphores are bound to one event loop, so keep a set per loop.
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def ingest_payload(
         self,
         source: str,
         body: str,
-        attachments: Optional[List[AttachmentPayload]] = None,
+        attachments: Optional[Sequence[AttachmentPayload | AttachmentBlob]] = None,
+    ) -> CandidateRecord:
+        """
+        Parse and store one submission.
+
+        Request payloads are decoded or downloaded once into ``AttachmentBlob``s
+        that OCR and archival share; blobs passed in by the caller stay owned by
+        the caller.
+        """
+
+        owned: List[AttachmentBlob] = []
+        blobs: List[AttachmentBlob] = []
+        try:
+            for attachment in attachments or []:
+                blob = self._as_blob(attachment, owned)
+                if blob is not None:
+                    blobs.append(blob)
+            record = self.parsing_service.parse_payload(body=body, attachments=blobs, source=source)
+            return self.storage_service.persist_candidate(record, attachments=blobs)
+        finally:
+            for blob in owned:
+                blob.close()
+
+    async def ingest_payload_async(
+        self,
+        source: str,
+        body: str,
+        attachments: Optional[Sequence[AttachmentPayload | AttachmentBlob]] = None,
     ) -> CandidateRecord:
-        record = self.parsing_service.parse_payload(body=body, attachments=attachments, source=source)
-        attachment_data = list(self._materialize_attachments(attachments or []))
-        return self.storage_service.persist_candidate(record, attachments=attachment_data)
-
-    def _materialize_attachments(
-        self, attachments: Iterable[AttachmentPayload]
-    ) -> Iterable[Tuple[str, bytes, str]]:
-        for attachment in attachments:
-            if attachment.content:
-                path = file_utils.write_base64_to_temp(attachment.content, attachment.filename)
-            elif attachment.url:
-                path = file_utils.download_to_temp(attachment.url, attachment.filename)
-            else:
-                continue
-            try:
-                data = path.read_bytes()
-                yield (
-                    attachment.filename or path.name,
-                    data,
-                    attachment.content_type or "application/octet-stream",
-                )
-            finally:
-                try:
-                    path.unlink(missing_ok=True)
-                except Exception:  # pragma: no cover - best effort cleanup
-                    logger.debug("Attachment temp cleanup failed for %s", path)
+        """
+        ``ingest_payload`` with independent work overlapped.
+
+        Attachments are fetched and extracted concurrently, and Drive archival
+        runs alongside the candidate append, so a message with several files
+        takes roughly as long as its slowest stage. Each stage runs in worker
+        threads behind its own semaphore (``stage_limits``).
+        """
+
+        owned: List[AttachmentBlob] = []
+        try:
+            extracted = await _gather_all(
+                self._run_stage("extract", self._extract_one, attachment, owned)
+                for attachment in attachments or []
+            )
+            pairs = [pair for pair in extracted if pair is not None]
+            record = await self._run_stage(
+                "parse",
+                self.parsing_service.parse_extracted,
+                body,
+                [result for _, result in pairs],
+                source,
+            )
+            record, *locations = await _gather_all(
+                [self._run_stage("append", self.storage_service.append_new_candidate, record)]
+                + [
+                    self._run_stage("archive", self.storage_service.archive_attachment, blob)
+                    for blob, _ in pairs
+                ]
+            )
+            stored = [location for location in locations if location]
+            await asyncio.to_thread(self.storage_service.record_ingested, record, stored)
+            return record
+        finally:
+            for blob in owned:
+                blob.close()
+
+    def _extract_one(
+        self, attachment: AttachmentPayload | AttachmentBlob, owned: List[AttachmentBlob]
+    ) -> Optional[tuple[AttachmentBlob, AttachmentResult]]:
+        blob = self._as_blob(attachment, owned)
+        if blob is None:
+            return None
+        (result,) = self.parsing_service.ocr_service.extract_from_attachments([blob])
+        return blob, result
+
+    def _as_blob(
+        self, attachment: AttachmentPayload | AttachmentBlob, owned: List[AttachmentBlob]
+    ) -> Optional[AttachmentBlob]:
+        if isinstance(attachment, AttachmentBlob):
+            return attachment
+        blob = AttachmentBlob.from_payload(attachment, max_bytes=self.media_max_bytes)
+        if blob is not None:
+            owned.append(blob)
+        return blob
+
+    async def _run_stage(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        async with self._semaphore(stage):
+            return await asyncio.to_thread(func, *args)
+
+    def _semaphore(self, stage: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = {
+                name: asyncio.Semaphore(max(limit, 1)) for name, limit in self.stage_limits.items()
+            }
+            self._semaphores[loop] = semaphores
+        return semaphores[stage]
+
+
+async def _gather_all(awaitables: Iterable[Awaitable[T]]) -> List[T]:
+    """Like ``asyncio.gather`` but waits for every call before raising, so no thread outlives cleanup."""
+
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils import attachment_blob
+from ..utils.attachment_blob import DEFAULT_SPOOL_THRESHOLD, RETRYABLE_STATUSES, AttachmentBlob
+from ..utils.file_utils import FileDownloadError, TransientDownloadError
+
+logger = logging.getLogger("smarthire.media")
+
+
+@dataclass(frozen=True)
+class MediaRequest:
+    url: str
+    filename: str
+    content_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DownloadTiming:
+    host: str
+    seconds: float
+    size: int
+    ok: bool
+
+
+def build_session(per_host_connections: int = 4, retries: int = 2) -> requests.Session:
+    """A keep-alive session whose adapter caps (and blocks on) connections per host."""
+
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=max(per_host_connections, 1),
+        pool_block=True,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=RETRYABLE_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class MediaFetcher:
+    """
+    Downloads all media of a message concurrently over one pooled session.
+
+    Connections are reused across messages (one TLS handshake per host and
+    pooled connection instead of one per file), at most ``concurrency``
+    downloads run at once and at most ``per_host_connections`` hit one host.
+    Each download streams into an ``AttachmentBlob`` (spooled to disk past
+    ``spool_threshold``) and is aborted once it exceeds ``max_bytes``.
+
+    Permanent failures (a missing file, an oversized one) are logged and
+    skipped; transient ones (timeouts, connection errors, 429/5xx) raise so
+    the calling job fails and is retried instead of losing the attachment.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        per_host_connections: int = 4,
+        timeout: float = 30,
+        max_bytes: Optional[int] = 25 * 1024 * 1024,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        auth: Optional[Tuple[str, str]] = None,
+        session: Optional[requests.Session] = None,
+        history_size: int = 256,
+    ) -> None:
+        self.concurrency = max(concurrency, 1)
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.spool_threshold = spool_threshold
+        self.auth = auth
+        self.session = session or build_session(per_host_connections)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="media-fetch"
+        )
+        self._lock = threading.Lock()
+        self._timings: Deque[DownloadTiming] = deque(maxlen=max(history_size, 1))
+        self.downloads = 0
+        self.failures = 0
+        self.bytes_fetched = 0
+
+    def fetch_all(self, items: Sequence[MediaRequest]) -> List[Optional[AttachmentBlob]]:
+        """
+        Fetch every item in parallel; permanently failed items come back as ``None``.
+
+        If any fetch raises, the blobs that did arrive are closed before the
+        first error is re-raised, so no temp file outlives the failed message.
+        """
+
+        if len(items) <= 1:
+            return [self.fetch(item) for item in items]
+        futures = [self._executor.submit(self.fetch, item) for item in items]
+        blobs: List[Optional[AttachmentBlob]] = []
+        error: Optional[BaseException] = None
+        for future in futures:
+            try:
+                blobs.append(future.result())
+            except BaseException as exc:
+                error = error or exc
+        if error is not None:
+            for blob in blobs:
+                if blob is not None:
+                    blob.close()
+            raise error
+        return blobs
+
+    def fetch(self, item: MediaRequest) -> Optional[AttachmentBlob]:
+        """Download one item; ``None`` if it is permanently unavailable, raises if worth retrying."""
+
+        started = time.perf_counter()
+        blob: Optional[AttachmentBlob] = None
+        try:
+            blob = attachment_blob.download(
+                item.url,
+                filename=item.filename,
+                content_type=item.content_type,
+                session=self.session,
+                auth=self.auth,
+                spool_threshold=self.spool_threshold,
+                max_bytes=self.max_bytes,
+                timeout=self.timeout,
+            )
+        except (TransientDownloadError, requests.RequestException) as exc:
+            logger.warning("Transient failure fetching media %s: %s", item.filename, exc)
+            raise
+        except FileDownloadError as exc:
+            logger.warning("Skipping media %s: %s", item.filename, exc)
+        finally:
+            self._record(item.url, time.perf_counter() - started, blob)
+        return blob
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            timings = sorted(timing.seconds for timing in self._timings if timing.ok)
+            hosts: Dict[str, int] = {}
+            for timing in self._timings:
+                hosts[timing.host] = hosts.get(timing.host, 0) + 1
+            return {
+                "concurrency": self.concurrency,
+                "downloads": self.downloads,
+                "failures": self.failures,
+                "bytes": self.bytes_fetched,
+                "avg_seconds": round(sum(timings) / len(timings), 4) if timings else 0.0,
+                "p95_seconds": round(timings[int(0.95 * (len(timings) - 1))], 4)
+                if timings
+                else 0.0,
+                "recent_by_host": hosts,
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _record(self, url: str, seconds: float, blob: Optional[AttachmentBlob]) -> None:
+        size = blob.size if blob is not None else 0
+        timing = DownloadTiming(
+            host=urlsplit(url).hostname or "", seconds=seconds, size=size, ok=blob is not None
+        )
+        logger.info(
+            "Media download %s from %s in %.3fs (%s bytes)",
+            "succeeded" if timing.ok else "failed",
+            timing.host,
+            timing.seconds,
+            timing.size,
+        )
+        with self._lock:
+            self._timings.append(timing)
+            self.downloads += 1
+            self.failures += int(not timing.ok)
+            self.bytes_fetched += timing.size
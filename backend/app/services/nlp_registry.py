@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import spacy
+from spacy.language import Language
+
+from ..core.config import get_settings
+from ..utils.process_metrics import current_rss_bytes
+
+logger = logging.getLogger("smarthire.nlp")
+
+# ParsingService only reads ``doc.ents``; everything else in the trained pipelines
+# is dead weight. ``tok2vec`` is kept because some pipelines share it with ``ner``.
+UNUSED_COMPONENTS = (
+    "tagger",
+    "parser",
+    "attribute_ruler",
+    "lemmatizer",
+    "senter",
+    "morphologizer",
+)
+
+
+@dataclass
+class ModelLoadStats:
+    model_name: str
+    pipeline: list[str]
+    load_seconds: float
+    rss_delta_bytes: int
+    rss_after_bytes: int
+    loaded_at: float
+
+
+class NLPModelRegistry:
+    """
+    Process-wide holder for the spaCy pipeline used by ``ParsingService``.
+
+    The model is loaded lazily on first use (or eagerly via ``warm``) and shared
+    by every parsing call in the process. ``reload`` swaps in a different model
+    without interrupting in-flight requests, which keep the old reference.
+    """
+
+    def __init__(self, model_name: str, fallback_model: Optional[str] = None) -> None:
+        self.model_name = model_name
+        self.fallback_model = fallback_model
+        self._nlp: Optional[Language] = None
+        self._stats: Optional[ModelLoadStats] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Language:
+        nlp = self._nlp
+        if nlp is not None:
+            return nlp
+        with self._lock:
+            if self._nlp is None:
+                self._nlp, self._stats = self._load(self.model_name, self.fallback_model)
+            return self._nlp
+
+    def warm(self) -> ModelLoadStats:
+        self.get()
+        assert self._stats is not None
+        return self._stats
+
+    def reload(self, model_name: Optional[str] = None) -> ModelLoadStats:
+        target = model_name or self.model_name
+        # Load outside the lock so readers keep using the current model meanwhile.
+        nlp, stats = self._load(target, None if model_name else self.fallback_model)
+        with self._lock:
+            self._nlp, self._stats = nlp, stats
+            self.model_name = target
+        return stats
+
+    def is_loaded(self) -> bool:
+        return self._nlp is not None
+
+    def stats(self) -> Optional[ModelLoadStats]:
+        return self._stats
+
+    @staticmethod
+    def _load(model_name: str, fallback_model: Optional[str]) -> tuple[Language, ModelLoadStats]:
+        rss_before = current_rss_bytes()
+        started = time.perf_counter()
+        try:
+            nlp = spacy.load(model_name, exclude=list(UNUSED_COMPONENTS))
+            loaded_name = model_name
+        except OSError:
+            if not fallback_model:
+                raise
+            logger.warning(
+                "spaCy model %s not available; falling back to %s.", model_name, fallback_model
+            )
+            nlp = spacy.load(fallback_model, exclude=list(UNUSED_COMPONENTS))
+            loaded_name = fallback_model
+        elapsed = time.perf_counter() - started
+        rss_after = current_rss_bytes()
+        stats = ModelLoadStats(
+            model_name=loaded_name,
+            pipeline=list(nlp.pipe_names),
+            load_seconds=round(elapsed, 3),
+            rss_delta_bytes=max(rss_after - rss_before, 0),
+            rss_after_bytes=rss_after,
+            loaded_at=time.time(),
+        )
+        logger.info(
+            "Loaded spaCy model %s in %.2fs (pipeline=%s, rss_delta=%.1f MiB).",
+            loaded_name,
+            elapsed,
+            ",".join(stats.pipeline),
+            stats.rss_delta_bytes / (1024 * 1024),
+        )
+        return nlp, stats
+
+
+@lru_cache()
+def get_nlp_registry() -> NLPModelRegistry:
+    settings = get_settings()
+    return NLPModelRegistry(settings.spacy_model, fallback_model=settings.spacy_fallback_model)
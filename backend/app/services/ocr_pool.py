@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pytesseract
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
+
+from ..utils import text_cleaning
+from ..utils.process_metrics import current_rss_bytes
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # pragma: no cover - optional dependency
+    fitz = None  # type: ignore
+
+logger = logging.getLogger("smarthire.ocr.pool")
+
+TESSERACT_CONFIG = "--oem 3 --psm 6"
+LETTER_POINTS = (612.0, 792.0)
+
+
+@dataclass
+class PageOutcome:
+    page_number: int
+    text: str
+    seconds: float
+    rss_bytes: int = 0
+
+
+@dataclass
+class DocumentOCRResult:
+    text: str
+    pages_total: int
+    pages_done: int
+    timed_out: bool
+    seconds: float
+    pages_skipped: int = 0
+    peak_rss_bytes: int = 0
+    page_texts: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def partial(self) -> bool:
+        """The budget ran out or a page failed, so a retry could recognize more text."""
+
+        return self.timed_out or self.pages_done < self.pages_total - self.pages_skipped
+
+
+def ocr_pdf_page(path: str, page_number: int, dpi: int) -> PageOutcome:
+    """Render a single PDF page and recognize it; runs inside a pool worker."""
+
+    started = time.perf_counter()
+    image = _render_page(path, page_number, dpi)
+    try:
+        # The rendered page is the largest allocation; sample RSS while it is alive.
+        rss_bytes = current_rss_bytes()
+        text = text_cleaning.strip_non_printable(
+            pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+        )
+    finally:
+        image.close()
+    return PageOutcome(
+        page_number=page_number,
+        text=text,
+        seconds=time.perf_counter() - started,
+        rss_bytes=rss_bytes,
+    )
+
+
+def _render_page(path: str, page_number: int, dpi: int) -> Image.Image:
+    if fitz is not None:
+        with fitz.open(path) as document:
+            pixmap = document[page_number - 1].get_pixmap(
+                dpi=dpi, colorspace=fitz.csGRAY, alpha=False
+            )
+            return Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+    images = convert_from_path(
+        path,
+        dpi=dpi,
+        fmt="png",
+        first_page=page_number,
+        last_page=page_number,
+        thread_count=1,
+        grayscale=True,
+    )
+    return images[0]
+
+
+def pdf_page_sizes(path: Path) -> List[Tuple[float, float]]:
+    """Width and height in points of every page (PyMuPDF), or of the first page repeated (pdfinfo)."""
+
+    if fitz is not None:
+        try:
+            with fitz.open(path) as document:
+                return [(page.rect.width, page.rect.height) for page in document]
+        except Exception as exc:
+            logger.debug("PyMuPDF could not read page sizes of %s: %s", path.name, exc)
+    info = pdfinfo_from_path(str(path))
+    size = LETTER_POINTS
+    try:
+        width, _, height = str(info.get("Page size", "")).split()[:3]
+        size = (float(width), float(height))
+    except ValueError:
+        pass
+    return [size] * int(info["Pages"])
+
+
+def adaptive_dpi(
+    width_pt: float, height_pt: float, max_dpi: int, min_dpi: int, max_pixels: int
+) -> int:
+    """Highest DPI up to ``max_dpi`` that keeps the rendered page under ``max_pixels``."""
+
+    area_square_inches = max(width_pt / 72.0, 0.01) * max(height_pt / 72.0, 0.01)
+    fitted = int(math.sqrt(max_pixels / area_square_inches))
+    return max(min(max_dpi, fitted), min(min_dpi, max_dpi))
+
+
+PageWorker = Callable[[str, int, int], PageOutcome]
+
+
+class OCRPool:
+    """
+    Process pool for page-level OCR, shared by every request.
+
+    ``recognize_pdf`` keeps at most ``workers`` pages of one document in
+    flight, so only that many rendered pages exist at once, and stops
+    submitting pages once the document's time budget is spent (pages already
+    running finish in the background and are discarded). With ``workers=0``
+    pages are recognized one after another in the calling thread.
+
+    Only the first ``max_pages`` pages are recognized, and each page is
+    rendered at the highest DPI (up to ``max_dpi``) that keeps it under
+    ``max_page_pixels``, so oversized pages cannot blow up worker memory.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        page_worker: PageWorker = ocr_pdf_page,
+        start_method: str = "spawn",
+        max_pages: int = 20,
+        max_dpi: int = 300,
+        min_dpi: int = 150,
+        max_page_pixels: int = 12_000_000,
+    ) -> None:
+        self.workers = max(workers, 0)
+        self.page_worker = page_worker
+        self.start_method = start_method
+        self.max_pages = max(max_pages, 1)
+        self.max_dpi = max_dpi
+        self.min_dpi = min_dpi
+        self.max_page_pixels = max_page_pixels
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._started_at: Optional[float] = None
+        self._in_flight = 0
+        self._busy_seconds = 0.0
+        self.documents = 0
+        self.pages = 0
+        self.page_failures = 0
+        self.timeouts = 0
+        self.truncated_documents = 0
+        self.max_document_rss_bytes = 0
+
+    def recognize_pdf(
+        self, path: Path, budget_seconds: float, page_numbers: Optional[Sequence[int]] = None
+    ) -> DocumentOCRResult:
+        """OCR the given 1-based pages (all pages by default) in page order."""
+
+        started = time.monotonic()
+        deadline = started + budget_seconds
+        sizes = pdf_page_sizes(path)
+        selected = list(range(1, len(sizes) + 1))
+        if page_numbers is not None:
+            selected = sorted({number for number in page_numbers if 1 <= number <= len(sizes)})
+        page_count = len(selected)
+        if page_count > self.max_pages:
+            logger.warning(
+                "%s needs OCR on %s pages; recognizing only the first %s",
+                path.name,
+                page_count,
+                self.max_pages,
+            )
+        jobs = [
+            (
+                number,
+                adaptive_dpi(*sizes[number - 1], self.max_dpi, self.min_dpi, self.max_page_pixels),
+            )
+            for number in selected[: self.max_pages]
+        ]
+        outcomes: Dict[int, PageOutcome] = {}
+        timed_out = False
+        if self.workers == 0:
+            for page_number, dpi in jobs:
+                if time.monotonic() >= deadline:
+                    timed_out = True
+                    break
+                self._collect(
+                    outcomes, lambda: self.page_worker(str(path), page_number, dpi), page_number
+                )
+        else:
+            timed_out = self._recognize_parallel(path, jobs, deadline, outcomes)
+        peak_rss = max((outcome.rss_bytes for outcome in outcomes.values()), default=0)
+        with self._lock:
+            self.documents += 1
+            self.timeouts += int(timed_out)
+            self.truncated_documents += int(page_count > self.max_pages)
+            self.max_document_rss_bytes = max(self.max_document_rss_bytes, peak_rss)
+        if timed_out:
+            logger.warning(
+                "OCR budget of %.0fs exhausted for %s after %s/%s pages",
+                budget_seconds,
+                path.name,
+                len(outcomes),
+                page_count,
+            )
+        return DocumentOCRResult(
+            text="\n".join(outcomes[number].text for number in sorted(outcomes)),
+            pages_total=page_count,
+            pages_done=len(outcomes),
+            timed_out=timed_out,
+            seconds=time.monotonic() - started,
+            pages_skipped=max(page_count - self.max_pages, 0),
+            peak_rss_bytes=peak_rss,
+            page_texts={number: outcome.text for number, outcome in outcomes.items()},
+        )
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+            capacity = uptime * max(self.workers, 1)
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "utilization": round(self._busy_seconds / capacity, 4) if capacity else 0.0,
+                "busy_seconds": round(self._busy_seconds, 3),
+                "documents": self.documents,
+                "pages": self.pages,
+                "page_failures": self.page_failures,
+                "timeouts": self.timeouts,
+                "truncated_documents": self.truncated_documents,
+                "max_document_rss_bytes": self.max_document_rss_bytes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recognize_parallel(
+        self,
+        path: Path,
+        jobs: List[Tuple[int, int]],
+        deadline: float,
+        outcomes: Dict[int, PageOutcome],
+    ) -> bool:
+        executor = self._ensure_executor()
+        pending: Dict[Future, int] = {}
+        queue = list(reversed(jobs))
+        try:
+            while queue or pending:
+                while queue and len(pending) < self.workers:
+                    page_number, dpi = queue.pop()
+                    pending[
+                        executor.submit(self.page_worker, str(path), page_number, dpi)
+                    ] = page_number
+                    self._track_in_flight(1)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True
+                done, _ = wait(list(pending), timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_number = pending.pop(future)
+                    self._track_in_flight(-1)
+                    self._collect(outcomes, future.result, page_number)
+            return False
+        finally:
+            for future in pending:
+                future.cancel()
+                future.add_done_callback(lambda _: self._track_in_flight(-1))
+
+    def _collect(
+        self, outcomes: Dict[int, PageOutcome], run: Callable[[], PageOutcome], page_number: int
+    ) -> None:
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+        try:
+            outcome = run()
+        except Exception as exc:
+            logger.warning("OCR failed for page %s: %s", page_number, exc)
+            with self._lock:
+                self.page_failures += 1
+                if isinstance(exc, BrokenProcessPool):
+                    self._executor = None  # a worker died; start a fresh pool next time
+            return
+        outcomes[outcome.page_number] = outcome
+        with self._lock:
+            self.pages += 1
+            self._busy_seconds += outcome.seconds
+
+    def _track_in_flight(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+                self._started_at = self._started_at or time.monotonic()
+            return self._executor
@@ -3,18 +3,23 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
-from pdf2image import convert_from_path
-from PIL import Image
 import pytesseract
+from PIL import Image
 
 from ..core.config import Settings, get_settings
 from ..models.request_models import AttachmentPayload
-from ..utils import file_utils, resume_extractors, text_cleaning
+from ..utils import resume_extractors, text_cleaning
+from ..utils.attachment_blob import AttachmentBlob
+from ..utils.extraction_cache import CachedExtraction, ExtractionCache
+from .ocr_pool import TESSERACT_CONFIG, DocumentOCRResult, OCRPool
 
 logger = logging.getLogger("smarthire.ocr")
 
+# Bump whenever extraction output changes so cached results are not reused.
+EXTRACTOR_VERSION = "2"
+
 
 @dataclass
 class AttachmentResult:
@@ -25,102 +30,150 @@ class AttachmentResult:
 
 
 class OCRService:
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        cache: ExtractionCache | None = None,
+        pool: OCRPool | None = None,
+    ) -> None:
         self.settings = settings or get_settings()
+        self.cache = cache
+        self.pool = pool or OCRPool(workers=0)
 
-    def extract_from_attachments(self, attachments: List[AttachmentPayload]) -> List[AttachmentResult]:
+    def extract_from_attachments(
+        self, attachments: Sequence[AttachmentPayload | AttachmentBlob]
+    ) -> List[AttachmentResult]:
         results: List[AttachmentResult] = []
         for attachment in attachments:
+            if isinstance(attachment, AttachmentBlob):
+                results.append(self._extract_blob(attachment))
+                continue
             if not (attachment.url or attachment.content):
                 continue
-            path = self._materialize_attachment(attachment)
+            blob = AttachmentBlob.from_payload(attachment, max_bytes=self.settings.media_max_bytes)
             try:
-                text = self._extract_text(path, attachment.content_type)
-                sanitized_text = text_cleaning.sanitize_text(text)
-                confidence = self._score_confidence(sanitized_text)
-                results.append(
-                    AttachmentResult(
-                        filename=attachment.filename or path.name,
-                        text=sanitized_text,
-                        confidence=confidence,
-                        content_type=attachment.content_type,
-                    )
-                )
+                results.append(self._extract_blob(blob))
             finally:
-                try:
-                    path.unlink(missing_ok=True)
-                except Exception:  # pragma: no cover - cleanup best effort
-                    logger.debug("Failed to remove temp file %s", path)
+                blob.close()
         return results
 
-    def _materialize_attachment(self, attachment: AttachmentPayload) -> Path:
-        if attachment.content:
-            return file_utils.write_base64_to_temp(attachment.content, attachment.filename)
-        if attachment.url:
-            return file_utils.download_to_temp(attachment.url, attachment.filename)
-        raise ValueError("Attachment payload missing both url and content")
+    def _extract_blob(self, blob: AttachmentBlob) -> AttachmentResult:
+        cache_key = self._cache_key(blob)
+        cached = self.cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            sanitized_text, confidence = cached.text, cached.confidence
+        else:
+            text, partial = self._extract_text(blob.path(), blob.content_type)
+            sanitized_text = text_cleaning.sanitize_text(text)
+            confidence = self._score_confidence(sanitized_text)
+            # Partial OCR (budget spent, failed pages) would otherwise be served forever.
+            if cache_key and not partial:
+                self.cache.set(
+                    cache_key, CachedExtraction(text=sanitized_text, confidence=confidence)
+                )
+        return AttachmentResult(
+            filename=blob.filename,
+            text=sanitized_text,
+            confidence=confidence,
+            content_type=blob.content_type,
+        )
+
+    def stats(self) -> dict:
+        return {"cache": self.cache.stats() if self.cache else None, "pool": self.pool.stats()}
+
+    def _cache_key(self, blob: AttachmentBlob) -> Optional[str]:
+        if self.cache is None:
+            return None
+        # The suffix and content type pick the extractor, so they are part of the version.
+        version = f"{EXTRACTOR_VERSION}:{blob.suffix.lower()}:{blob.content_type or ''}"
+        return ExtractionCache.make_key(blob.sha256, version)
+
+    def _extract_text(self, path: Path, content_type: Optional[str]) -> Tuple[str, bool]:
+        """Extracted text and whether it is partial (and must not be cached)."""
 
-    def _extract_text(self, path: Path, content_type: Optional[str]) -> str:
         suffix = path.suffix.lower()
-        if suffix in {".txt", ".md", ".csv"}:
-            return resume_extractors.extract_text_from_plain(path)
-        if suffix in {".docx"}:
-            return resume_extractors.extract_text_from_docx(path)
         if suffix in {".pdf"}:
             return self._extract_from_pdf(path)
-        if suffix in {".png", ".jpg", ".jpeg", ".tiff", ".bmp"} or (content_type and "image" in content_type):
-            return self._extract_from_image(path)
+        if suffix in {".txt", ".md", ".csv"}:
+            return resume_extractors.extract_text_from_plain(path), False
+        if suffix in {".docx"}:
+            return resume_extractors.extract_text_from_docx(path), False
+        if suffix in {".png", ".jpg", ".jpeg", ".tiff", ".bmp"} or (
+            content_type and "image" in content_type
+        ):
+            return self._extract_from_image(path), False
         # fallback: treat as docx or binary text
         try:
-            return resume_extractors.extract_text_from_docx(path)
+            return resume_extractors.extract_text_from_docx(path), False
         except Exception:
-            return resume_extractors.extract_text_from_plain(path)
+            return resume_extractors.extract_text_from_plain(path), False
 
-    def _extract_from_pdf(self, path: Path) -> str:
-        cleaned = ""
+    def _extract_from_pdf(self, path: Path) -> Tuple[str, bool]:
         try:
-            text = resume_extractors.extract_text_from_pdf(path)
-            cleaned = text_cleaning.strip_non_printable(text)
-            if text_cleaning.has_meaningful_content(cleaned) and not text_cleaning.looks_like_pdf_metadata(cleaned):
-                return cleaned
-            logger.info(
-                "Structured PDF extract produced low quality output (len=%s); attempting pdfminer for %s",
-                len(cleaned),
-                path.name,
-            )
+            pages = [
+                text_cleaning.strip_non_printable(text)
+                for text in resume_extractors.extract_pdf_pages(path)
+            ]
         except Exception as exc:
-            logger.warning("Structured PDF extraction failed: %s", exc)
-
-        pdfminer_text = resume_extractors.extract_text_from_pdfminer(path)
-        if pdfminer_text:
-            cleaned_pdfminer = text_cleaning.strip_non_printable(pdfminer_text)
-            if text_cleaning.has_meaningful_content(cleaned_pdfminer) and not text_cleaning.looks_like_pdf_metadata(
-                cleaned_pdfminer
-            ):
-                return cleaned_pdfminer
-            logger.info("pdfminer output still low quality; trying PyMuPDF for %s", path.name)
-
-        pymupdf_text = resume_extractors.extract_text_from_pymupdf(path)
-        if pymupdf_text:
-            cleaned_pymupdf = text_cleaning.strip_non_printable(pymupdf_text)
-            if text_cleaning.has_meaningful_content(cleaned_pymupdf) and not text_cleaning.looks_like_pdf_metadata(
-                cleaned_pymupdf
-            ):
-                return cleaned_pymupdf
-            logger.info("PyMuPDF output still low quality; falling back to OCR for %s", path.name)
-
-        images = convert_from_path(path, dpi=300, fmt="png", thread_count=2)
-        text_chunks = [
-            text_cleaning.strip_non_printable(
-                pytesseract.image_to_string(image, config="--oem 3 --psm 6")
-            )
-            for image in images
+            logger.warning("PDF text extraction failed for %s: %s", path.name, exc)
+            pages = []
+        if not pages:
+            return self._ocr_pdf(path, None)
+
+        weak = [
+            number for number, text in enumerate(pages, start=1) if not self._usable_page_text(text)
         ]
-        return "\n".join(text_chunks)
+        if weak and resume_extractors.fitz is not None:
+            for number, text in resume_extractors.extract_pdf_pages_with_pdfplumber(
+                path, weak
+            ).items():
+                cleaned = text_cleaning.strip_non_printable(text)
+                if self._usable_page_text(cleaned):
+                    pages[number - 1] = cleaned
+            weak = [number for number in weak if not self._usable_page_text(pages[number - 1])]
+        if weak:
+            logger.info("OCR needed for %s of %s pages of %s", len(weak), len(pages), path.name)
+            recognized = self.pool.recognize_pdf(
+                path, budget_seconds=self.settings.ocr_document_budget_seconds, page_numbers=weak
+            )
+            self._log_ocr(path, recognized)
+            for number, text in recognized.page_texts.items():
+                pages[number - 1] = text
+            return "\n".join(pages), recognized.partial
+        return "\n".join(pages), False
+
+    def _ocr_pdf(self, path: Path, page_numbers: Optional[List[int]]) -> Tuple[str, bool]:
+        result = self.pool.recognize_pdf(
+            path,
+            budget_seconds=self.settings.ocr_document_budget_seconds,
+            page_numbers=page_numbers,
+        )
+        self._log_ocr(path, result)
+        return result.text, result.partial
+
+    @staticmethod
+    def _usable_page_text(text: str) -> bool:
+        # Single pages can legitimately be short (a closing page), so use a lower bar than whole documents.
+        return text_cleaning.has_meaningful_content(
+            text, min_alpha=20
+        ) and not text_cleaning.looks_like_pdf_metadata(text)
+
+    @staticmethod
+    def _log_ocr(path: Path, result: DocumentOCRResult) -> None:
+        logger.info(
+            "OCR recognized %s/%s pages of %s in %.1fs (peak RSS %.0f MiB)",
+            result.pages_done,
+            result.pages_total,
+            path.name,
+            result.seconds,
+            result.peak_rss_bytes / (1024 * 1024),
+        )
 
     def _extract_from_image(self, path: Path) -> str:
         with Image.open(path) as image:
-            return text_cleaning.strip_non_printable(pytesseract.image_to_string(image, config="--oem 3 --psm 6"))
+            return text_cleaning.strip_non_printable(
+                pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+            )
 
     @staticmethod
     def _score_confidence(text: str) -> float:
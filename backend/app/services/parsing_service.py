@@ -2,21 +2,26 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
-import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 from ..core.config import Settings, get_settings
-from ..core.security import UserRole
 from ..models.request_models import AttachmentPayload
 from ..models.response_models import CandidateRecord
 from ..utils import text_cleaning
+from ..utils.attachment_blob import AttachmentBlob
+from ..utils.micro_batcher import MicroBatcher
+from .ai_parser_service import AIParseResult, AIParsingService
+from .nlp_registry import NLPModelRegistry, get_nlp_registry
 from .ocr_service import AttachmentResult, OCRService
-from .ai_parser_service import AIParsingService, AIParseResult
 
 logger = logging.getLogger("smarthire.parsing")
 
+# (message body, extracted attachment text, source) awaiting NLP.
+ParseItem = Tuple[str, List[AttachmentResult], str]
+
 
 class ParsingService:
     def __init__(
@@ -24,10 +29,22 @@ class ParsingService:
         settings: Settings | None = None,
         ocr_service: OCRService | None = None,
         ai_parser_service: AIParsingService | None = None,
+        nlp_registry: NLPModelRegistry | None = None,
     ) -> None:
         self.settings = settings or get_settings()
         self.ocr_service = ocr_service or OCRService(settings=self.settings)
-        self._nlp = self._load_nlp_model()
+        self.nlp_registry = nlp_registry or get_nlp_registry()
+        # Concurrent single-document parses (job worker threads, async ingests) share
+        # nlp.pipe calls when micro-batching is enabled. Only the pipeline runs on the
+        # batcher thread; record building and AI enrichment stay in each caller.
+        self.batcher: Optional[MicroBatcher[str, Doc]] = None
+        if self.settings.nlp_micro_batch_size > 1:
+            self.batcher = MicroBatcher(
+                self._pipe_micro_batch,
+                max_batch_size=self.settings.nlp_micro_batch_size,
+                max_wait_seconds=self.settings.nlp_micro_batch_wait_ms / 1000,
+                name="nlp-batcher",
+            )
         self.ai_parser = ai_parser_service or (
             AIParsingService(settings=self.settings) if self.settings.openai_api_key else None
         )
@@ -49,20 +66,102 @@ class ParsingService:
             "node",
         ]
 
+    def close(self) -> None:
+        if self.batcher is not None:
+            self.batcher.close()
+
+    @property
+    def _nlp(self) -> Language:
+        # Resolved per call so a registry hot reload is picked up by live services.
+        return self.nlp_registry.get()
+
     def parse_payload(
         self,
         body: str,
-        attachments: Optional[List[AttachmentPayload]] = None,
+        attachments: Optional[Sequence[AttachmentPayload | AttachmentBlob]] = None,
         source: str = "whatsapp",
     ) -> CandidateRecord:
-        body_text = text_cleaning.sanitize_text(body or "")
         attachment_results: List[AttachmentResult] = []
         if attachments:
             attachment_results = self.ocr_service.extract_from_attachments(attachments)
+        return self.parse_extracted(body, attachment_results, source=source)
 
+    def parse_extracted(
+        self,
+        body: str,
+        attachment_results: Sequence[AttachmentResult],
+        source: str = "whatsapp",
+    ) -> CandidateRecord:
+        """Build the candidate record from the message body and already-extracted text."""
+
+        body_text = text_cleaning.sanitize_text(body or "")
+        attachment_results = list(attachment_results)
         combined_text = self._combine_text(body_text, attachment_results)
-        doc = self._nlp(combined_text)
+        if self.batcher is not None:
+            doc = self.batcher.submit(combined_text).result()
+        else:
+            doc = self._nlp(combined_text)
+        return self._build_record(body_text, attachment_results, combined_text, doc, source)
+
+    def parse_many(
+        self,
+        items: Sequence[Tuple[str, Sequence[AttachmentResult]]],
+        source: str = "whatsapp",
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[CandidateRecord]:
+        """
+        ``parse_extracted`` for many ``(body, attachment_results)`` pairs.
 
+        All texts go through ``nlp.pipe`` together.
+
+        ``batch_size`` and ``n_process`` default to ``NLP_BATCH_SIZE`` and
+        ``NLP_N_PROCESS``; ``n_process > 1`` forks spaCy worker processes per
+        call, which only pays off for large batches such as bulk imports.
+        """
+
+        return self._parse_batch(
+            [(body, list(results), source) for body, results in items],
+            batch_size=batch_size or self.settings.nlp_batch_size,
+            n_process=n_process or self.settings.nlp_n_process,
+        )
+
+    def _pipe_micro_batch(self, texts: List[str]) -> List[Doc]:
+        # Micro-batches are small; spaCy worker processes would cost more than they save.
+        return list(self._nlp.pipe(texts, batch_size=len(texts)))
+
+    def _parse_batch(
+        self, items: Sequence[ParseItem], batch_size: int, n_process: int
+    ) -> List[CandidateRecord]:
+        prepared = []
+        for body, attachment_results, source in items:
+            body_text = text_cleaning.sanitize_text(body or "")
+            prepared.append(
+                (
+                    body_text,
+                    attachment_results,
+                    self._combine_text(body_text, attachment_results),
+                    source,
+                )
+            )
+        texts = [combined for _, _, combined, _ in prepared]
+        if n_process > 1 and len(texts) > batch_size:
+            docs = self._nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        else:
+            docs = self._nlp.pipe(texts, batch_size=batch_size)
+        return [
+            self._build_record(body_text, results, combined, doc, source)
+            for (body_text, results, combined, source), doc in zip(prepared, docs)
+        ]
+
+    def _build_record(
+        self,
+        body_text: str,
+        attachment_results: List[AttachmentResult],
+        combined_text: str,
+        doc: Doc,
+        source: str,
+    ) -> CandidateRecord:
         email = text_cleaning.extract_email(combined_text)
         phone = text_cleaning.extract_phone(combined_text)
 
@@ -144,7 +243,11 @@ class ParsingService:
     @staticmethod
     def _score_confidence(body_text: str, attachments: List[AttachmentResult]) -> float:
         base = 0.3 if body_text else 0.1
-        attachment_boost = sum(result.confidence for result in attachments) / max(len(attachments), 1) if attachments else 0
+        attachment_boost = (
+            sum(result.confidence for result in attachments) / max(len(attachments), 1)
+            if attachments
+            else 0
+        )
         return min(1.0, base + attachment_boost)
 
     @staticmethod
@@ -165,11 +268,3 @@ class ParsingService:
             record.experience = result.experience
         if result.last_job_title:
             record.last_job_title = result.last_job_title
-
-    @staticmethod
-    def _load_nlp_model() -> Language:
-        try:
-            return spacy.load("en_core_web_lg")
-        except OSError:
-            logger.warning("Large spaCy model not available; falling back to en_core_web_sm.")
-            return spacy.load("en_core_web_sm")
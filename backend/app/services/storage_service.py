@@ -4,10 +4,20 @@ import logging
 from typing import Iterable, List, Optional, Tuple
 
 from ..core.config import Settings, get_settings
-from ..models.response_models import CandidateBoardResponse, CandidateRecord, CandidateStatus
+from ..models.response_models import (
+    CandidateBoardResponse,
+    CandidateChange,
+    CandidateChangesResponse,
+    CandidateRecord,
+    CandidateStatus,
+)
 from ..repositories.audit_repository import AuditRepository
+from ..repositories.base import CandidateRepository
+from ..repositories.candidate_index import sort_value
 from ..repositories.drive_repository import DriveRepository
-from ..repositories.sheets_repository import SheetsRepository
+from ..utils.attachment_blob import AttachmentBlob
+from ..utils.pagination import PageCursor, decode_cursor
+from .event_hub import EventHub
 
 logger = logging.getLogger("smarthire.storage")
 
@@ -15,31 +25,51 @@ logger = logging.getLogger("smarthire.storage")
 class StorageService:
     def __init__(
         self,
-        sheets_repository: SheetsRepository,
+        candidate_repository: CandidateRepository,
         drive_repository: DriveRepository,
         audit_repository: AuditRepository,
         settings: Settings | None = None,
+        event_hub: EventHub | None = None,
     ) -> None:
         self.settings = settings or get_settings()
-        self.sheets_repository = sheets_repository
+        self.candidate_repository = candidate_repository
         self.drive_repository = drive_repository
         self.audit_repository = audit_repository
+        self.event_hub = event_hub
 
     def persist_candidate(
         self,
         record: CandidateRecord,
-        attachments: Optional[Iterable[Tuple[str, bytes, str]]] = None,
+        attachments: Optional[Iterable[AttachmentBlob]] = None,
     ) -> CandidateRecord:
+        self.append_new_candidate(record)
+        stored_locations = [self.archive_attachment(blob) for blob in attachments or []]
+        self.record_ingested(record, [location for location in stored_locations if location])
+        return record
+
+    def append_new_candidate(self, record: CandidateRecord) -> CandidateRecord:
         record.status = CandidateStatus.NEW
-        self.sheets_repository.append_candidate(record)
-        stored_locations: List[str] = []
-        for attachment in attachments or []:
-            filename, data, mime_type = attachment
-            try:
-                location = self.drive_repository.archive_bytes(filename, data, mime_type)
-                stored_locations.append(location)
-            except Exception as exc:  # pragma: no cover - safety net
-                logger.error("Attachment archive failed for %s: %s", filename, exc)
+        self.candidate_repository.append_candidate(record)
+        return record
+
+    def append_new_candidates(self, records: List[CandidateRecord]) -> List[CandidateRecord]:
+        """Batch form of ``append_new_candidate``: one repository write for the whole list."""
+
+        for record in records:
+            record.status = CandidateStatus.NEW
+        self.candidate_repository.append_candidates(records)
+        return records
+
+    def archive_attachment(self, blob: AttachmentBlob) -> Optional[str]:
+        try:
+            return self.drive_repository.archive_blob(blob)
+        except Exception as exc:  # pragma: no cover - safety net
+            logger.error("Attachment archive failed for %s: %s", blob.filename, exc)
+            return None
+
+    def record_ingested(self, record: CandidateRecord, stored_locations: List[str]) -> None:
+        """Audit and broadcast a candidate once its row and attachments are stored."""
+
         self.audit_repository.record(
             action="candidate_ingested",
             metadata={
@@ -48,55 +78,158 @@ class StorageService:
                 "attachments": ", ".join(stored_locations),
             },
         )
-        return record
+        self._emit("candidate_ingested", {"candidate": record.model_dump(mode="json")})
 
     def list_recent_candidates(self, limit: int = 20) -> List[CandidateRecord]:
-        return self.sheets_repository.list_candidates(limit=limit)
+        return self.candidate_repository.list_candidates(limit=limit)
 
     def list_candidates(
         self,
         status: CandidateStatus | None = None,
         limit: int | None = None,
     ) -> List[CandidateRecord]:
-        return self.sheets_repository.list_candidates(status=status, limit=limit)
+        return self.candidate_repository.list_candidates(status=status, limit=limit)
 
-    def get_candidate_board(self) -> CandidateBoardResponse:
-        records = self.sheets_repository.list_candidates()
-        board = CandidateBoardResponse()
-        for record in records:
-            if record.status == CandidateStatus.NEW:
-                board.new.append(record)
-            elif record.status == CandidateStatus.APPROVED:
-                board.approved.append(record)
-            elif record.status == CandidateStatus.INTERVIEW:
-                board.interview.append(record)
-            elif record.status == CandidateStatus.SELECTED:
-                board.selected.append(record)
-            elif record.status == CandidateStatus.REJECTED:
-                board.rejected.append(record)
+    def page_candidates(
+        self,
+        status: CandidateStatus | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        sort: str = "received_at",
+        descending: bool = True,
+    ) -> Tuple[List[CandidateRecord], Optional[str]]:
+        """Return one keyset page and the cursor for the next one (``None`` on the last page)."""
+
+        position = decode_cursor(cursor, sort, descending)
+        after = (position.value, position.candidate_id) if position else None
+        records = self.candidate_repository.page_candidates(
+            status=status, limit=limit + 1, sort=sort, descending=descending, after=after
+        )
+        if len(records) <= limit:
+            return records, None
+        records = records[:limit]
+        last = records[-1]
+        next_cursor = PageCursor(
+            sort, descending, sort_value(last, sort), last.candidate_id
+        ).encode()
+        return records, next_cursor
+
+    def count_candidates(self, status: CandidateStatus | None = None) -> int:
+        return self.candidate_repository.count_candidates(status=status)
+
+    def change_version(self) -> int:
+        return self.candidate_repository.change_version()
+
+    def change_tag(self) -> str:
+        """``<epoch>-<version>``: equal tags mean the same data, across restarts and processes."""
+
+        return f"{self.candidate_repository.change_epoch()}-{self.candidate_repository.change_version()}"
+
+    def changes_since(
+        self, since: int, limit: int = 500, epoch: str | None = None
+    ) -> CandidateChangesResponse:
+        """
+        Summarize what changed after ``since``: one entry per candidate carrying its current state.
+
+        A candidate both created and removed inside the window is omitted. A
+        ``since`` from another ``epoch`` (a restart, another replica) is a reset.
+        """
+
+        current_epoch = self.candidate_repository.change_epoch()
+        current = self.candidate_repository.change_version()
+        if epoch is not None and epoch != current_epoch:
+            return CandidateChangesResponse(version=current, epoch=current_epoch, reset=True)
+        entries = self.candidate_repository.changes_since(since, limit=limit)
+        if entries is None:
+            return CandidateChangesResponse(version=current, epoch=current_epoch, reset=True)
+        if not entries:
+            return CandidateChangesResponse(version=current, epoch=current_epoch)
+        first_ops: dict[str, str] = {}
+        last_versions: dict[str, int] = {}
+        for entry in entries:
+            first_ops.setdefault(entry.candidate_id, entry.op)
+            last_versions[entry.candidate_id] = entry.version
+        changes: List[CandidateChange] = []
+        for candidate_id, version in sorted(last_versions.items(), key=lambda item: item[1]):
+            record = self.candidate_repository.get_candidate(candidate_id)
+            created = first_ops[candidate_id] == "insert"
+            if record is None:
+                if not created:
+                    changes.append(
+                        CandidateChange(version=version, op="delete", candidate_id=candidate_id)
+                    )
+                continue
+            op = "insert" if created else "update"
+            changes.append(
+                CandidateChange(version=version, op=op, candidate_id=candidate_id, candidate=record)
+            )
+        version = entries[-1].version
+        return CandidateChangesResponse(
+            version=version, epoch=current_epoch, has_more=version < current, changes=changes
+        )
+
+    def get_candidate_board(
+        self,
+        per_column_limit: int | None = None,
+        counts_only: bool = False,
+    ) -> CandidateBoardResponse:
+        """
+        Build the pipeline board from the repository's per-status aggregates.
+
+        Counts come from maintained counters and each column is read from its
+        status bucket, so the cost follows the visible cards rather than the
+        total number of candidates.
+        """
+
+        counts = self.candidate_repository.status_counts()
+        board = CandidateBoardResponse(
+            counts={status.value: counts.get(status, 0) for status in CandidateStatus}
+        )
+        if counts_only:
+            return board
+        for status in CandidateStatus:
+            if counts.get(status):
+                column = self.candidate_repository.list_candidates(
+                    status=status, limit=per_column_limit
+                )
+                setattr(board, status.value, column)
         return board
 
-    def update_candidate_status(self, candidate_id: str, status: CandidateStatus) -> CandidateRecord:
-        record = self.sheets_repository.update_status(candidate_id, status)
+    def update_candidate_status(
+        self, candidate_id: str, status: CandidateStatus
+    ) -> CandidateRecord:
+        record = self.candidate_repository.update_status(candidate_id, status)
         self.audit_repository.record(
             action="candidate_status_updated",
             metadata={"candidate_id": candidate_id, "status": status.value},
         )
+        self._emit("status_updated", {"candidate": record.model_dump(mode="json")})
         return record
 
     def delete_candidate(self, candidate_id: str) -> CandidateRecord:
-        record = self.sheets_repository.delete_candidate(candidate_id)
+        record = self.candidate_repository.delete_candidate(candidate_id)
         self.audit_repository.record(
             action="candidate_deleted",
             metadata={"candidate_id": candidate_id, "email": record.email or ""},
         )
+        self._emit("deleted", {"candidate_ids": [candidate_id]})
         return record
 
     def delete_candidates_by_status(self, status: CandidateStatus) -> int:
-        removed = self.sheets_repository.delete_by_status(status)
+        removed = self.candidate_repository.delete_by_status(status)
         if removed:
             self.audit_repository.record(
                 action="candidate_bulk_delete",
                 metadata={"status": status.value, "count": removed},
             )
+            self._emit("deleted", {"status": status.value, "count": removed})
         return removed
+
+    def _emit(self, event: str, data: dict) -> None:
+        if self.event_hub is None:
+            return
+        try:
+            tag: str | None = self.change_tag()
+        except Exception:  # pragma: no cover - events must never fail a write
+            tag = None
+        self.event_hub.publish(event, data, event_id=tag)
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-import base64
 import logging
 from typing import Dict, List, Optional
+from uuid import uuid4
 
-import requests
 from twilio.request_validator import RequestValidator
 from twilio.rest import Client
 
 from ..core.config import Settings, get_settings
-from ..models.request_models import AttachmentPayload
+from ..models.response_models import CandidateRecord
+from ..repositories.message_dedup import (
+    CLAIMED,
+    DUPLICATE,
+    MessageDedupStore,
+    MessageInProgressError,
+)
 from ..services.ingestion_service import IngestionService
+from ..utils.attachment_blob import AttachmentBlob
+from .media_fetcher import MediaFetcher, MediaRequest
 
 logger = logging.getLogger("smarthire.whatsapp")
 
@@ -20,9 +27,13 @@ class WhatsAppService:
         self,
         settings: Settings | None = None,
         ingestion_service: IngestionService | None = None,
+        dedup_store: MessageDedupStore | None = None,
+        media_fetcher: MediaFetcher | None = None,
     ) -> None:
         self.settings = settings or get_settings()
         self.ingestion_service = ingestion_service
+        self.dedup_store = dedup_store
+        self.media_fetcher = media_fetcher or self._build_media_fetcher()
         self._validator = (
             RequestValidator(self.settings.twilio_auth_token)
             if self.settings.twilio_auth_token
@@ -34,6 +45,25 @@ class WhatsAppService:
             else None
         )
 
+    def close(self) -> None:
+        session = getattr(getattr(self._client, "http_client", None), "session", None)
+        if session is not None:
+            session.close()
+        self.media_fetcher.close()
+
+    def _build_media_fetcher(self) -> MediaFetcher:
+        auth = None
+        if self.settings.twilio_account_sid and self.settings.twilio_auth_token:
+            auth = (self.settings.twilio_account_sid, self.settings.twilio_auth_token)
+        return MediaFetcher(
+            concurrency=self.settings.media_fetch_concurrency,
+            per_host_connections=self.settings.media_fetch_per_host_connections,
+            timeout=self.settings.media_fetch_timeout_seconds,
+            max_bytes=self.settings.media_max_bytes,
+            spool_threshold=self.settings.attachment_spool_threshold_bytes,
+            auth=auth,
+        )
+
     def validate_request(self, signature: Optional[str], url: str, payload: Dict[str, str]) -> bool:
         if not self._validator:
             logger.warning("Twilio validator not configured; accepting webhook (dev mode).")
@@ -42,66 +72,65 @@ class WhatsAppService:
             return False
         return self._validator.validate(url, payload, signature)
 
-    def process_incoming_message(self, payload: Dict[str, str]) -> None:
+    def process_incoming_message(self, payload: Dict[str, str]) -> Optional[CandidateRecord]:
         if not self.ingestion_service:
             logger.error("Ingestion service missing; message dropped.")
-            return
-        body = payload.get("Body", "")
-        attachments = self._extract_attachments(payload)
-        record = self.ingestion_service.ingest_payload(
-            source="whatsapp",
-            body=body,
-            attachments=attachments,
-        )
+            return None
+        message_sid = payload.get("MessageSid") if self.dedup_store else None
+        owner = uuid4().hex
+        if message_sid:
+            outcome = self.dedup_store.claim(message_sid, owner)
+            if outcome == DUPLICATE:
+                logger.info("Skipping duplicate delivery of message %s", message_sid)
+                return None
+            if outcome != CLAIMED:
+                raise MessageInProgressError(message_sid)
+        attachments: List[AttachmentBlob] = []
+        try:
+            body = payload.get("Body", "")
+            attachments = self._extract_attachments(payload)
+            record = self.ingestion_service.ingest_payload(
+                source="whatsapp",
+                body=body,
+                attachments=attachments,
+            )
+        except BaseException:
+            if message_sid:
+                self.dedup_store.release(message_sid, owner)
+            raise
+        finally:
+            for blob in attachments:
+                blob.close()
+        if message_sid:
+            self.dedup_store.complete(message_sid, owner, record.candidate_id)
         if self._client and self.settings.twilio_whatsapp_from:
             to_number = payload.get("From")
             if to_number:
                 self._send_auto_reply(to_number, record.full_name)
+        return record
 
-    def _extract_attachments(self, payload: Dict[str, str]) -> List[AttachmentPayload]:
+    def _extract_attachments(self, payload: Dict[str, str]) -> List[AttachmentBlob]:
         count = int(payload.get("NumMedia", "0") or "0")
-        attachments: List[AttachmentPayload] = []
+        media: List[MediaRequest] = []
         for index in range(count):
             media_url = payload.get(f"MediaUrl{index}")
             content_type = payload.get(f"MediaContentType{index}")
-            if not media_url:
-                continue
-            attachments.append(
-                AttachmentPayload(
-                    url=media_url,
-                    content_type=content_type,
-                    filename=f"attachment_{index}",
-                    content=self._download_media_base64(media_url),
-                )
-            )
-        if attachments:
-            return attachments
+            if media_url:
+                media.append(MediaRequest(media_url, f"attachment_{index}", content_type))
         message_sid = payload.get("MessageSid")
-        if self._client and message_sid:
+        if not media and self._client and message_sid:
             try:
-                media_items = self._client.messages(message_sid).media.list()
-                for media in media_items:
-                    media_url = f"https://api.twilio.com{media.uri.replace('.json', '')}"
-                    attachments.append(
-                        AttachmentPayload(
-                            url=media_url,
-                            content_type=getattr(media, "content_type", None),
-                            filename=getattr(media, "file_name", None) or f"{media.sid}",
-                            content=self._download_media_base64(media_url),
-                        )
+                media = [
+                    MediaRequest(
+                        url=f"https://api.twilio.com{item.uri.replace('.json', '')}",
+                        filename=getattr(item, "file_name", None) or f"{item.sid}",
+                        content_type=getattr(item, "content_type", None),
                     )
+                    for item in self._client.messages(message_sid).media.list()
+                ]
             except Exception as exc:  # pragma: no cover - network dependent
                 logger.warning("Failed to fetch media list for %s: %s", message_sid, exc)
-        return attachments
-
-    def _download_media_base64(self, url: str) -> Optional[str]:
-        if not (self.settings.twilio_account_sid and self.settings.twilio_auth_token):
-            return None
-        response = requests.get(url, auth=(self.settings.twilio_account_sid, self.settings.twilio_auth_token), timeout=30)
-        if response.status_code >= 400:
-            logger.warning("Failed to fetch media from Twilio: %s", response.status_code)
-            return None
-        return base64.b64encode(response.content).decode("utf-8")
+        return [blob for blob in self.media_fetcher.fetch_all(media) if blob is not None]
 
     def _send_auto_reply(self, to_number: str, name: Optional[str]) -> None:
         safe_name = (name or "").strip()
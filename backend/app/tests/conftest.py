@@ -39,6 +39,10 @@ def test_settings(temp_data_dir: Path) -> Settings:
         allowed_origins=[],
         jwt_secret="test-secret",
         admin_password="admin123",
+        local_candidate_log_path=str(temp_data_dir / "candidates.log.jsonl"),
+        job_queue_path=str(temp_data_dir / "jobs.db"),
+        message_dedup_path=str(temp_data_dir / "processed_messages.db"),
+        extraction_cache_dir=str(temp_data_dir / "extraction_cache"),
     )
 
 
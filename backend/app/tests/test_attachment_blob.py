@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.models.request_models import AttachmentPayload
+from backend.app.models.response_models import CandidateRecord
+from backend.app.services.ingestion_service import IngestionService
+from backend.app.utils import attachment_blob
+from backend.app.utils.attachment_blob import AttachmentBlob
+from backend.app.utils.file_utils import FileDownloadError
+
+
+def test_large_streams_spool_to_one_temp_file():
+    chunks = [b"x" * 1024] * 8
+    blob = AttachmentBlob.from_stream(
+        iter(chunks), filename="scan", content_type="application/pdf", spool_threshold=4096
+    )
+
+    assert not blob.in_memory and blob.size == 8192 and blob.filename == "scan.pdf"
+    assert blob.sha256 == hashlib.sha256(b"".join(chunks)).hexdigest()
+    spooled = blob.path()
+    assert blob.path() == spooled and spooled.read_bytes() == b"".join(chunks)
+    blob.close()
+    assert not spooled.exists()
+
+    with pytest.raises(FileDownloadError):
+        AttachmentBlob.from_stream(iter(chunks), max_bytes=2048)
+
+
+class RecordingParser:
+    def __init__(self) -> None:
+        self.seen = []
+
+    def parse_payload(self, body, attachments=None, source="whatsapp"):
+        self.seen = list(attachments or [])
+        for blob in self.seen:
+            blob.path()  # OCR materializes a file for the extractors
+        return CandidateRecord(
+            full_name="Jane Doe", source=source, received_at=datetime.now(timezone.utc)
+        )
+
+
+class RecordingStorage:
+    def __init__(self) -> None:
+        self.archived = []
+
+    def persist_candidate(self, record, attachments=None):
+        self.archived = [(blob, blob.read_bytes()) for blob in attachments or []]
+        return record
+
+
+def test_ingestion_hands_the_same_blob_to_ocr_and_archival():
+    parser, storage = RecordingParser(), RecordingStorage()
+    service = IngestionService(parsing_service=parser, storage_service=storage)
+    payload = AttachmentPayload(
+        content=base64.b64encode(b"%PDF-1.4 resume").decode(), filename="cv.pdf"
+    )
+
+    service.ingest_payload(source="api", body="", attachments=[payload])
+
+    (blob,) = parser.seen
+    assert storage.archived == [(blob, b"%PDF-1.4 resume")]
+    with pytest.raises(ValueError):
+        blob.path()  # temp file removed once ingestion finished
+
+
+class StreamingResponse:
+    status_code = 200
+    headers: dict = {}
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start : start + chunk_size]
+
+
+def test_payload_downloads_respect_the_media_limit(monkeypatch):
+    monkeypatch.setattr(
+        attachment_blob.requests, "get", lambda url, **kwargs: StreamingResponse(b"x" * 64)
+    )
+    url_payload = AttachmentPayload(url="https://media.example.com/cv.pdf", filename="cv.pdf")
+    inline_payload = AttachmentPayload(content=base64.b64encode(b"x" * 64).decode())
+    for payload in (url_payload, inline_payload):
+        with pytest.raises(FileDownloadError, match="32 byte limit"):
+            AttachmentBlob.from_payload(payload, max_bytes=32)
+
+    parser, storage = RecordingParser(), RecordingStorage()
+    service = IngestionService(parsing_service=parser, storage_service=storage, media_max_bytes=32)
+    with pytest.raises(FileDownloadError):
+        service.ingest_payload(source="api", body="", attachments=[url_payload])
+    assert storage.archived == []
+    assert AttachmentBlob.from_payload(url_payload, max_bytes=64).size == 64
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import json
+
+import pytest
 from fastapi.testclient import TestClient
 
+from backend.app.repositories.user_repository import UserRepository
+from backend.app.services import auth_service as auth_module
+
 
 def test_login_returns_token(api_client: TestClient):
     response = api_client.post(
@@ -33,7 +39,11 @@ def test_admin_can_manage_recruiters(api_client: TestClient):
 
     create_response = api_client.post(
         "/api/admin/users",
-        json={"email": "newrecruiter@example.com", "password": "securepass", "name": "New Recruiter"},
+        json={
+            "email": "newrecruiter@example.com",
+            "password": "securepass",
+            "name": "New Recruiter",
+        },
         headers=headers,
     )
     assert create_response.status_code == 201
@@ -46,5 +56,59 @@ def test_admin_can_manage_recruiters(api_client: TestClient):
     assert "newrecruiter@example.com" in emails
     assert any(item["name"] == "New Recruiter" for item in items)
 
-    delete_response = api_client.delete("/api/admin/users/newrecruiter@example.com", headers=headers)
+    delete_response = api_client.delete(
+        "/api/admin/users/newrecruiter@example.com", headers=headers
+    )
     assert delete_response.status_code == 200
+
+
+def test_bootstrap_skips_hashing_and_writes_when_users_exist(tmp_path, monkeypatch, test_settings):
+    repository = UserRepository(storage_path=tmp_path / "users.json")
+    auth_module.AuthService(settings=test_settings, repository=repository)
+    version = repository.version()
+
+    hashed: list[str] = []
+    monkeypatch.setattr(
+        auth_module, "hash_password", lambda password: hashed.append(password) or "x"
+    )
+    auth_module.AuthService(settings=test_settings, repository=repository)
+    assert hashed == []
+    assert repository.version() == version
+
+
+def test_verify_token_sees_users_removed_on_disk(tmp_path, test_settings):
+    repository = UserRepository(storage_path=tmp_path / "users.json")
+    service = auth_module.AuthService(settings=test_settings, repository=repository)
+    token = service.issue_token(service.list_users()["recruiter@example.com"])
+    assert service.verify_token(token).email == "recruiter@example.com"
+
+    # Simulate another worker deleting the recruiter.
+    users = json.loads(repository.storage_path.read_text())
+    users.pop("recruiter@example.com")
+    repository.storage_path.write_text(json.dumps(users, indent=2, sort_keys=True))
+    with pytest.raises(ValueError):
+        service.verify_token(token)
+
+
+def test_verify_token_is_cached_until_user_deleted(tmp_path, monkeypatch, test_settings):
+    repository = UserRepository(storage_path=tmp_path / "users.json")
+    service = auth_module.AuthService(settings=test_settings, repository=repository)
+    identity = service.create_user("cached@example.com", "securepass", name="Cached Recruiter")
+    token = service.issue_token(identity)
+
+    decoded: list[str] = []
+    original_decode = auth_module.decode_access_token
+    monkeypatch.setattr(
+        auth_module,
+        "decode_access_token",
+        lambda value, settings=None: decoded.append(value)
+        or original_decode(value, settings=settings),
+    )
+    assert service.verify_token(token) is identity
+    assert service.verify_token(token) is identity
+    assert len(decoded) == 1
+    assert service.token_cache_stats()["hits"] == 1
+
+    service.delete_user("cached@example.com")
+    with pytest.raises(ValueError):
+        service.verify_token(token)
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import io
+import time
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+from backend.app.models.response_models import CandidateRecord, CandidateStatus
+from backend.app.services.bulk_import import BulkImportService
+from backend.app.services.nlp_registry import NLPModelRegistry
+from backend.app.services.parsing_service import ParsingService
+
+
+def _login(client) -> dict:
+    token = client.post(
+        "/api/auth/login", json={"email": "admin@example.com", "password": "admin123"}
+    ).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _seed(client, count: int) -> None:
+    storage = client.app.state.container.storage_service
+    now = datetime.now(timezone.utc)
+    for n in range(count):
+        storage.persist_candidate(
+            CandidateRecord(
+                full_name=f"Candidate {n}", source="test", received_at=now - timedelta(minutes=n)
+            )
+        )
+
+
+def test_candidate_list_walks_pages_with_cursor(api_client):
+    headers = _login(api_client)
+    _seed(api_client, 5)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = api_client.get("/api/candidates", params=params, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == "5"
+        body = response.json()
+        seen.extend(item["full_name"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [f"Candidate {n}" for n in range(5)]
+
+
+def test_candidate_list_rejects_foreign_cursor(api_client):
+    headers = _login(api_client)
+    _seed(api_client, 3)
+    cursor = api_client.get("/api/candidates", params={"limit": 1}, headers=headers).json()[
+        "next_cursor"
+    ]
+    response = api_client.get(
+        "/api/candidates", params={"limit": 1, "cursor": cursor, "order": "asc"}, headers=headers
+    )
+    assert response.status_code == 400
+    assert (
+        api_client.get(
+            "/api/candidates", params={"cursor": "garbage!"}, headers=headers
+        ).status_code
+        == 400
+    )
+
+
+def test_board_reports_counts_and_limits_columns(api_client):
+    headers = _login(api_client)
+    _seed(api_client, 4)
+    storage = api_client.app.state.container.storage_service
+    archived = storage.list_candidates(limit=1)[0]
+    storage.update_candidate_status(archived.candidate_id, CandidateStatus.ARCHIVED)
+
+    body = api_client.get(
+        "/api/candidates/board", params={"per_column_limit": 2}, headers=headers
+    ).json()
+    assert body["counts"]["new"] == 3 and body["counts"]["archived"] == 1
+    assert len(body["new"]) == 2
+    assert [item["candidate_id"] for item in body["archived"]] == [archived.candidate_id]
+
+    counts_only = api_client.get(
+        "/api/candidates/board", params={"counts_only": True}, headers=headers
+    ).json()
+    assert counts_only["counts"] == body["counts"] and counts_only["new"] == []
+
+
+def test_list_and_board_answer_conditional_gets(api_client):
+    headers = _login(api_client)
+    _seed(api_client, 2)
+    first = api_client.get("/api/candidates/board", headers=headers)
+    etag = first.headers["ETag"]
+    cached = api_client.get("/api/candidates/board", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+
+    _seed(api_client, 1)
+    fresh = api_client.get("/api/candidates/board", headers={**headers, "If-None-Match": etag})
+    assert fresh.status_code == 200 and fresh.headers["ETag"] != etag
+
+
+def test_changes_endpoint_returns_deltas_since_version(api_client):
+    headers = _login(api_client)
+    _seed(api_client, 2)
+    version = api_client.get(
+        "/api/candidates/changes", params={"since": 0}, headers=headers
+    ).json()["version"]
+    storage = api_client.app.state.container.storage_service
+    kept, dropped = storage.list_candidates()
+    storage.update_candidate_status(kept.candidate_id, CandidateStatus.APPROVED)
+    storage.delete_candidate(dropped.candidate_id)
+    _seed(api_client, 1)
+
+    body = api_client.get(
+        "/api/candidates/changes", params={"since": version}, headers=headers
+    ).json()
+    assert not body["reset"] and body["version"] > version
+    ops = {(change["op"], change["candidate_id"]) for change in body["changes"]}
+    assert ("update", kept.candidate_id) in ops and ("delete", dropped.candidate_id) in ops
+    assert sum(change["op"] == "insert" for change in body["changes"]) == 1
+
+    idle = api_client.get(
+        "/api/candidates/changes",
+        params={"since": body["version"], "epoch": body["epoch"]},
+        headers=headers,
+    ).json()
+    assert idle["changes"] == [] and idle["version"] == body["version"] and not idle["reset"]
+    # A version handed out before a restart or by another replica is not comparable.
+    restarted = api_client.get(
+        "/api/candidates/changes",
+        params={"since": body["version"], "epoch": "stale"},
+        headers=headers,
+    ).json()
+    assert restarted["reset"] and restarted["epoch"] == body["epoch"]
+    assert api_client.get(
+        "/api/candidates/changes", params={"since": 10**9}, headers=headers
+    ).json()["reset"]
+
+
+def _use_blank_parser(container, test_settings) -> None:
+    container.override(
+        "parsing_service",
+        ParsingService(
+            settings=test_settings,
+            ocr_service=container.ocr_service,
+            nlp_registry=NLPModelRegistry("blank:en"),
+        ),
+    )
+
+
+def _wait_for_import(client, import_id: str, headers: dict) -> dict:
+    for _ in range(100):
+        body = client.get(f"/api/candidates/import/{import_id}", headers=headers).json()
+        if body["status"] == "completed":
+            break
+        time.sleep(0.05)
+    return body
+
+
+def test_bulk_import_expands_zip_and_reports_per_file_results(api_client, test_settings):
+    container = api_client.app.state.container
+    _use_blank_parser(container, test_settings)
+    headers = _login(api_client)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as bundle:
+        for n in range(3):
+            bundle.writestr(f"cvs/cv{n}.txt", f"Reach me at person{n}@example.com. Python, SQL.")
+        bundle.writestr("__MACOSX/._cv0.txt", "junk")
+        bundle.writestr("cvs/", "")
+
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[
+            ("files", ("fair.zip", archive.getvalue(), "application/zip")),
+            ("files", ("walk-in.txt", b"Email: walkin@example.com", "text/plain")),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 202 and response.json()["total"] == 4
+
+    body = _wait_for_import(api_client, response.json()["id"], headers)
+    assert body["succeeded"] == 4 and body["failed"] == 0
+    assert [item["filename"] for item in body["items"]][-1] == "walk-in.txt"
+    emails = {record.email for record in container.storage_service.list_candidates()}
+    assert emails == {
+        "person0@example.com",
+        "person1@example.com",
+        "person2@example.com",
+        "walkin@example.com",
+    }
+
+
+def test_bulk_import_fails_oversized_files_individually(api_client, test_settings):
+    container = api_client.app.state.container
+    _use_blank_parser(container, test_settings)
+    container.override(
+        "bulk_import",
+        BulkImportService(
+            parsing_service=container.parsing_service,
+            storage_service=container.storage_service,
+            max_file_bytes=64,
+        ),
+    )
+    headers = _login(api_client)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr("small.txt", "Email: zipped@example.com")
+        bundle.writestr("huge.txt", "x" * 65)
+
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[
+            ("files", ("fair.zip", archive.getvalue(), "application/zip")),
+            ("files", ("walk-in.txt", b"Email: walkin@example.com", "text/plain")),
+            ("files", ("novel.txt", b"y" * 65, "text/plain")),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 202
+
+    body = _wait_for_import(api_client, response.json()["id"], headers)
+    assert (body["total"], body["succeeded"], body["failed"]) == (4, 2, 2)
+    failed = {
+        item["filename"]: item["error"] for item in body["items"] if item["status"] == "failed"
+    }
+    assert set(failed) == {"fair.zip/huge.txt", "novel.txt"}
+    assert all("64 byte limit" in error for error in failed.values())
+    emails = {record.email for record in container.storage_service.list_candidates()}
+    assert emails == {"zipped@example.com", "walkin@example.com"}
+
+
+def test_bulk_import_rejects_more_files_than_the_limit(api_client, test_settings):
+    container = api_client.app.state.container
+    container.override(
+        "bulk_import",
+        BulkImportService(
+            parsing_service=container.parsing_service,
+            storage_service=container.storage_service,
+            max_files=2,
+        ),
+    )
+    headers = _login(api_client)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as bundle:
+        for n in range(2):
+            bundle.writestr(f"cv{n}.txt", "Python")
+
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[
+            ("files", ("fair.zip", archive.getvalue(), "application/zip")),
+            ("files", ("walk-in.txt", b"Python", "text/plain")),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 400
+    assert "limit is 2" in response.json()["detail"]
+    assert container.storage_service.list_candidates() == []
+
+
+def test_bulk_import_failed_batch_does_not_abort_the_rest(api_client, test_settings):
+    container = api_client.app.state.container
+    _use_blank_parser(container, test_settings)
+    parsing_service = container.parsing_service
+    parse_many = parsing_service.parse_many
+
+    def flaky_parse_many(items, **kwargs):
+        if any("broken" in result.text for _, results in items for result in results):
+            raise RuntimeError("nlp crashed")
+        return parse_many(items, **kwargs)
+
+    parsing_service.parse_many = flaky_parse_many
+    container.override(
+        "bulk_import",
+        BulkImportService(
+            parsing_service=parsing_service,
+            storage_service=container.storage_service,
+            batch_size=1,
+        ),
+    )
+    headers = _login(api_client)
+
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[
+            ("files", ("first.txt", b"Email: first@example.com", "text/plain")),
+            ("files", ("broken.txt", b"broken resume", "text/plain")),
+            ("files", ("last.txt", b"Email: last@example.com", "text/plain")),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 202
+
+    body = _wait_for_import(api_client, response.json()["id"], headers)
+    assert (body["status"], body["succeeded"], body["failed"]) == ("completed", 2, 1)
+    (failed,) = [item for item in body["items"] if item["status"] == "failed"]
+    assert failed["filename"] == "broken.txt" and "nlp crashed" in failed["error"]
+    emails = {record.email for record in container.storage_service.list_candidates()}
+    assert emails == {"first@example.com", "last@example.com"}
+
+
+def test_bulk_import_caps_request_file_count_and_total_size(api_client, test_settings):
+    headers = _login(api_client)
+    test_settings.bulk_import_max_files = 2
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[("files", (f"cv{n}.txt", b"Python", "text/plain")) for n in range(3)],
+        headers=headers,
+    )
+    assert response.status_code == 400
+    assert "limit is 2" in response.json()["detail"]
+
+    test_settings.bulk_import_max_total_bytes = 100
+    response = api_client.post(
+        "/api/candidates/import",
+        files=[
+            ("files", ("a.txt", b"x" * 60, "text/plain")),
+            ("files", ("b.txt", b"y" * 60, "text/plain")),
+        ],
+        headers=headers,
+    )
+    assert response.status_code == 400
+    assert "100 byte total limit" in response.json()["detail"]
+    assert api_client.app.state.container.storage_service.list_candidates() == []
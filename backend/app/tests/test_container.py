@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from backend.app.api.dependencies import get_storage_service
+from backend.app.main import create_app
+from backend.app.services.container import ServiceContainer
+
+
+def test_container_builds_services_once(test_settings):
+    container = ServiceContainer(test_settings)
+    assert container.auth_service is container.auth_service
+    assert container.storage_service.candidate_repository is container.sheets_repository
+
+
+def test_container_registry_uses_the_given_settings(test_settings):
+    test_settings.spacy_model = "blank:en"
+    test_settings.spacy_fallback_model = None
+    container = ServiceContainer(test_settings)
+    assert container.nlp_registry.model_name == "blank:en"
+    assert container.parsing_service.nlp_registry is container.nlp_registry
+
+
+def test_container_shutdown_closes_members(test_settings):
+    closed = []
+
+    class ClosingStub:
+        def close(self):
+            closed.append("stub")
+
+    container = ServiceContainer(test_settings)
+    container.override("drive_repository", ClosingStub())
+    container.shutdown()
+    assert closed == ["stub"]
+
+
+def test_dependency_overrides_still_apply(test_settings):
+    class FakeStorage:
+        def page_candidates(
+            self, status=None, limit=20, cursor=None, sort="received_at", descending=True
+        ):
+            return [], None
+
+        def count_candidates(self, status=None):
+            return 0
+
+        def change_tag(self):
+            return "test-0"
+
+    app = create_app(settings=test_settings)
+    app.dependency_overrides[get_storage_service] = FakeStorage
+    client = TestClient(app)
+    token = client.post(
+        "/api/auth/login", json={"email": "admin@example.com", "password": "admin123"}
+    ).json()["access_token"]
+    response = client.get("/api/candidates", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json() == {"count": 0, "items": [], "next_cursor": None}
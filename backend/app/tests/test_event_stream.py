@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.models.response_models import CandidateRecord
+from backend.app.services.event_hub import EventHub
+
+
+@pytest.mark.asyncio
+async def test_hub_delivers_across_threads_and_drops_slow_consumers():
+    hub = EventHub(queue_size=2)
+    fast, slow = hub.subscribe(), hub.subscribe()
+    await asyncio.to_thread(hub.publish, "status_updated", {"n": 1}, "7")
+    event = await fast.get()
+    assert event.encode() == 'event: status_updated\nid: 7\ndata: {"n":1}\n\n'
+
+    for n in range(2, 5):
+        hub.publish("status_updated", {"n": n})
+    await asyncio.sleep(0)
+    assert slow.dropped and await slow.get() is None
+    hub.unsubscribe(slow)
+    assert hub.stats() == {"subscribers": 1, "published": 4, "dropped_subscribers": 1}
+
+
+def test_stream_requires_auth(api_client):
+    assert api_client.get("/api/candidates/stream").status_code == 401
+
+
+def test_stream_pushes_storage_events(api_client):
+    token = api_client.post(
+        "/api/auth/login", json={"email": "admin@example.com", "password": "admin123"}
+    ).json()["access_token"]
+    container = api_client.app.state.container
+
+    def publish_then_close():
+        deadline = time.monotonic() + 5
+        while container.event_hub.stats()["subscribers"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        container.storage_service.persist_candidate(
+            CandidateRecord(
+                full_name="Streamed", source="test", received_at=datetime.now(timezone.utc)
+            )
+        )
+        container.event_hub.close()  # ends the stream so the test client can return
+
+    publisher = threading.Thread(target=publish_then_close)
+    publisher.start()
+    response = api_client.get(
+        "/api/candidates/stream",
+        headers={"Authorization": f"Bearer {token}", "Last-Event-ID": "-1"},
+    )
+    publisher.join()
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")
+    assert frames[0] == "retry: 5000"
+    assert frames[1].startswith("event: resync")
+    assert frames[2].startswith("event: candidate_ingested\nid: ")
+    assert '"full_name":"Streamed"' in frames[2]
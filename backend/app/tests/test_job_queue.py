@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from backend.app.workers.job_queue import DEAD, QUEUED, RUNNING, SUCCEEDED, JobQueue
+from backend.app.workers.runner import JobWorker, RetryLater
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    job_queue = JobQueue(tmp_path / "jobs.db", max_attempts=2, retry_base_seconds=10, clock=clock)
+    yield job_queue
+    job_queue.close()
+
+
+def test_failed_jobs_back_off_then_dead_letter(queue, clock):
+    calls = []
+
+    def flaky(payload):
+        calls.append(payload["n"])
+        raise RuntimeError("boom")
+
+    worker = JobWorker(queue, {"flaky": flaky})
+    job_id = queue.enqueue("flaky", {"n": 1})
+
+    assert worker.run_once() is True
+    job = queue.get(job_id)
+    assert job.status == QUEUED and job.attempts == 1 and "boom" in job.last_error
+    assert worker.run_once() is False  # still backing off
+    clock.now += 13  # base delay 10s with +/-20% jitter
+    assert worker.run_once() is True
+
+    assert calls == [1, 1]
+    assert queue.get(job_id).status == DEAD
+    assert queue.stats()["dead"] == 1 and queue.stats()["depth"] == 0
+    assert queue.retry_dead(job_id) and queue.get(job_id).status == QUEUED
+
+
+def test_retry_later_defers_without_spending_an_attempt(queue, clock):
+    outcomes = iter([RetryLater("busy", delay=30), RetryLater("busy", delay=30), None])
+
+    def contended(payload):
+        outcome = next(outcomes)
+        if outcome is not None:
+            raise outcome
+        return {"ok": True}
+
+    worker = JobWorker(queue, {"contended": contended})
+    job_id = queue.enqueue("contended", {})
+    for _ in range(2):  # more deferrals than max_attempts allows failures
+        assert worker.run_once() is True
+        job = queue.get(job_id)
+        assert job.status == QUEUED and job.attempts == 0 and job.last_error == "busy"
+        assert worker.run_once() is False
+        clock.now += 31
+
+    assert worker.run_once() is True
+    assert queue.get(job_id).status == SUCCEEDED
+    assert worker.stats()["failed"] == 0
+
+
+def test_expired_lease_is_redelivered(queue, clock):
+    job_id = queue.enqueue("ingest", {"body": "hi"})
+    first = queue.claim("crashed-worker", lease_seconds=30)
+    assert first.id == job_id and queue.get(job_id).status == RUNNING
+    assert queue.claim("other", lease_seconds=30) is None
+
+    clock.now += 31
+    worker = JobWorker(queue, {"ingest": lambda payload: {"echo": payload["body"]}})
+    assert worker.run_once() is True
+    job = queue.get(job_id)
+    assert job.status == SUCCEEDED and job.attempts == 2 and job.result == {"echo": "hi"}
+
+
+def test_webhook_enqueues_job_and_reports_status(api_client):
+    response = api_client.post(
+        "/api/whatsapp/webhook", data={"From": "whatsapp:+1", "Body": "Hi", "NumMedia": "0"}
+    )
+    assert response.status_code == 200
+    job_id = response.headers["X-Job-Id"]
+
+    token = api_client.post(
+        "/api/auth/login", json={"email": "admin@example.com", "password": "admin123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    job = api_client.get(f"/api/jobs/{job_id}", headers=headers).json()
+    assert job["kind"] == "whatsapp_message" and job["status"] == "queued"
+    stats = api_client.get("/api/jobs/stats", headers=headers).json()
+    assert stats["depth"] == 1 and stats["queued"] == 1
+    assert api_client.get("/api/jobs/missing", headers=headers).status_code == 404
+
+
+def test_expired_lease_on_last_attempt_is_dead_lettered(queue, clock):
+    job_id = queue.enqueue("ocr", {"file": "bad.pdf"})
+    for _ in range(2):  # max_attempts=2; each worker "crashes" holding the lease
+        assert queue.claim("crashing-worker", lease_seconds=30).id == job_id
+        clock.now += 31
+
+    assert queue.claim("next-worker", lease_seconds=30) is None
+    job = queue.get(job_id)
+    assert job.status == DEAD and "Lease expired on attempt 2" in job.last_error
+
+
+def test_stale_worker_cannot_settle_a_redelivered_job(queue, clock):
+    job_id = queue.enqueue("ingest", {})
+    queue.claim("slow-worker", lease_seconds=30)
+    clock.now += 31
+    queue.claim("fresh-worker", lease_seconds=30)
+
+    assert queue.extend_lease(job_id, "slow-worker", 30) is False
+    assert queue.complete(job_id, {"from": "slow"}, worker_id="slow-worker") is False
+    assert queue.fail(job_id, "late", worker_id="slow-worker") == RUNNING
+    assert queue.complete(job_id, {"from": "fresh"}, worker_id="fresh-worker") is True
+    assert queue.get(job_id).result == {"from": "fresh"}
+
+
+def test_heartbeat_keeps_long_jobs_leased(tmp_path):
+    queue = JobQueue(tmp_path / "jobs.db")
+    released = threading.Event()
+    started = threading.Event()
+
+    def long_ocr(payload):
+        started.set()
+        released.wait(5)
+        return {}
+
+    worker = JobWorker(queue, {"ocr": long_ocr}, lease_seconds=0.2)
+    job_id = queue.enqueue("ocr", {})
+    runner = threading.Thread(target=worker.run_once, args=("worker-a",))
+    runner.start()
+    try:
+        assert started.wait(5)
+        time.sleep(0.5)  # well past the original lease
+        assert queue.claim("worker-b", lease_seconds=0.2) is None
+    finally:
+        released.set()
+        runner.join()
+    assert queue.get(job_id).status == SUCCEEDED
+    queue.close()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from backend.app.services.media_fetcher import MediaFetcher, MediaRequest, build_session
+from backend.app.utils.attachment_blob import AttachmentBlob
+from backend.app.utils.file_utils import TransientDownloadError
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports = set()
+    # "/pair*" requests only answer once a second one is in flight, proving overlap.
+    pairs = threading.Barrier(2, timeout=5)
+    unpaired = 0
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        MediaHandler.ports.add(self.client_address[1])
+        if self.path == "/missing":
+            return self._reply(404, b"")
+        if self.path == "/flaky":
+            return self._reply(503, b"")
+        if self.path.startswith("/pair"):
+            try:
+                MediaHandler.pairs.wait()
+            except threading.BrokenBarrierError:
+                MediaHandler.unpaired += 1
+        self._reply(200, b"y" * (4096 if self.path == "/big" else 512))
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def media_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MediaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    MediaHandler.ports = set()
+    MediaHandler.pairs = threading.Barrier(2, timeout=5)
+    MediaHandler.unpaired = 0
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_media_of_a_message_is_fetched_concurrently_over_pooled_connections(media_server):
+    fetcher = MediaFetcher(concurrency=4, per_host_connections=2, max_bytes=1024)
+    items = [
+        MediaRequest(f"{media_server}/pair{index}", f"attachment_{index}") for index in range(4)
+    ]
+    try:
+        blobs = fetcher.fetch_all(items)
+        fetcher.fetch_all(items)  # second message reuses the kept-alive connections
+
+        assert all(blob is not None and blob.size == 512 for blob in blobs)
+        assert blobs[0].filename == "attachment_0.jpg"
+        assert MediaHandler.unpaired == 0  # every download overlapped with another
+        assert len(MediaHandler.ports) <= 2
+
+        assert fetcher.fetch(MediaRequest(f"{media_server}/big", "huge")) is None  # over max_bytes
+        assert fetcher.fetch(MediaRequest(f"{media_server}/missing", "gone")) is None
+        stats = fetcher.stats()
+        assert stats["downloads"] == 10 and stats["failures"] == 2 and stats["bytes"] == 8 * 512
+    finally:
+        fetcher.close()
+
+
+def test_transient_failure_raises_and_closes_fetched_blobs(media_server, monkeypatch):
+    closed = []
+    original_close = AttachmentBlob.close
+    monkeypatch.setattr(
+        AttachmentBlob, "close", lambda blob: (closed.append(blob.filename), original_close(blob))
+    )
+    fetcher = MediaFetcher(concurrency=2, session=build_session(2, retries=0))
+    items = [
+        MediaRequest(f"{media_server}/img0", "attachment_0"),
+        MediaRequest(f"{media_server}/flaky", "attachment_1"),
+    ]
+    try:
+        with pytest.raises((TransientDownloadError, requests.RequestException)):
+            fetcher.fetch_all(items)
+        assert closed == ["attachment_0.jpg"]
+    finally:
+        fetcher.close()
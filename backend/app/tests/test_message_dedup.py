@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.models.response_models import CandidateRecord
+from backend.app.repositories.message_dedup import (
+    CLAIMED,
+    DUPLICATE,
+    IN_PROGRESS,
+    MessageDedupStore,
+    MessageInProgressError,
+)
+from backend.app.services.whatsapp_service import WhatsAppService
+from backend.app.workers.runner import RetryLater
+from backend.app.workers.tasks import WHATSAPP_MESSAGE, build_handlers
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingIngestion:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    def ingest_payload(self, source, body, attachments=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("ocr crashed")
+        return CandidateRecord(
+            full_name="Jane Doe", source=source, received_at=datetime.now(timezone.utc)
+        )
+
+
+def test_dedup_store_survives_restart_and_expires(tmp_path):
+    clock = FakeClock()
+    store = MessageDedupStore(
+        tmp_path / "dedup.db", ttl_seconds=60, processing_timeout=10, clock=clock
+    )
+    assert store.claim("SM1", "w1") == CLAIMED
+    assert store.claim("SM1", "w2") == IN_PROGRESS
+    clock.now += 11  # crashed worker's claim lapses
+    assert store.claim("SM1", "w2") == CLAIMED
+    store.complete("SM1", "w2", "cand-1")
+    assert store.claim("SM1", "w3") == DUPLICATE
+    store.close()
+
+    reopened = MessageDedupStore(tmp_path / "dedup.db", ttl_seconds=60, clock=clock)
+    assert reopened.claim("SM1", "w3") == DUPLICATE
+    clock.now += 61
+    assert reopened.claim("SM1", "w3") == CLAIMED
+    assert reopened.stats()["duplicates"] == 1
+    reopened.close()
+
+
+def test_only_the_claim_owner_can_settle_a_message(tmp_path):
+    clock = FakeClock()
+    store = MessageDedupStore(tmp_path / "dedup.db", processing_timeout=10, clock=clock)
+    assert store.claim("SM1", "slow") == CLAIMED
+    clock.now += 11  # the slow worker's claim lapses and another worker takes over
+    assert store.claim("SM1", "fresh") == CLAIMED
+
+    assert store.release("SM1", "slow") is False
+    assert store.complete("SM1", "slow", "cand-slow") is False
+    assert store.claim("SM1", "third") == IN_PROGRESS  # the fresh claim is untouched
+    assert store.complete("SM1", "fresh", "cand-fresh") is True
+    assert store.claim("SM1", "third") == DUPLICATE
+    store.close()
+
+
+def test_whatsapp_service_ingests_each_message_sid_once(test_settings, tmp_path):
+    store = MessageDedupStore(tmp_path / "dedup.db")
+    ingestion = CountingIngestion()
+    service = WhatsAppService(
+        settings=test_settings, ingestion_service=ingestion, dedup_store=store
+    )
+    payload = {"MessageSid": "SM42", "Body": "Jane Doe", "NumMedia": "0"}
+
+    assert service.process_incoming_message(payload).full_name == "Jane Doe"
+    assert service.process_incoming_message(payload) is None
+    assert ingestion.calls == 1 and store.stats()["duplicates"] == 1
+
+    failing = WhatsAppService(
+        settings=test_settings, ingestion_service=CountingIngestion(fail=True), dedup_store=store
+    )
+    with pytest.raises(RuntimeError):
+        failing.process_incoming_message({"MessageSid": "SM43", "Body": "x"})
+    assert store.claim("SM43", "probe") == CLAIMED  # failed attempt released its claim
+    with pytest.raises(MessageInProgressError):
+        service.process_incoming_message({"MessageSid": "SM43", "Body": "x"})
+    store.close()
+
+
+def test_whatsapp_job_defers_while_another_worker_holds_the_message(test_settings, tmp_path):
+    store = MessageDedupStore(tmp_path / "dedup.db")
+    store.claim("SM7", "other-worker")
+    container = SimpleNamespace(
+        whatsapp_service=WhatsAppService(
+            settings=test_settings, ingestion_service=CountingIngestion(), dedup_store=store
+        ),
+        job_queue=SimpleNamespace(retry_base_seconds=5.0),
+    )
+
+    with pytest.raises(RetryLater) as deferred:
+        build_handlers(container)[WHATSAPP_MESSAGE]({"MessageSid": "SM7", "Body": "x"})
+    assert deferred.value.delay == 5.0
+    store.close()
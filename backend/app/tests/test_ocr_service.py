@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import base64
+import time
+
+import pytest
+
+from backend.app.models.request_models import AttachmentPayload
+from backend.app.services.ocr_pool import OCRPool, PageOutcome, adaptive_dpi, fitz
+from backend.app.services.ocr_service import OCRService
+from backend.app.utils.extraction_cache import CachedExtraction, ExtractionCache
+
+
+def _attachment(text: str, filename: str = "resume.txt") -> AttachmentPayload:
+    return AttachmentPayload(content=base64.b64encode(text.encode()).decode(), filename=filename)
+
+
+def test_repeat_submissions_skip_extraction(test_settings, tmp_path, monkeypatch):
+    service = OCRService(settings=test_settings, cache=ExtractionCache(tmp_path / "cache"))
+    calls = []
+    original = service._extract_text
+    monkeypatch.setattr(
+        service, "_extract_text", lambda path, ct: calls.append(path) or original(path, ct)
+    )
+
+    first = service.extract_from_attachments([_attachment("Jane Doe\nPython")])
+    again = service.extract_from_attachments([_attachment("Jane Doe\nPython", filename="copy.txt")])
+    other = service.extract_from_attachments([_attachment("John Roe")])
+
+    assert len(calls) == 2
+    assert (again[0].text, again[0].confidence) == (first[0].text, first[0].confidence)
+    assert other[0].text != first[0].text
+
+    reopened = ExtractionCache(tmp_path / "cache")  # survives restarts via the disk tier
+    assert reopened.stats()["entries"] == 2
+
+
+def test_extraction_cache_evicts_least_recently_used(tmp_path):
+    cache = ExtractionCache(tmp_path / "cache", max_bytes=150, memory_entries=1)
+    for key in ("a1", "b2", "c3"):
+        cache.set(key, CachedExtraction(text=key * 10, confidence=0.5))
+        if key == "b2":
+            assert cache.get("a1") is not None  # touch a1 so b2 becomes the eviction victim
+
+    assert cache.get("b2") is None
+    assert cache.get("a1") is not None and cache.get("c3") is not None
+    assert cache.stats()["bytes"] <= 150 and cache.stats()["evictions"] == 1
+
+
+def test_extraction_cache_sees_entries_from_other_processes(tmp_path):
+    writer = ExtractionCache(tmp_path / "cache", max_bytes=150, memory_entries=1)
+    reader = ExtractionCache(tmp_path / "cache", max_bytes=150, memory_entries=1, rescan_seconds=0)
+
+    writer.set("a1", CachedExtraction(text="a1" * 10, confidence=0.5))
+    assert reader.get("a1") == CachedExtraction(text="a1" * 10, confidence=0.5)
+    writer.set("b2", CachedExtraction(text="b2" * 10, confidence=0.5))
+    # The reader's own write pushes the shared directory over budget; its eviction counts
+    # the writer's files too.
+    reader.set("c3", CachedExtraction(text="c3" * 10, confidence=0.5))
+
+    assert reader.stats()["bytes"] <= 150 and reader.stats()["evictions"] == 1
+    assert len(list((tmp_path / "cache").glob("*/*.json"))) == 2
+    assert writer.get("a1") is None  # oldest use; evicted by the reader, the writer notices
+
+
+def _fake_page(path: str, page_number: int, dpi: int) -> PageOutcome:
+    time.sleep(1.0 if page_number > 2 else 0.01)
+    return PageOutcome(page_number=page_number, text=f"page {page_number}", seconds=0.01)
+
+
+def _blank_pdf(path, pages: int):
+    document = fitz.open()
+    for _ in range(pages):
+        document.new_page()
+    document.save(path)
+    document.close()
+    return path
+
+
+@pytest.mark.skipif(fitz is None, reason="PyMuPDF not installed")
+def test_ocr_pool_recognizes_pages_in_order_within_budget(tmp_path):
+    pdf = _blank_pdf(tmp_path / "scan.pdf", pages=4)
+    pool = OCRPool(workers=2, page_worker=_fake_page, start_method="fork")
+    try:
+        full = pool.recognize_pdf(pdf, budget_seconds=30)
+        assert full.text == "page 1\npage 2\npage 3\npage 4" and not full.timed_out
+
+        cut = pool.recognize_pdf(pdf, budget_seconds=0.5)
+        assert cut.timed_out and cut.pages_done == 2 and cut.text == "page 1\npage 2"
+        stats = pool.stats()
+        assert stats["pages"] == 6 and stats["timeouts"] == 1 and 0 < stats["utilization"] <= 1
+    finally:
+        pool.close()
+
+
+def test_adaptive_dpi_caps_large_pages():
+    assert adaptive_dpi(612, 792, max_dpi=300, min_dpi=150, max_pixels=12_000_000) == 300  # letter
+    assert (
+        adaptive_dpi(1684, 2384, max_dpi=300, min_dpi=150, max_pixels=12_000_000) == 150
+    )  # A1 poster, floored
+    assert (
+        200 < adaptive_dpi(842, 1191, max_dpi=300, min_dpi=150, max_pixels=12_000_000) < 300
+    )  # A3
+
+
+@pytest.mark.skipif(fitz is None, reason="PyMuPDF not installed")
+def test_inline_ocr_stops_at_max_pages_and_reports_peak_memory(tmp_path):
+    pdf = _blank_pdf(tmp_path / "portfolio.pdf", pages=5)
+    seen = []
+
+    def page_worker(path, page_number, dpi):
+        seen.append((page_number, dpi))
+        return PageOutcome(
+            page_number=page_number, text=f"p{page_number}", seconds=0.0, rss_bytes=page_number * 10
+        )
+
+    pool = OCRPool(workers=0, page_worker=page_worker, max_pages=3)
+    result = pool.recognize_pdf(pdf, budget_seconds=30)
+
+    assert [number for number, _ in seen] == [1, 2, 3]  # rendered strictly one page at a time
+    assert result.text == "p1\np2\np3" and result.pages_skipped == 2
+    assert result.peak_rss_bytes == 30 and pool.stats()["truncated_documents"] == 1
+
+
+@pytest.mark.skipif(fitz is None, reason="PyMuPDF not installed")
+def test_mixed_pdf_only_ocrs_pages_without_a_text_layer(test_settings, tmp_path):
+    document = fitz.open()
+    for number in (1, 2, 3):
+        page = document.new_page()
+        if number != 2:  # page 2 stands in for a scanned image
+            page.insert_text(
+                (72, 72), f"Page {number} lists Python, SQL and cloud experience in detail."
+            )
+    document.save(tmp_path / "mixed.pdf")
+    document.close()
+
+    recognized = []
+
+    def page_worker(path, page_number, dpi):
+        recognized.append(page_number)
+        return PageOutcome(page_number=page_number, text="scanned page text", seconds=0.0)
+
+    service = OCRService(settings=test_settings, pool=OCRPool(workers=0, page_worker=page_worker))
+    text, partial = service._extract_from_pdf(tmp_path / "mixed.pdf")
+
+    assert recognized == [2] and not partial
+    lines = text.splitlines()
+    assert (
+        lines[0].startswith("Page 1")
+        and "scanned page text" in lines
+        and lines[-1].startswith("Page 3")
+    )
+
+
+@pytest.mark.skipif(fitz is None, reason="PyMuPDF not installed")
+def test_partial_ocr_results_are_not_cached(test_settings, tmp_path):
+    pdf = _blank_pdf(tmp_path / "scan.pdf", pages=2)
+    calls = []
+
+    def page_worker(path, page_number, dpi):
+        calls.append(page_number)
+        if page_number == 2:
+            raise RuntimeError("tesseract crashed")
+        return PageOutcome(page_number=page_number, text="Jane Doe, Python developer", seconds=0.0)
+
+    service = OCRService(
+        settings=test_settings,
+        cache=ExtractionCache(tmp_path / "cache"),
+        pool=OCRPool(workers=0, page_worker=page_worker),
+    )
+    payload = AttachmentPayload(
+        content=base64.b64encode(pdf.read_bytes()).decode(), filename="scan.pdf"
+    )
+    service.extract_from_attachments([payload])
+    service.extract_from_attachments([payload])
+
+    assert calls == [1, 2, 1, 2]  # the truncated text was not served from the cache
+    assert service.cache.stats()["entries"] == 0
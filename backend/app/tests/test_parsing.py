@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from backend.app.models.request_models import AttachmentPayload
+from backend.app.services.nlp_registry import NLPModelRegistry
+from backend.app.services.ocr_service import AttachmentResult
 from backend.app.services.parsing_service import ParsingService
+from backend.app.utils.micro_batcher import MicroBatcher
 
 
 def test_parsing_basic_entities(test_settings):
@@ -27,3 +33,99 @@ def test_parsing_with_attachment(monkeypatch, tmp_path, test_settings):
         source="test",
     )
     assert record.location in {None, "Bengaluru"}
+
+
+def test_nlp_registry_loads_once_and_hot_reloads():
+    registry = NLPModelRegistry("blank:en")
+    first = registry.get()
+    assert registry.get() is first
+    assert registry.stats().model_name == "blank:en"
+
+    registry.reload("blank:xx")
+    assert registry.get() is not first
+    assert registry.stats().model_name == "blank:xx"
+
+
+def test_parsing_service_shares_registry_model(test_settings):
+    registry = NLPModelRegistry("blank:en")
+    first = ParsingService(settings=test_settings, nlp_registry=registry)
+    second = ParsingService(settings=test_settings, nlp_registry=registry)
+    assert first._nlp is second._nlp
+    record = second.parse_payload(body="Reach me at jane@example.com", source="test")
+    assert record.email == "jane@example.com"
+
+
+def test_micro_batcher_flushes_on_size_or_deadline():
+    batches = []
+    batcher = MicroBatcher(
+        lambda items: batches.append(list(items)) or [item * 2 for item in items],
+        max_batch_size=3,
+        max_wait_seconds=0.05,
+    )
+    try:
+        futures = [batcher.submit(n) for n in range(4)]
+        assert [future.result(timeout=2) for future in futures] == [0, 2, 4, 6]
+        assert batches == [[0, 1, 2], [3]]  # full batch at once, the straggler after the deadline
+        assert batcher.stats()["size_flushes"] == 1
+    finally:
+        batcher.close()
+
+
+def test_parse_many_matches_single_parses_and_micro_batches_concurrent_calls(test_settings):
+    registry = NLPModelRegistry("blank:en")
+    results = [
+        [
+            AttachmentResult(
+                filename=f"cv{n}.txt", text=f"mail{n}@example.com Python", confidence=0.8
+            )
+        ]
+        for n in range(4)
+    ]
+    single = ParsingService(settings=test_settings, nlp_registry=registry)
+    expected = [single.parse_extracted("", items, source="test").email for items in results]
+    batch = single.parse_many([("", items) for items in results], source="test")
+    assert [record.email for record in batch] == expected
+
+    test_settings.nlp_micro_batch_size = 4
+    test_settings.nlp_micro_batch_wait_ms = 2000
+    batched = ParsingService(settings=test_settings, nlp_registry=registry)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            records = list(
+                pool.map(lambda items: batched.parse_extracted("", items, source="test"), results)
+            )
+        assert [record.email for record in records] == expected
+        assert batched.batcher.stats()["batches"] == 1
+    finally:
+        batched.close()
+
+
+def test_micro_batched_parses_enrich_in_the_calling_thread(test_settings):
+    class RecordingAIParser:
+        threads = set()
+
+        def is_enabled(self):
+            return True
+
+        def enrich(self, text, fields):
+            RecordingAIParser.threads.add(threading.current_thread().name)
+            return None
+
+    test_settings.nlp_micro_batch_size = 2
+    test_settings.nlp_micro_batch_wait_ms = 2000
+    service = ParsingService(
+        settings=test_settings,
+        ai_parser_service=RecordingAIParser(),
+        nlp_registry=NLPModelRegistry("blank:en"),
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="caller") as pool:
+            list(
+                pool.map(lambda body: service.parse_extracted(body, [], source="test"), ["a", "b"])
+            )
+        assert service.batcher.stats()["batches"] == 1
+        assert RecordingAIParser.threads and all(
+            name.startswith("caller") for name in RecordingAIParser.threads
+        )
+    finally:
+        service.close()
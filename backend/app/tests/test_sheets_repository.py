@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.models.response_models import CandidateRecord, CandidateStatus
+from backend.app.repositories import local_candidate_log as local_log_module
+from backend.app.repositories import sheets_repository as sheets_module
+from backend.app.repositories.candidate_index import CandidateIndex
+from backend.app.repositories.change_journal import ChangeJournal
+from backend.app.repositories.local_candidate_log import CandidateLogStore
+from backend.app.repositories.sheets_repository import (
+    SHEET_HEADER,
+    SheetsRepository,
+    contiguous_runs,
+)
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+
+    def batch_update(self, body):
+        self.worksheet._count("spreadsheet.batch_update")
+        for request in body["requests"]:
+            span = request["deleteDimension"]["range"]
+            del self.worksheet.rows[span["startIndex"] : span["endIndex"]]
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread worksheet that counts API calls."""
+
+    id = 0
+
+    def __init__(self, rows=None):
+        self.rows = [list(SHEET_HEADER)] + [list(row) for row in rows or []]
+        self.calls: dict[str, int] = {}
+        self.spreadsheet = FakeSpreadsheet(self)
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def row_values(self, row):
+        self._count("row_values")
+        return list(self.rows[row - 1])
+
+    def col_values(self, col):
+        self._count("col_values")
+        return [row[col - 1] if len(row) >= col else "" for row in self.rows]
+
+    def get_all_values(self):
+        self._count("get_all_values")
+        return [list(row) for row in self.rows]
+
+    def append_row(self, row, value_input_option=None):
+        self._count("append_row")
+        self.rows.append([str(value) for value in row])
+        number = len(self.rows)
+        return {"updates": {"updatedRange": f"Sheet1!A{number}:M{number}"}}
+
+    def append_rows(self, rows, value_input_option=None):
+        self._count("append_rows")
+        first = len(self.rows) + 1
+        self.rows.extend([str(value) for value in row] for row in rows)
+        return {"updates": {"updatedRange": f"Sheet1!A{first}:M{len(self.rows)}"}}
+
+    def update_cell(self, row, col, value):
+        self._count("update_cell")
+        self.rows[row - 1][col - 1] = value
+
+    def delete_rows(self, row):
+        self._count("delete_rows")
+        del self.rows[row - 1]
+
+    def batch_update(self, data, value_input_option=None):
+        self._count("batch_update")
+        for value_range in data:
+            start, end = value_range["range"].split(":")
+            column = ord(start[0]) - ord("A")
+            for offset, row in enumerate(range(int(start[1:]), int(end[1:]) + 1)):
+                self.rows[row - 1][column] = value_range["values"][offset][0]
+
+
+def _record(name: str, minutes_ago: int) -> CandidateRecord:
+    return CandidateRecord(
+        full_name=name,
+        source="test",
+        received_at=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+    )
+
+
+def _legacy_row(name: str, status: str = "") -> list[str]:
+    return [datetime.now(timezone.utc).isoformat(), name] + [""] * 8 + ["0", "", status]
+
+
+@pytest.fixture
+def sheet_repo(monkeypatch, test_settings, request):
+    worksheet = FakeWorksheet(getattr(request, "param", None))
+    monkeypatch.setattr(SheetsRepository, "_bootstrap_google_sheet", lambda self: worksheet)
+    repo = SheetsRepository(settings=test_settings)
+    return repo, worksheet
+
+
+def test_index_serves_reads_and_writes_without_full_sheet_reads(sheet_repo):
+    repo, worksheet = sheet_repo
+    older, newer = _record("Older", 10), _record("Newer", 1)
+    repo.append_candidate(older)
+    repo.append_candidate(newer)
+
+    assert [item.full_name for item in repo.list_candidates()] == ["Newer", "Older"]
+    repo.update_status(older.candidate_id, CandidateStatus.APPROVED)
+    assert worksheet.rows[1][SHEET_HEADER.index("Status")] == "approved"
+    assert [item.full_name for item in repo.list_candidates(status=CandidateStatus.APPROVED)] == [
+        "Older"
+    ]
+
+    repo.delete_candidate(older.candidate_id)
+    assert repo.get_candidate(older.candidate_id) is None
+    # The newer row moved up after the delete and is still addressable.
+    repo.update_status(newer.candidate_id, CandidateStatus.INTERVIEW)
+    assert worksheet.rows[1][SHEET_HEADER.index("Status")] == "interview"
+    assert worksheet.calls["get_all_values"] == 1
+
+
+def _sheet_row(candidate_id: str, name: str, status: str = "new") -> list[str]:
+    return [datetime.now(timezone.utc).isoformat(), name] + [""] * 8 + ["0", candidate_id, status]
+
+
+@pytest.mark.parametrize(
+    "sheet_repo",
+    [[_sheet_row(f"id-{n}", f"C{n}", "rejected" if n in {2, 3} else "new") for n in range(5)]],
+    indirect=True,
+)
+def test_row_writes_follow_rows_moved_by_other_processes(sheet_repo):
+    repo, worksheet = sheet_repo
+    assert len(repo.list_candidates()) == 5
+    status_col, name_col = SHEET_HEADER.index("Status"), 1
+
+    # Another process inserts a row at the top; every cached row number is now off by one.
+    worksheet.rows.insert(1, _sheet_row("id-x", "External"))
+    repo.update_status("id-1", CandidateStatus.APPROVED)
+    assert {row[name_col]: row[status_col] for row in worksheet.rows[1:]}["C1"] == "approved"
+    assert {row[name_col]: row[status_col] for row in worksheet.rows[1:]}["C0"] == "new"
+
+    worksheet.rows.insert(1, _sheet_row("id-y", "External 2"))
+    repo.delete_candidate("id-0")
+    assert [row[name_col] for row in worksheet.rows[1:]] == [
+        "External 2",
+        "External",
+        "C1",
+        "C2",
+        "C3",
+        "C4",
+    ]
+
+    # Another process deletes a row above the rejected ones.
+    del worksheet.rows[1]
+    assert repo.delete_by_status(CandidateStatus.REJECTED) == 2
+    assert [row[name_col] for row in worksheet.rows[1:]] == ["External", "C1", "C4"]
+    assert repo.get_candidate("id-4").sheet_row == 4
+    assert worksheet.calls["get_all_values"] == 4  # initial load plus one reload per shift
+
+
+def test_index_refreshes_after_ttl_when_sheet_changes(sheet_repo, monkeypatch):
+    repo, worksheet = sheet_repo
+    repo.settings.sheets_index_ttl_seconds = 0
+    assert repo.list_candidates() == []
+    external = _record("External", 0)
+    worksheet.rows.append(
+        [external.received_at.isoformat(), "External"] + [""] * 8 + ["0", "ext-1", "new"]
+    )
+    monkeypatch.setattr(
+        sheets_module.SheetsRepository, "_probe_source_version", lambda self: len(worksheet.rows)
+    )
+    assert [item.candidate_id for item in repo.list_candidates()] == ["ext-1"]
+
+
+def test_local_repositories_share_the_operation_log(test_settings):
+    first = SheetsRepository(settings=test_settings)
+    second = SheetsRepository(settings=test_settings)  # e.g. another uvicorn worker
+    record = _record("Shared", 1)
+    first.append_candidate(record)
+    assert second.get_candidate(record.candidate_id) is not None
+
+    second.update_status(record.candidate_id, CandidateStatus.APPROVED)
+    assert first.get_candidate(record.candidate_id).status == CandidateStatus.APPROVED
+    first.delete_candidate(record.candidate_id)
+    assert second.list_candidates() == []
+
+
+def test_local_log_imports_legacy_json_and_compacts(test_settings, temp_data_dir):
+    legacy = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "full_name": "Legacy",
+        "source": "test",
+    }
+    (temp_data_dir / "candidates.json").write_text(json.dumps([legacy]))
+    repo = SheetsRepository(settings=test_settings)
+    reader = SheetsRepository(settings=test_settings)
+    (imported,) = repo.list_candidates()
+    assert imported.full_name == "Legacy"
+
+    for status in (CandidateStatus.APPROVED, CandidateStatus.INTERVIEW, CandidateStatus.SELECTED):
+        repo.update_status(imported.candidate_id, status)
+    repo._log_store.compact()
+    header, *log_lines = (temp_data_dir / "candidates.log.jsonl").read_text().splitlines()
+    assert json.loads(header)["op"] == "compaction" and len(log_lines) == 1
+    # Other processes notice the swapped file and rebuild their view from it.
+    assert reader.get_candidate(imported.candidate_id).status == CandidateStatus.SELECTED
+    reader.append_candidate(_record("After compaction", 0))
+    assert len(repo.list_candidates()) == 2
+
+
+def test_local_log_detects_compaction_when_inode_and_size_repeat(temp_data_dir, monkeypatch):
+    real_fstat = os.fstat
+
+    def fstat_with_reused_inode(fd):
+        stat = real_fstat(fd)
+        return os.stat_result((stat.st_mode, 1) + tuple(stat)[2:])
+
+    monkeypatch.setattr(local_log_module.os, "fstat", fstat_with_reused_inode)
+    path = temp_data_dir / "ops.log.jsonl"
+    writer = CandidateLogStore(path, compact_threshold=10_000)
+    reader = CandidateLogStore(path, compact_threshold=10_000)
+    writer.insert_many([{"candidate_id": f"old-{n}", "status": "new"} for n in range(3)])
+    reader.sync()
+    writer.delete([f"old-{n}" for n in range(3)])
+    writer.compact()
+    # Grow the compacted log past the reader's old offset so only the generation differs.
+    while path.stat().st_size <= reader._offset:
+        writer.insert({"candidate_id": f"new-{writer.seq}", "status": "new"})
+
+    reader.sync()
+    assert {entry["candidate_id"] for entry in reader.entries()} == {
+        entry["candidate_id"] for entry in writer.entries()
+    }
+    assert not any(entry["candidate_id"].startswith("old-") for entry in reader.entries())
+
+
+def test_index_hands_out_copies():
+    index = CandidateIndex()
+    index.replace([_record("Older", 2), _record("Newer", 1), _record("Newest", 0)])
+    assert [record.full_name for record in index.list()] == ["Newest", "Newer", "Older"]
+
+    fetched = index.get(index.list()[0].candidate_id)
+    fetched.status = CandidateStatus.REJECTED
+    fetched.skills.append("Mutated")
+    listed = index.list()[0]
+    assert listed.status == CandidateStatus.NEW and "Mutated" not in listed.skills
+    assert index.count(CandidateStatus.REJECTED) == 0
+
+    loaded = _record("Loaded", 5)
+    index.replace([loaded])
+    loaded.status, loaded.full_name = CandidateStatus.REJECTED, "Mutated"
+    assert index.get(loaded.candidate_id).full_name == "Loaded"
+    assert index.count(CandidateStatus.REJECTED) == 0
+
+
+def test_contiguous_runs_merges_adjacent_rows():
+    assert contiguous_runs([9, 3, 4, 5, 7, 8]) == [(3, 5), (7, 9)]
+
+
+@pytest.mark.parametrize(
+    "sheet_repo", [[_legacy_row(f"Legacy {n}") for n in range(40)]], indirect=True
+)
+def test_metadata_backfill_is_a_single_batch_update(sheet_repo):
+    repo, worksheet = sheet_repo
+    assert len(repo.list_candidates()) == 40
+    assert worksheet.calls.get("update_cell", 0) == 0
+    assert worksheet.calls["batch_update"] == 1
+    assert all(row[SHEET_HEADER.index("Candidate ID")] for row in worksheet.rows[1:])
+    assert all(row[SHEET_HEADER.index("Status")] == "new" for row in worksheet.rows[1:])
+
+
+@pytest.mark.parametrize(
+    "sheet_repo",
+    [[_legacy_row(f"C{n}", "rejected" if n in {1, 2, 3, 6} else "new") for n in range(8)]],
+    indirect=True,
+)
+def test_delete_by_status_merges_rows_into_one_request(sheet_repo):
+    repo, worksheet = sheet_repo
+    assert repo.delete_by_status(CandidateStatus.REJECTED) == 4
+    assert worksheet.calls["spreadsheet.batch_update"] == 1
+    assert worksheet.calls.get("delete_rows", 0) == 0
+    assert [row[1] for row in worksheet.rows[1:]] == ["C0", "C4", "C5", "C7"]
+    # Row mapping survives the bulk delete.
+    survivor = next(item for item in repo.list_candidates() if item.full_name == "C7")
+    assert survivor.sheet_row == 5
+
+
+@pytest.fixture
+def buffered_settings(tmp_path, test_settings):
+    test_settings.sheets_write_behind = True
+    test_settings.sheets_append_flush_seconds = 60
+    test_settings.sheets_append_spill_path = str(tmp_path / "spill.jsonl")
+    return test_settings
+
+
+def test_write_behind_buffers_appends_and_flushes_on_close(monkeypatch, buffered_settings):
+    worksheet = FakeWorksheet()
+    monkeypatch.setattr(SheetsRepository, "_bootstrap_google_sheet", lambda self: worksheet)
+    repo = SheetsRepository(settings=buffered_settings)
+
+    first, second, third = _record("A", 3), _record("B", 2), _record("C", 1)
+    for record in (first, second, third):
+        repo.append_candidate(record)
+    repo.update_status(second.candidate_id, CandidateStatus.APPROVED)
+    repo.delete_candidate(third.candidate_id)
+    assert "append_row" not in worksheet.calls
+    assert [item.full_name for item in repo.list_candidates()] == ["B", "A"]
+
+    repo.close()
+    assert worksheet.calls["append_rows"] == 1
+    assert [row[1] for row in worksheet.rows[1:]] == ["A", "B"]
+    assert worksheet.rows[2][SHEET_HEADER.index("Status")] == "approved"
+    assert repo.get_candidate(second.candidate_id).sheet_row == 3
+
+
+def test_write_behind_recovers_spilled_rows_after_crash(monkeypatch, buffered_settings):
+    worksheet = FakeWorksheet()
+    monkeypatch.setattr(SheetsRepository, "_bootstrap_google_sheet", lambda self: worksheet)
+    crashed = SheetsRepository(settings=buffered_settings)
+    crashed.append_candidate(_record("Spilled", 1))
+    assert len(worksheet.rows) == 1  # never flushed
+    crashed._append_buffer._lock_handle.close()  # the OS drops the lock when a process dies
+
+    recovered = SheetsRepository(settings=buffered_settings)
+    assert [item.full_name for item in recovered.list_candidates()] == ["Spilled"]
+    recovered.close()
+    assert [row[1] for row in worksheet.rows[1:]] == ["Spilled"]
+
+
+def test_write_behind_flush_does_not_block_readers(monkeypatch, buffered_settings):
+    worksheet = FakeWorksheet()
+    monkeypatch.setattr(SheetsRepository, "_bootstrap_google_sheet", lambda self: worksheet)
+    repo = SheetsRepository(settings=buffered_settings)
+    kept, dropped = _record("Kept", 2), _record("Dropped", 1)
+    repo.append_candidate(kept)
+    repo.append_candidate(dropped)
+
+    in_flight = threading.Event()
+    release = threading.Event()
+    append_rows = worksheet.append_rows
+
+    def slow_append_rows(rows, value_input_option=None):
+        in_flight.set()
+        assert release.wait(timeout=5)
+        return append_rows(rows, value_input_option)
+
+    worksheet.append_rows = slow_append_rows
+    flusher = threading.Thread(target=repo._append_buffer.flush)
+    flusher.start()
+    assert in_flight.wait(timeout=5)
+    # Reads and writes go ahead while the sheet call is outstanding.
+    assert {item.full_name for item in repo.list_candidates()} == {"Kept", "Dropped"}
+    repo.update_status(kept.candidate_id, CandidateStatus.APPROVED)
+    repo.delete_candidate(dropped.candidate_id)
+    release.set()
+    flusher.join(timeout=5)
+
+    assert [row[1] for row in worksheet.rows[1:]] == ["Kept"]
+    assert worksheet.rows[1][SHEET_HEADER.index("Status")] == "approved"
+    stored = repo.get_candidate(kept.candidate_id)
+    assert (stored.sheet_row, stored.status) == (2, CandidateStatus.APPROVED)
+    assert len(repo._append_buffer) == 0
+    repo.close()
+
+
+def test_second_process_on_a_spill_file_appends_directly(monkeypatch, buffered_settings):
+    worksheet = FakeWorksheet()
+    monkeypatch.setattr(SheetsRepository, "_bootstrap_google_sheet", lambda self: worksheet)
+    owner = SheetsRepository(settings=buffered_settings)
+    other = SheetsRepository(settings=buffered_settings)
+
+    assert other._append_buffer is None
+    other.append_candidate(_record("Direct", 1))
+    assert worksheet.calls["append_row"] == 1
+    owner.close()
+    successor = SheetsRepository(settings=buffered_settings)
+    assert successor._append_buffer is not None
+    successor.close()
+
+
+def test_change_journal_never_splits_a_version():
+    journal = ChangeJournal(maxlen=4)
+    journal.reset(10)
+    journal.record("a", "insert")
+    for candidate_id in ("b", "c", "d"):
+        journal.record(candidate_id, "delete", version=12)
+    assert [entry.candidate_id for entry in journal.since(10, limit=2)] == ["a"]
+    assert [entry.candidate_id for entry in journal.since(11, limit=1)] == ["b", "c", "d"]
+    journal.record("e", "insert")
+    assert journal.since(10) is None  # "a" fell out of the window
+    assert [entry.candidate_id for entry in journal.since(12)] == ["e"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.models.response_models import CandidateRecord, CandidateStatus
+from backend.app.repositories import sqlite_repository as sqlite_module
+from backend.app.repositories.candidate_index import CandidateIndex, sort_value
+from backend.app.repositories.sheets_mirror import SheetsMirrorExporter
+from backend.app.repositories.sheets_repository import SheetsRepository
+from backend.app.repositories.sqlite_repository import SQLiteCandidateRepository
+from backend.app.services.container import ServiceContainer
+
+
+def _record(name: str, minutes_ago: int, **extra) -> CandidateRecord:
+    return CandidateRecord(
+        full_name=name,
+        source="test",
+        received_at=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+        **extra,
+    )
+
+
+@pytest.fixture
+def sqlite_settings(test_settings, tmp_path):
+    test_settings.storage_mode = "sqlite"
+    test_settings.sqlite_path = str(tmp_path / "candidates.db")
+    return test_settings
+
+
+@pytest.fixture
+def sqlite_repo(sqlite_settings):
+    repo = SQLiteCandidateRepository(settings=sqlite_settings)
+    yield repo
+    repo.close()
+
+
+def test_sqlite_repository_round_trip(sqlite_repo):
+    older = _record(
+        "Older", 10, email="older@example.com", skills=["Python", "SQL"], confidence=0.5
+    )
+    newer = _record("Newer", 1)
+    sqlite_repo.append_candidate(older)
+    sqlite_repo.append_candidate(newer)
+
+    assert [item.full_name for item in sqlite_repo.list_candidates()] == ["Newer", "Older"]
+    assert [item.full_name for item in sqlite_repo.list_recent(limit=1)] == ["Newer"]
+    stored = sqlite_repo.get_candidate(older.candidate_id)
+    assert stored.skills == ["Python", "SQL"] and stored.email == "older@example.com"
+
+    updated = sqlite_repo.update_status(older.candidate_id, CandidateStatus.REJECTED)
+    assert updated.status == CandidateStatus.REJECTED
+    assert [
+        item.full_name for item in sqlite_repo.list_candidates(status=CandidateStatus.REJECTED)
+    ] == ["Older"]
+    assert sqlite_repo.delete_by_status(CandidateStatus.REJECTED) == 1
+    assert sqlite_repo.delete_candidate(newer.candidate_id).full_name == "Newer"
+    assert sqlite_repo.list_candidates() == []
+    with pytest.raises(KeyError):
+        sqlite_repo.update_status("missing", CandidateStatus.APPROVED)
+
+
+def test_sqlite_repository_uses_wal_and_indexes(sqlite_repo):
+    connection = sqlite3.connect(sqlite_repo.db_path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT candidate_id FROM candidates WHERE status = 'new' "
+        "ORDER BY received_ts DESC, candidate_id LIMIT 20"
+    ).fetchall()
+    assert any("idx_candidates_status" in row[-1] for row in plan)
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+    connection.close()
+
+
+def test_sheets_mirror_replays_journal_once(sqlite_repo, test_settings):
+    sheet = SheetsRepository(settings=test_settings)
+    mirror = SheetsMirrorExporter(source=sqlite_repo, target=sheet, batch_size=2)
+    kept, dropped = _record("Kept", 2), _record("Dropped", 1)
+    sqlite_repo.append_candidate(kept)
+    sqlite_repo.append_candidate(dropped)
+    sqlite_repo.update_status(kept.candidate_id, CandidateStatus.APPROVED)
+    sqlite_repo.delete_candidate(dropped.candidate_id)
+
+    assert mirror.export_pending() == 4
+    assert [(item.full_name, item.status) for item in sheet.list_candidates()] == [
+        ("Kept", CandidateStatus.APPROVED)
+    ]
+    assert mirror.export_pending() == 0
+
+
+def test_container_selects_sqlite_backend(sqlite_settings):
+    container = ServiceContainer(sqlite_settings)
+    assert isinstance(container.storage_service.candidate_repository, SQLiteCandidateRepository)
+    assert container.sheets_mirror is None
+    container.shutdown()
+
+
+@pytest.mark.parametrize("sort", ["received_at", "full_name", "confidence"])
+@pytest.mark.parametrize("descending", [True, False])
+def test_keyset_pages_match_between_index_and_sqlite(sqlite_repo, sort, descending):
+    index = CandidateIndex()
+    names = ["bob", "Alice", None, "alice", "Carol", "bob", "Émile"]
+    for n, name in enumerate(names * 3):
+        record = _record(name, minutes_ago=n % 4, confidence=(n % 3) / 2 if n % 5 else None)
+        index.upsert(record)
+        sqlite_repo.append_candidate(record)
+
+    def walk(fetch):
+        seen, after = [], None
+        while True:
+            page = fetch(sort=sort, descending=descending, limit=4, after=after)
+            seen.extend(item.candidate_id for item in page)
+            if len(page) < 4:
+                return seen
+            after = (sort_value(page[-1], sort), page[-1].candidate_id)
+
+    from_index = walk(index.page)
+    assert len(from_index) == len(set(from_index)) == len(names) * 3
+    assert walk(sqlite_repo.page_candidates) == from_index
+
+
+def test_deep_sqlite_pages_seek_through_an_index(sqlite_repo):
+    query = (
+        "EXPLAIN QUERY PLAN SELECT candidate_id FROM candidates WHERE status = 'new' "
+        "AND lower(coalesce(full_name, '')) <= 'm' AND (lower(coalesce(full_name, '')) < 'm' OR candidate_id > 'x') "
+        "ORDER BY lower(coalesce(full_name, '')) DESC, candidate_id ASC LIMIT 21"
+    )
+    connection = sqlite3.connect(sqlite_repo.db_path)
+    plan = " ".join(row[-1] for row in connection.execute(query))
+    connection.close()
+    assert "idx_candidates_status_name" in plan and "TEMP B-TREE" not in plan
+
+
+def test_sqlite_status_counts_follow_writes(sqlite_repo):
+    first, second = _record("First", 2), _record("Second", 1)
+    sqlite_repo.append_candidate(first)
+    sqlite_repo.append_candidate(second)
+    sqlite_repo.append_candidate(
+        first.model_copy(update={"status": CandidateStatus.APPROVED})
+    )  # re-append
+    sqlite_repo.update_status(second.candidate_id, CandidateStatus.APPROVED)
+    assert sqlite_repo.status_counts() == {CandidateStatus.APPROVED: 2}
+    sqlite_repo.delete_by_status(CandidateStatus.APPROVED)
+    assert sqlite_repo.status_counts() == {} and sqlite_repo.count_candidates() == 0
+
+
+def test_sqlite_change_journal_prunes_but_reports_resets(sqlite_repo, monkeypatch):
+    monkeypatch.setattr(sqlite_module, "PRUNE_EVERY", 2)
+    sqlite_repo.settings.change_journal_size = 2
+    record = _record("Journaled", 1)
+    sqlite_repo.append_candidate(record)
+    for status in (CandidateStatus.APPROVED, CandidateStatus.INTERVIEW, CandidateStatus.SELECTED):
+        sqlite_repo.update_status(record.candidate_id, status)
+
+    assert sqlite_repo.change_version() == 4
+    assert [entry.op for entry in sqlite_repo.changes_since(2)] == ["update", "update"]
+    assert sqlite_repo.changes_since(0) is None  # pruned
+    assert sqlite_repo.changes_since(4) == []
+
+
+def test_append_candidates_writes_batch_in_one_transaction(sqlite_repo):
+    version = sqlite_repo.change_version()
+    sqlite_repo.append_candidates([_record(f"Batch {n}", n) for n in range(3)])
+
+    assert [record.full_name for record in sqlite_repo.list_candidates()] == [
+        "Batch 0",
+        "Batch 1",
+        "Batch 2",
+    ]
+    assert [entry.op for entry in sqlite_repo.changes_since(version)] == ["insert"] * 3
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
 from fastapi.testclient import TestClient
 
+from backend.app.main import create_app
+from backend.app.models.response_models import CandidateRecord
+from backend.app.services.blocking_executor import BlockingExecutor, ExecutorSaturatedError
+
 
 def test_whatsapp_webhook_accepts_message(api_client: TestClient):
     response = api_client.post(
@@ -13,3 +23,90 @@ def test_whatsapp_webhook_accepts_message(api_client: TestClient):
         },
     )
     assert response.status_code == 200
+
+
+def test_manual_ingest_returns_429_when_executor_is_saturated(test_settings):
+    release = threading.Event()
+
+    class SlowIngestion:
+        async def ingest_payload_async(self, source, body, attachments=None):
+            await asyncio.to_thread(release.wait, 5)
+            return CandidateRecord(
+                full_name="Jane Doe", source=source, received_at=datetime.now(timezone.utc)
+            )
+
+    app = create_app(settings=test_settings)
+    executor = BlockingExecutor(stages={"ingest": (1, 0)}, default_retry_after=7)
+    app.state.container.override("ingestion_service", SlowIngestion())
+    app.state.container.override("blocking_executor", executor)
+    client = TestClient(app)
+
+    first = {}
+    worker = threading.Thread(
+        target=lambda: first.update(
+            response=client.post("/api/whatsapp/manual-ingest", json={"body": "Jane"})
+        )
+    )
+    worker.start()
+    deadline = time.monotonic() + 5
+    while executor.stats()["ingest"]["admitted"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.get("/api/health/live").status_code == 200  # event loop is not blocked
+
+    rejected = client.post("/api/whatsapp/manual-ingest", json={"body": "John"})
+    assert rejected.status_code == 429 and rejected.headers["Retry-After"] == "7"
+
+    release.set()
+    worker.join(5)
+    assert first["response"].status_code == 200
+
+
+def test_executor_runs_concurrency_calls_and_queues_the_rest():
+    executor = BlockingExecutor(stages={"ingest": (1, 1)}, default_retry_after=3)
+    release = threading.Event()
+    running, peak = [0], [0]
+
+    async def work():
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        try:
+            await asyncio.to_thread(release.wait, 5)
+        finally:
+            running[0] -= 1
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.run_async("ingest", work))
+        queued = asyncio.ensure_future(executor.run_async("ingest", work))
+        await asyncio.sleep(0.05)
+        stats = executor.stats()["ingest"]
+        assert (stats["admitted"], stats["running"]) == (2, 1)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run_async("ingest", work)
+        release.set()
+        await asyncio.gather(first, queued)
+
+    asyncio.run(scenario())
+    assert peak[0] == 1
+    assert executor.stats()["ingest"]["admitted"] == 0
+
+
+def test_cancelled_await_keeps_the_slot_until_the_work_finishes():
+    executor = BlockingExecutor(stages={"ingest": (1, 0)})
+    release = threading.Event()
+
+    async def scenario():
+        waiter = asyncio.ensure_future(
+            executor.run_async("ingest", asyncio.to_thread, release.wait, 5)
+        )
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        # The thread is still busy, so the stage must stay full.
+        assert executor.stats()["ingest"]["admitted"] == 1
+        release.set()
+        deadline = time.monotonic() + 5
+        while executor.stats()["ingest"]["admitted"] and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert executor.stats()["ingest"]["admitted"] == 0
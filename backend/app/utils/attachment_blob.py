@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import mimetypes
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+import requests
+
+from ..models.request_models import AttachmentPayload
+from .file_utils import FileDownloadError, TransientDownloadError
+
+logger = logging.getLogger("smarthire.attachments")
+
+DEFAULT_SPOOL_THRESHOLD = 8 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+# Responses that mean "try again later" rather than "this file is gone".
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class AttachmentBlob:
+    """
+    The raw bytes of one attachment, fetched or decoded exactly once.
+
+    Small attachments stay in memory; larger ones are streamed into a single
+    temporary file. OCR reads the blob through ``path()`` (written lazily, at
+    most once, for in-memory blobs) and archival through ``read_bytes()`` or
+    ``open()``, so no stage re-downloads or re-decodes the payload. The SHA-256
+    is computed while the bytes arrive. Call ``close`` to remove the temp file.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str],
+        content_type: Optional[str],
+        data: Optional[bytes] = None,
+        path: Optional[Path] = None,
+        sha256: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        if (data is None) == (path is None):
+            raise ValueError("AttachmentBlob needs exactly one of data or path")
+        self.content_type = content_type
+        self.suffix = Path(filename or "").suffix or _guess_suffix(content_type)
+        self.filename = (
+            filename
+            if filename and Path(filename).suffix
+            else f"{filename or 'attachment'}{self.suffix}"
+        )
+        self._data = data
+        self._path = path
+        self._sha256 = sha256
+        self.size = (
+            size if size is not None else (len(data) if data is not None else path.stat().st_size)
+        )
+
+    # Constructors --------------------------------------------------------------
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, filename: Optional[str] = None, content_type: Optional[str] = None
+    ) -> "AttachmentBlob":
+        return cls(filename, content_type, data=data)
+
+    @classmethod
+    def from_stream(
+        cls,
+        chunks: Iterable[bytes],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        max_bytes: Optional[int] = None,
+    ) -> "AttachmentBlob":
+        """Consume ``chunks`` once, hashing as it goes and spilling to disk past ``spool_threshold``."""
+
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        suffix = Path(filename or "").suffix or _guess_suffix(content_type)
+        spill: Optional[BinaryIO] = None
+        size = 0
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileDownloadError(f"Attachment exceeds the {max_bytes} byte limit")
+                digest.update(chunk)
+                if spill is not None:
+                    spill.write(chunk)
+                    continue
+                buffer += chunk
+                if len(buffer) > spool_threshold:
+                    spill = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+                    spill.write(buffer)
+                    buffer = bytearray()
+        except BaseException:
+            if spill is not None:
+                spill.close()
+                Path(spill.name).unlink(missing_ok=True)
+            raise
+        if spill is not None:
+            spill.close()
+            return cls(
+                filename, content_type, path=Path(spill.name), sha256=digest.hexdigest(), size=size
+            )
+        return cls(filename, content_type, data=bytes(buffer), sha256=digest.hexdigest(), size=size)
+
+    @classmethod
+    def from_payload(
+        cls,
+        attachment: AttachmentPayload,
+        session: Optional[requests.Session] = None,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        max_bytes: Optional[int] = None,
+    ) -> Optional["AttachmentBlob"]:
+        if attachment.content:
+            data = base64.b64decode(attachment.content.encode("utf-8"))
+            if max_bytes is not None and len(data) > max_bytes:
+                raise FileDownloadError(f"Attachment exceeds the {max_bytes} byte limit")
+            return cls.from_bytes(data, attachment.filename, attachment.content_type)
+        if attachment.url:
+            return download(
+                str(attachment.url),
+                filename=attachment.filename,
+                content_type=attachment.content_type,
+                session=session,
+                spool_threshold=spool_threshold,
+                max_bytes=max_bytes,
+            )
+        return None
+
+    # Access --------------------------------------------------------------------
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            digest = hashlib.sha256()
+            with self.open() as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+
+    @property
+    def in_memory(self) -> bool:
+        return self._data is not None
+
+    def read_bytes(self) -> bytes:
+        if self._data is not None:
+            return self._data
+        return self._spooled_path().read_bytes()
+
+    def open(self) -> BinaryIO:
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return self._spooled_path().open("rb")
+
+    def path(self) -> Path:
+        """A file holding the bytes, for extractors that need one; created at most once."""
+
+        if self._path is None:
+            if self._data is None:
+                raise ValueError("Attachment blob is closed")
+            with tempfile.NamedTemporaryFile(delete=False, suffix=self.suffix) as handle:
+                handle.write(self._data)
+            self._path = Path(handle.name)
+        return self._path
+
+    def close(self) -> None:
+        self._data = None
+        path, self._path = self._path, None
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:  # pragma: no cover - best effort cleanup
+                logger.debug("Attachment temp cleanup failed for %s", path)
+
+    def _spooled_path(self) -> Path:
+        if self._path is None:
+            raise ValueError("Attachment blob is closed")
+        return self._path
+
+    def __enter__(self) -> "AttachmentBlob":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def download(
+    url: str,
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    auth: Optional[tuple] = None,
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+    max_bytes: Optional[int] = None,
+    timeout: float = 30,
+) -> AttachmentBlob:
+    """
+    Stream ``url`` into an :class:`AttachmentBlob`.
+
+    Raises ``TransientDownloadError`` for statuses in ``RETRYABLE_STATUSES`` and
+    ``FileDownloadError`` for other error statuses or oversized bodies.
+    """
+
+    getter = session.get if session is not None else requests.get
+    with getter(url, auth=auth, timeout=timeout, stream=True) as response:
+        if response.status_code >= 400:
+            error = (
+                TransientDownloadError
+                if response.status_code in RETRYABLE_STATUSES
+                else FileDownloadError
+            )
+            raise error(f"Failed to download file: {response.status_code}")
+        declared = response.headers.get("Content-Length")
+        if max_bytes is not None and declared and declared.isdigit() and int(declared) > max_bytes:
+            raise FileDownloadError(
+                f"Attachment of {declared} bytes exceeds the {max_bytes} byte limit"
+            )
+        return AttachmentBlob.from_stream(
+            response.iter_content(CHUNK_SIZE),
+            filename=filename,
+            content_type=content_type or response.headers.get("Content-Type"),
+            spool_threshold=spool_threshold,
+            max_bytes=max_bytes,
+        )
+
+
+def _guess_suffix(content_type: Optional[str]) -> str:
+    if not content_type:
+        return ""
+    return mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
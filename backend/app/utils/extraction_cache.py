@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .cache import LRUCache
+
+logger = logging.getLogger("smarthire.ocr.cache")
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    text: str
+    confidence: float
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache of attachment extraction results.
+
+    Keys combine the SHA-256 of the attachment bytes with the extractor version,
+    so bumping the version invalidates every entry. Results are written as small
+    JSON files under ``directory`` and evicted least-recently-used once their
+    total size exceeds ``max_bytes``; an in-memory LRU in front serves hot
+    entries without touching disk.
+
+    The directory may be shared by several processes (API workers, the job
+    worker). The index is only this process's view of it: a lookup that
+    misses the index still checks the file, and eviction rescans the
+    directory first whenever the local estimate is over budget or older than
+    ``rescan_seconds``, so entries written by other processes are both found
+    and counted.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        memory_entries: int = 256,
+        rescan_seconds: float = 60.0,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max(max_bytes, 1)
+        self.rescan_seconds = rescan_seconds
+        self._memory: LRUCache[str, CachedExtraction] = LRUCache(maxsize=max(memory_entries, 1))
+        self._lock = threading.Lock()
+        # key -> (size in bytes, last use); rebuilt from the directory on start-up.
+        self._index: Dict[str, Tuple[int, float]] = {}
+        self._total_bytes = 0
+        self._scanned_at = 0.0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._scan()
+        self._evict()
+
+    @staticmethod
+    def make_key(digest: str, version: str) -> str:
+        return hashlib.sha256(f"{version}:{digest}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedExtraction]:
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            payload = json.loads(data)
+            cached = CachedExtraction(text=payload["text"], confidence=float(payload["confidence"]))
+        except FileNotFoundError:
+            # Never written, or evicted by another process sharing the directory.
+            self._forget(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("Dropping unreadable cache entry %s: %s", key, exc)
+            self._forget(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        now = time.time()
+        with self._lock:
+            self.disk_hits += 1
+            previous = self._index.get(key)
+            self._total_bytes += len(data) - (previous[0] if previous else 0)
+            self._index[key] = (len(data), now)
+        try:
+            os.utime(path, (now, now))
+        except OSError:  # pragma: no cover - entry evicted concurrently
+            pass
+        self._memory.set(key, cached)
+        return cached
+
+    def set(self, key: str, value: CachedExtraction) -> None:
+        self._memory.set(key, value)
+        data = json.dumps({"text": value.text, "confidence": value.confidence}).encode("utf-8")
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write extraction cache entry: %s", exc)
+            temp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            previous = self._index.get(key)
+            if previous is not None:
+                self._total_bytes -= previous[0]
+            self._index[key] = (len(data), time.time())
+            self._total_bytes += len(data)
+        self._evict()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory": self._memory.stats(),
+            }
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _scan(self) -> None:
+        """Rebuild the index from the files actually in the directory."""
+
+        index: Dict[str, Tuple[int, float]] = {}
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover - removed concurrently
+                continue
+            index[path.stem] = (stat.st_size, stat.st_mtime)
+        with self._lock:
+            self._index = index
+            self._total_bytes = sum(size for size, _ in index.values())
+            self._scanned_at = time.monotonic()
+
+    def _evict(self) -> None:
+        with self._lock:
+            stale = time.monotonic() - self._scanned_at >= self.rescan_seconds
+            if self._total_bytes <= self.max_bytes and not stale:
+                return
+        self._scan()
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            victims = []
+            for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                del self._index[key]
+                self._total_bytes -= size
+                self.evictions += 1
+                victims.append(key)
+        for key in victims:
+            self._memory.pop(key)
+            self._path(key).unlink(missing_ok=True)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            entry = self._index.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry[0]
+        self._memory.pop(key)
+        self._path(key).unlink(missing_ok=True)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None  # type: ignore
+
+# Without either module, locks are no-ops and files must not be shared between processes.
+SUPPORTED = fcntl is not None or msvcrt is not None
+
+
+def lock(handle: IO, blocking: bool = True) -> bool:
+    """
+    Take an exclusive cross-process lock on an open lock file.
+
+    Uses ``flock`` on POSIX and a one-byte ``msvcrt.locking`` region on
+    Windows. Returns ``False`` when ``blocking`` is off and another process
+    holds the lock.
+    """
+
+    if fcntl is not None:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            return False
+        return True
+    if msvcrt is not None:  # pragma: no cover - Windows
+        handle.seek(0)
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.05)
+    return True  # pragma: no cover - no locking primitive available
+
+
+def unlock(handle: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
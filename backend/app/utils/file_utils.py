@@ -3,7 +3,6 @@ from __future__ import annotations
 import base64
 import tempfile
 from pathlib import Path
-from typing import Optional
 
 import requests
 
@@ -12,6 +11,10 @@ class FileDownloadError(Exception):
     pass
 
 
+class TransientDownloadError(FileDownloadError):
+    """The server answered with a status worth retrying later (rate limit, timeout, 5xx)."""
+
+
 def download_to_temp(url: str, filename_hint: str | None = None) -> Path:
     response = requests.get(url, timeout=30)
     if response.status_code >= 400:
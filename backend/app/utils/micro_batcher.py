@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger("smarthire.batching")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesces items submitted from many threads into batches.
+
+    A batch is handed to ``process`` (which must return one result per item,
+    in order) as soon as ``max_batch_size`` items are waiting or the oldest
+    item has waited ``max_wait_seconds``, whichever comes first. ``submit``
+    returns a future; the caller blocks on ``result()`` as if it had made the
+    call itself, and exceptions raised by ``process`` fail every item of that
+    batch.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[List[T]], Sequence[R]],
+        max_batch_size: int = 16,
+        max_wait_seconds: float = 0.025,
+        name: str = "micro-batcher",
+    ) -> None:
+        self.process = process
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait_seconds = max(max_wait_seconds, 0.0)
+        self._pending: List[Tuple[T, Future, float]] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+        self.size_flushes = 0
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: T) -> "Future[R]":
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._pending.append((item, future, time.monotonic()))
+            self._condition.notify()
+        return future
+
+    def stats(self) -> Dict[str, object]:
+        with self._condition:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_seconds": self.max_wait_seconds,
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+                "size_flushes": self.size_flushes,
+                "pending": len(self._pending),
+            }
+
+    def close(self) -> None:
+        """Stop accepting items; anything already submitted is still processed."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout=5)
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._run(batch)
+
+    def _next_batch(self) -> Optional[List[Tuple[T, Future, float]]]:
+        with self._condition:
+            while True:
+                if self._pending:
+                    full = len(self._pending) >= self.max_batch_size
+                    remaining = self._pending[0][2] + self.max_wait_seconds - time.monotonic()
+                    if full or remaining <= 0 or self._closed:
+                        batch = self._pending[: self.max_batch_size]
+                        del self._pending[: self.max_batch_size]
+                        self.batches += 1
+                        self.items += len(batch)
+                        self.size_flushes += int(len(batch) == self.max_batch_size)
+                        return batch
+                    self._condition.wait(timeout=remaining)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+
+    def _run(self, batch: List[Tuple[T, Future, float]]) -> None:
+        futures = [future for _, future, _ in batch]
+        try:
+            results = list(self.process([item for item, _, _ in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch of {len(batch)} items produced {len(results)} results")
+        except Exception as exc:
+            logger.warning("Micro-batch of %s items failed: %s", len(batch), exc)
+            for future in futures:
+                future.set_exception(exc)
+            return
+        for future, result in zip(futures, results):
+            future.set_result(result)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or targets another ordering."""
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Opaque keyset position: the last item's sort value and ``candidate_id``."""
+
+    sort: str
+    descending: bool
+    value: object
+    candidate_id: str
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.sort, int(self.descending), self.value, self.candidate_id], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: str, descending: bool) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw_sort, raw_descending, value, candidate_id = json.loads(
+                base64.urlsafe_b64decode(padded)
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+        if raw_sort != sort or bool(raw_descending) != descending:
+            raise InvalidCursorError("Cursor was issued for a different sort order")
+        expected = str if sort == "full_name" else (int, float)
+        if not isinstance(candidate_id, str) or not isinstance(value, expected):
+            raise InvalidCursorError("Malformed cursor")
+        return cls(sort=sort, descending=descending, value=value, candidate_id=candidate_id)
+
+
+def decode_cursor(token: Optional[str], sort: str, descending: bool) -> Optional[PageCursor]:
+    return PageCursor.decode(token, sort, descending) if token else None
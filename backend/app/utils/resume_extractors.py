@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Dict, Iterable, List
 
 import pdfplumber
 from docx import Document
@@ -28,6 +29,10 @@ def extract_text_from_pdf(path: Path) -> str:
 def extract_text_from_pdfminer(path: Path) -> str:
     if pdfminer_extract_text is None:
         return ""
+    try:
+        return pdfminer_extract_text(path)
+    except Exception:
+        return ""
 
 
 def extract_text_from_pymupdf(path: Path) -> str:
@@ -38,10 +43,33 @@ def extract_text_from_pymupdf(path: Path) -> str:
             return "\n".join(page.get_text("text") for page in document)
     except Exception:
         return ""
+
+
+def extract_pdf_pages(path: Path) -> List[str]:
+    """Text layer of every page, read with PyMuPDF when installed and pdfplumber otherwise."""
+
+    if fitz is not None:
+        try:
+            with fitz.open(path) as document:
+                return [page.get_text("text") for page in document]
+        except Exception:
+            pass
+    with pdfplumber.open(path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def extract_pdf_pages_with_pdfplumber(path: Path, page_numbers: Iterable[int]) -> Dict[int, str]:
+    """pdfplumber text for selected 1-based pages; a second opinion for pages PyMuPDF handled poorly."""
+
+    texts: Dict[int, str] = {}
     try:
-        return pdfminer_extract_text(path)
+        with pdfplumber.open(path) as pdf:
+            for number in page_numbers:
+                if 1 <= number <= len(pdf.pages):
+                    texts[number] = pdf.pages[number - 1].extract_text() or ""
     except Exception:
-        return ""
+        return texts
+    return texts
 
 
 def extract_text_from_docx(path: Path) -> str:
@@ -1,5 +1,6 @@
 """
-Background task stubs for SmartHire Gateway.
+Background job processing for SmartHire Gateway.
 
-Projects can wire these into Celery, RQ, or any async worker of choice.
+``JobQueue`` persists ingestion jobs in SQLite and ``JobWorker`` executes them,
+either embedded in the API process or via ``python -m backend.app.workers.runner``.
 """
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+logger = logging.getLogger("smarthire.jobs")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires_at REAL,
+    worker_id TEXT,
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (status, lease_expires_at);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    failed_at REAL NOT NULL
+);
+"""
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    available_at: float
+    created_at: float
+    updated_at: float
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    worker_id: Optional[str] = None
+
+
+class JobQueue:
+    """
+    Durable SQLite-backed job queue with at-least-once delivery.
+
+    ``claim`` leases the oldest ready job to a worker, which keeps the lease
+    alive with ``extend_lease`` while it runs; a job whose lease expires
+    (worker crashed, hung or was killed mid-job) becomes claimable again.
+    Failed attempts are retried with exponential backoff and jitter until
+    ``max_attempts``, after which the job moves to the ``dead_letters`` table;
+    an expired lease on the last attempt is dead-lettered the same way, so a
+    job that keeps killing its worker is not redelivered forever. ``complete``
+    and ``fail`` only apply while the caller still holds the lease. Handlers
+    must be idempotent or tolerate re-execution.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 5.0,
+        retry_max_seconds: float = 600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = db_path
+        self.max_attempts = max(max_attempts, 1)
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    # Producer side -----------------------------------------------------------
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: int | None = None) -> str:
+        job_id = uuid4().hex
+        now = self._clock()
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO jobs (id, kind, payload, status, attempts, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    kind,
+                    json.dumps(payload),
+                    QUEUED,
+                    max_attempts or self.max_attempts,
+                    now,
+                    now,
+                    now,
+                ),
+            )
+        return job_id
+
+    # Consumer side -----------------------------------------------------------
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """Lease the next ready job (or one whose lease expired) to ``worker_id``."""
+
+        now = self._clock()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT id FROM jobs WHERE status = ? AND available_at <= ? ORDER BY available_at LIMIT 1",
+                (QUEUED, now),
+            ).fetchone()
+            while row is None:
+                expired = connection.execute(
+                    "SELECT id FROM jobs WHERE status = ? AND lease_expires_at < ? "
+                    "ORDER BY lease_expires_at LIMIT 1",
+                    (RUNNING, now),
+                ).fetchone()
+                if expired is None:
+                    return None
+                job = self._job_from_row(self._select_job(connection, expired[0]))
+                if job.attempts >= job.max_attempts:
+                    error = f"Lease expired on attempt {job.attempts}"
+                    if job.last_error:
+                        error = f"{error}; last error: {job.last_error}"
+                    self._dead_letter(connection, job, error, now)
+                    continue
+                logger.warning("Re-delivering job %s after its lease expired", job.id)
+                row = expired
+            connection.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_expires_at = ?, worker_id = ?, "
+                "updated_at = ? WHERE id = ?",
+                (RUNNING, now + lease_seconds, worker_id, now, row[0]),
+            )
+            return self._job_from_row(self._select_job(connection, row[0]))
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Heartbeat: push the lease out by ``lease_seconds``; ``False`` if ``worker_id`` lost it."""
+
+        now = self._clock()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (now + lease_seconds, now, job_id, RUNNING, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(
+        self, job_id: str, result: Optional[Dict[str, Any]] = None, worker_id: Optional[str] = None
+    ) -> bool:
+        """Mark the job done; ignored (returns ``False``) if ``worker_id`` no longer holds the lease."""
+
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, lease_expires_at = NULL, last_error = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND (? IS NULL OR worker_id = ?)",
+                (
+                    SUCCEEDED,
+                    json.dumps(result) if result is not None else None,
+                    self._clock(),
+                    job_id,
+                    RUNNING,
+                    worker_id,
+                    worker_id,
+                ),
+            )
+        if cursor.rowcount != 1:
+            logger.warning("Ignoring completion of job %s by %s: lease lost", job_id, worker_id)
+            return False
+        return True
+
+    def fail(self, job_id: str, error: str, worker_id: Optional[str] = None) -> str:
+        """
+        Record a failed attempt; returns the job's new status (``queued`` or ``dead``).
+
+        If ``worker_id`` no longer holds the lease the job is left alone and its
+        current status is returned.
+        """
+
+        now = self._clock()
+        with self._transaction() as connection:
+            row = self._select_job(connection, job_id)
+            if row is None:
+                return DEAD
+            job = self._job_from_row(row)
+            if job.status != RUNNING or (worker_id is not None and job.worker_id != worker_id):
+                logger.warning("Ignoring failure of job %s by %s: lease lost", job_id, worker_id)
+                return job.status
+            if job.attempts >= job.max_attempts:
+                self._dead_letter(connection, job, error, now)
+                return DEAD
+            delay = min(self.retry_base_seconds * 2 ** (job.attempts - 1), self.retry_max_seconds)
+            delay *= random.uniform(0.8, 1.2)
+            connection.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, lease_expires_at = NULL, last_error = ?, updated_at = ? "
+                "WHERE id = ?",
+                (QUEUED, now + delay, error, now, job_id),
+            )
+            return QUEUED
+
+    def reschedule(
+        self, job_id: str, delay: float, reason: str, worker_id: Optional[str] = None
+    ) -> bool:
+        """
+        Put a running job back on the queue in ``delay`` seconds without spending an attempt.
+
+        For handlers that cannot make progress yet (e.g. another worker holds the
+        message); ignored (returns ``False``) if ``worker_id`` no longer holds the lease.
+        """
+
+        now = self._clock()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), available_at = ?, "
+                "lease_expires_at = NULL, last_error = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND (? IS NULL OR worker_id = ?)",
+                (QUEUED, now + max(delay, 0.0), reason, now, job_id, RUNNING, worker_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    # Inspection --------------------------------------------------------------
+
+    def get(self, job_id: str) -> Optional[Job]:
+        connection = self._connection()
+        row = self._select_job(connection, job_id)
+        if row is not None:
+            return self._job_from_row(row)
+        dead = connection.execute(
+            "SELECT id, kind, payload, attempts, last_error, created_at, failed_at FROM dead_letters WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        return self._dead_from_row(dead) if dead else None
+
+    def dead_letters(self, limit: int = 50) -> List[Job]:
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT id, kind, payload, attempts, last_error, created_at, failed_at FROM dead_letters "
+                "ORDER BY failed_at DESC LIMIT ?",
+                (limit,),
+            )
+            .fetchall()
+        )
+        return [self._dead_from_row(row) for row in rows]
+
+    def retry_dead(self, job_id: str) -> bool:
+        """Move a dead-lettered job back onto the queue with a fresh attempt budget."""
+
+        now = self._clock()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT id, kind, payload, created_at FROM dead_letters WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            connection.execute(
+                "INSERT INTO jobs (id, kind, payload, status, attempts, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (row[0], row[1], row[2], QUEUED, self.max_attempts, now, row[3], now),
+            )
+            connection.execute("DELETE FROM dead_letters WHERE id = ?", (job_id,))
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        connection = self._connection()
+        counts = {QUEUED: 0, RUNNING: 0, SUCCEEDED: 0}
+        for status, total in connection.execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ):
+            counts[status] = total
+        (dead,) = connection.execute("SELECT COUNT(*) FROM dead_letters").fetchone()
+        (oldest,) = connection.execute(
+            "SELECT MIN(available_at) FROM jobs WHERE status = ? AND available_at <= ?",
+            (QUEUED, self._clock()),
+        ).fetchone()
+        return {
+            **counts,
+            DEAD: dead,
+            "depth": counts[QUEUED] + counts[RUNNING],
+            "oldest_ready_age_seconds": round(self._clock() - oldest, 3)
+            if oldest is not None
+            else 0.0,
+        }
+
+    def purge_succeeded(self, older_than_seconds: float) -> int:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM jobs WHERE status = ? AND updated_at < ?",
+                (SUCCEEDED, self._clock() - older_than_seconds),
+            )
+            return cursor.rowcount
+
+    # Internals ---------------------------------------------------------------
+
+    @staticmethod
+    def _dead_letter(connection: sqlite3.Connection, job: Job, error: str, now: float) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO dead_letters "
+            "(id, kind, payload, attempts, last_error, created_at, failed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job.id, job.kind, json.dumps(job.payload), job.attempts, error, job.created_at, now),
+        )
+        connection.execute("DELETE FROM jobs WHERE id = ?", (job.id,))
+        logger.error(
+            "Job %s (%s) moved to dead letters after %s attempts: %s",
+            job.id,
+            job.kind,
+            job.attempts,
+            error,
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _select_job(connection: sqlite3.Connection, job_id: str) -> Optional[tuple]:
+        return connection.execute(
+            "SELECT id, kind, payload, status, attempts, max_attempts, available_at, created_at, updated_at, "
+            "last_error, result, worker_id FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+
+    @staticmethod
+    def _job_from_row(row: tuple) -> Job:
+        return Job(
+            id=row[0],
+            kind=row[1],
+            payload=json.loads(row[2]),
+            status=row[3],
+            attempts=row[4],
+            max_attempts=row[5],
+            available_at=row[6],
+            created_at=row[7],
+            updated_at=row[8],
+            last_error=row[9],
+            result=json.loads(row[10]) if row[10] else None,
+            worker_id=row[11],
+        )
+
+    @staticmethod
+    def _dead_from_row(row: tuple) -> Job:
+        return Job(
+            id=row[0],
+            kind=row[1],
+            payload=json.loads(row[2]),
+            status=DEAD,
+            attempts=row[3],
+            max_attempts=row[3],
+            available_at=row[6],
+            created_at=row[5],
+            updated_at=row[6],
+            last_error=row[4],
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .job_queue import Job, JobQueue
+
+logger = logging.getLogger("smarthire.jobs.worker")
+
+JobHandler = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class RetryLater(Exception):
+    """Raised by a handler that cannot proceed yet; the job is requeued without using an attempt."""
+
+    def __init__(self, reason: str, delay: float = 5.0) -> None:
+        super().__init__(reason)
+        self.delay = delay
+
+
+class JobWorker:
+    """
+    Pulls jobs from a :class:`JobQueue` on ``concurrency`` threads.
+
+    Runs embedded in the API process for development or standalone via
+    ``python -m backend.app.workers.runner``; several worker processes can share
+    one queue database. While a handler runs, a heartbeat thread extends the
+    job's lease every third of ``lease_seconds``, so long OCR jobs are not
+    handed to a second worker. A handler that raises marks the attempt as
+    failed and the queue schedules a retry (or dead-letters the job); one that
+    raises :class:`RetryLater` is requeued without spending an attempt.
+    """
+
+    purge_interval_seconds = 600.0
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Dict[str, JobHandler],
+        concurrency: int = 2,
+        lease_seconds: float = 300.0,
+        poll_interval: float = 1.0,
+        retention_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = max(concurrency, 1)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+        self.succeeded = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopped.clear()
+        for index in range(self.concurrency):
+            worker_id = f"{os.getpid()}-{index}"
+            thread = threading.Thread(
+                target=self._loop, args=(worker_id,), name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info("Job worker started with %s threads", self.concurrency)
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def run_once(self, worker_id: str = "inline") -> bool:
+        """Claim and run a single job; returns ``False`` when nothing was ready."""
+
+        job = self.queue.claim(worker_id, self.lease_seconds)
+        if job is None:
+            return False
+        self._execute(job, worker_id)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": bool(self._threads) and not self._stopped.is_set(),
+                "concurrency": self.concurrency,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+            }
+
+    def _execute(self, job: Job, worker_id: str) -> None:
+        handler = self.handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job kind '{job.kind}'")
+            with self._heartbeat(job, worker_id):
+                result = handler(job.payload)
+        except RetryLater as exc:
+            if self.queue.reschedule(job.id, exc.delay, str(exc), worker_id=worker_id):
+                logger.info("Job %s (%s) deferred %.0fs: %s", job.id, job.kind, exc.delay, exc)
+            return
+        except Exception as exc:
+            outcome = self.queue.fail(job.id, f"{type(exc).__name__}: {exc}", worker_id=worker_id)
+            logger.warning(
+                "Job %s (%s) attempt %s failed: %s; now %s",
+                job.id,
+                job.kind,
+                job.attempts,
+                exc,
+                outcome,
+            )
+            with self._lock:
+                self.failed += 1
+            return
+        if self.queue.complete(job.id, result, worker_id=worker_id):
+            with self._lock:
+                self.succeeded += 1
+
+    @contextmanager
+    def _heartbeat(self, job: Job, worker_id: str) -> Iterator[None]:
+        done = threading.Event()
+
+        def beat() -> None:
+            while not done.wait(self.lease_seconds / 3):
+                try:
+                    if not self.queue.extend_lease(job.id, worker_id, self.lease_seconds):
+                        logger.warning("Job %s lease lost by %s", job.id, worker_id)
+                        return
+                except Exception as exc:  # pragma: no cover - database errors
+                    logger.warning("Job %s heartbeat failed: %s", job.id, exc)
+
+        thread = threading.Thread(target=beat, name=f"job-heartbeat-{job.id[:8]}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def _loop(self, worker_id: str) -> None:
+        while not self._stopped.is_set():
+            try:
+                worked = self.run_once(worker_id)
+                if worker_id.endswith("-0"):
+                    self._purge_if_due()
+            except Exception as exc:  # pragma: no cover - database errors
+                logger.error("Job worker %s loop error: %s", worker_id, exc)
+                worked = False
+            if not worked:
+                self._stopped.wait(self.poll_interval)
+
+    def _purge_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < self.purge_interval_seconds:
+            return
+        self._last_purge = now
+        purged = self.queue.purge_succeeded(self.retention_seconds)
+        if purged:
+            logger.info("Purged %s finished jobs", purged)
+
+
+def main(argv: List[str] | None = None) -> None:
+    from ..core.config import get_settings
+    from ..core.logging_config import configure_logging
+    from ..services.container import ServiceContainer
+
+    parser = argparse.ArgumentParser(description="Run SmartHire ingestion job workers.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Worker threads (defaults to JOB_WORKER_CONCURRENCY).",
+    )
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    configure_logging(level=settings.log_level)
+    if args.concurrency:
+        settings.job_worker_concurrency = args.concurrency
+    container = ServiceContainer(settings)
+    try:
+        container.nlp_registry.warm()
+    except OSError as exc:
+        logger.error("spaCy model warm-up failed: %s", exc)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    container.job_worker.start()
+    stop.wait()
+    logger.info("Stopping job worker")
+    container.shutdown()
+
+
+if __name__ == "__main__":
+    main()
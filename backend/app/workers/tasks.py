@@ -1,22 +1,54 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ..models.request_models import AttachmentPayload
-from ..services.ingestion_service import IngestionService
+from ..repositories.message_dedup import MessageInProgressError
+from .job_queue import JobQueue
+from .runner import JobHandler, RetryLater
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..services.container import ServiceContainer
+
+WHATSAPP_MESSAGE = "whatsapp_message"
+INGEST_PAYLOAD = "ingest_payload"
 
 
 def ingest_async(
-    ingestion_service: IngestionService,
+    job_queue: JobQueue,
     source: str,
     body: str,
     attachments: Optional[List[AttachmentPayload]] = None,
-) -> None:
-    """
-    Placeholder worker task.
+) -> str:
+    """Queue an ingestion for the job worker; returns the job id."""
+
+    return job_queue.enqueue(
+        INGEST_PAYLOAD,
+        {
+            "source": source,
+            "body": body,
+            "attachments": [attachment.model_dump(mode="json") for attachment in attachments or []],
+        },
+    )
+
+
+def build_handlers(container: "ServiceContainer") -> Dict[str, JobHandler]:
+    """Map job kinds to callables; services are resolved lazily from the container."""
+
+    def whatsapp_message(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            record = container.whatsapp_service.process_incoming_message(payload)
+        except MessageInProgressError as exc:
+            # Another worker holds the message; check back once it has finished or its claim lapsed.
+            raise RetryLater(str(exc), delay=container.job_queue.retry_base_seconds) from exc
+        return {"candidate_id": record.candidate_id} if record is not None else None
 
-    In production bind this function to a Celery or RQ worker to process heavy
-    OCR workloads outside the request cycle.
-    """
+    def ingest_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        record = container.ingestion_service.ingest_payload(
+            source=payload["source"],
+            body=payload.get("body", ""),
+            attachments=[AttachmentPayload(**item) for item in payload.get("attachments", [])],
+        )
+        return {"candidate_id": record.candidate_id}
 
-    ingestion_service.ingest_payload(source=source, body=body, attachments=attachments)
+    return {WHATSAPP_MESSAGE: whatsapp_message, INGEST_PAYLOAD: ingest_payload}
@@ -0,0 +1,92 @@
+"""
+Measure resume parsing throughput: one ``nlp()`` call per document vs ``nlp.pipe`` batches.
+
+Parses synthetic resumes with ``ParsingService.parse_extracted`` (the per-message
+path) and with ``ParsingService.parse_many`` at several batch sizes, and prints
+documents per second for each. OCR is not involved; attachment text is given.
+
+Usage::
+
+    python -m backend.scripts.bench_nlp_batching --docs 500 --batch-sizes 8 32 128
+    python -m backend.scripts.bench_nlp_batching --model en_core_web_sm --n-process 2
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from ..app.core.config import Settings
+from ..app.services.nlp_registry import NLPModelRegistry
+from ..app.services.ocr_service import AttachmentResult
+from ..app.services.parsing_service import ParsingService
+
+FIRST_NAMES = ["Jane", "Arjun", "Maria", "Chen", "Fatima", "Lukas", "Aisha", "Diego"]
+LAST_NAMES = ["Doe", "Sharma", "Garcia", "Wei", "Khan", "Muller", "Okafor", "Silva"]
+CITIES = ["Bengaluru", "Berlin", "Lagos", "Toronto", "Madrid", "Singapore"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Analytics", "Stark Industries"]
+SKILLS = ["Python", "Django", "AWS", "Docker", "Kubernetes", "SQL", "React", "PyTorch", "Pandas"]
+
+
+def synthetic_resume(rng: random.Random) -> str:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = ", ".join(rng.sample(SKILLS, 4))
+    lines = [
+        name,
+        f"{name.split()[0].lower()}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        f"Based in {rng.choice(CITIES)}.",
+        f"{rng.randint(1, 15)} years of experience building data products at {rng.choice(COMPANIES)}.",
+        f"Skills: {skills}.",
+        "Bachelor of Engineering in Computer Science.",
+    ]
+    lines += [
+        f"Led a project migrating {rng.choice(SKILLS)} services for {rng.choice(COMPANIES)}."
+        for _ in range(20)
+    ]
+    return "\n".join(lines)
+
+
+def run(docs: int, batch_sizes: list[int], model: str, n_process: int) -> None:
+    registry = NLPModelRegistry(model, fallback_model=None)
+    registry.warm()
+    service = ParsingService(settings=Settings(nlp_micro_batch_size=1), nlp_registry=registry)
+    rng = random.Random(7)
+    items = [
+        ("", [AttachmentResult(filename=f"cv{n}.txt", text=synthetic_resume(rng), confidence=0.9)])
+        for n in range(docs)
+    ]
+
+    warmup = items[:20]  # load lazy tables/vectors outside the timed runs
+    service.parse_many(warmup, source="bench")
+    for body, results in warmup:
+        service.parse_extracted(body, results, source="bench")
+
+    started = time.perf_counter()
+    for body, results in items:
+        service.parse_extracted(body, results, source="bench")
+    single = docs / (time.perf_counter() - started)
+    print(f"model={registry.stats().model_name} docs={docs}")
+    print(f"{'single doc (nlp())':<28} {single:9.1f} docs/s")
+
+    for batch_size in batch_sizes:
+        started = time.perf_counter()
+        service.parse_many(items, source="bench", batch_size=batch_size, n_process=n_process)
+        rate = docs / (time.perf_counter() - started)
+        label = f"nlp.pipe batch={batch_size}" + (
+            f" n_process={n_process}" if n_process > 1 else ""
+        )
+        print(f"{label:<28} {rate:9.1f} docs/s  ({rate / single:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--model", default=Settings().spacy_model)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+    run(args.docs, args.batch_sizes, args.model, args.n_process)
+
+
+if __name__ == "__main__":
+    main()
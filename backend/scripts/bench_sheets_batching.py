@@ -0,0 +1,142 @@
+"""
+Count Google Sheets API calls for metadata backfill and bulk deletes.
+
+Runs ``SheetsRepository`` against an in-memory worksheet stub, once with the
+batched code paths and once with the previous per-cell / per-row loops, and
+prints the calls each one made.
+
+Usage::
+
+    python -m backend.scripts.bench_sheets_batching --rows 2000 --rejected-every 3
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+
+from ..app.core.config import Settings
+from ..app.models.response_models import CandidateStatus
+from ..app.repositories.sheets_repository import SHEET_HEADER, SheetsRepository
+
+SETTINGS = Settings(storage_mode="google", sheets_write_behind=False)
+
+
+class CountingSpreadsheet:
+    def __init__(self, worksheet: "CountingWorksheet") -> None:
+        self.worksheet = worksheet
+
+    def batch_update(self, body: dict) -> None:
+        self.worksheet.calls += 1
+        for request in body["requests"]:
+            span = request["deleteDimension"]["range"]
+            del self.worksheet.rows[span["startIndex"] : span["endIndex"]]
+
+
+class CountingWorksheet:
+    id = 0
+
+    def __init__(self, rows: list[list[str]]) -> None:
+        self.rows = [list(SHEET_HEADER)] + rows
+        self.calls = 0
+        self.spreadsheet = CountingSpreadsheet(self)
+
+    def row_values(self, row: int) -> list[str]:
+        self.calls += 1
+        return list(self.rows[row - 1])
+
+    def col_values(self, col: int) -> list[str]:
+        self.calls += 1
+        return [row[col - 1] if len(row) >= col else "" for row in self.rows]
+
+    def get_all_values(self) -> list[list[str]]:
+        self.calls += 1
+        return [list(row) for row in self.rows]
+
+    def update_cell(self, row: int, col: int, value: str) -> None:
+        self.calls += 1
+        self.rows[row - 1][col - 1] = value
+
+    def delete_rows(self, row: int) -> None:
+        self.calls += 1
+        del self.rows[row - 1]
+
+    def batch_update(self, data: list[dict], value_input_option: str | None = None) -> None:
+        self.calls += 1
+        for value_range in data:
+            start, end = value_range["range"].split(":")
+            column = ord(start[0]) - ord("A")
+            for offset, row in enumerate(range(int(start[1:]), int(end[1:]) + 1)):
+                self.rows[row - 1][column] = value_range["values"][offset][0]
+
+
+def legacy_sheet(rows: int, rejected_every: int) -> list[list[str]]:
+    timestamp = datetime.now(timezone.utc).isoformat()
+    return [
+        [timestamp, f"Candidate {n}"]
+        + [""] * 8
+        + ["0", "", "rejected" if n % rejected_every == 0 else ""]
+        for n in range(rows)
+    ]
+
+
+class StubSheetsRepository(SheetsRepository):
+    """``SheetsRepository`` wired to a stub worksheet instead of Google."""
+
+    def __init__(self, worksheet: CountingWorksheet) -> None:
+        self._stub = worksheet
+        super().__init__(settings=SETTINGS)
+
+    def _bootstrap_google_sheet(self) -> CountingWorksheet:
+        return self._stub
+
+
+class UnbatchedSheetsRepository(StubSheetsRepository):
+    """The per-cell backfill and per-row delete loops the batched paths replaced."""
+
+    def _fill_missing_metadata(self, updates, header_index) -> None:
+        for row_index, candidate_id, status_value in updates:
+            if candidate_id and "Candidate ID" in header_index:
+                self._worksheet.update_cell(
+                    row_index, header_index["Candidate ID"] + 1, candidate_id
+                )
+            if status_value and "Status" in header_index:
+                self._worksheet.update_cell(row_index, header_index["Status"] + 1, status_value)
+
+    def _delete_sheet_rows(self, rows) -> None:
+        for row in sorted(rows, reverse=True):
+            self._worksheet.delete_rows(row)
+
+
+def measure(repository_class: type, data: list[list[str]]) -> tuple[int, int, int]:
+    """Backfill calls, delete-by-status calls and rows removed for one code path."""
+
+    worksheet = CountingWorksheet([list(row) for row in data])
+    repository = repository_class(worksheet)
+    worksheet.calls = 0
+    repository.list_candidates()
+    backfill_calls = worksheet.calls - 1  # minus get_all_values
+    worksheet.calls = 0
+    removed = repository.delete_by_status(CandidateStatus.REJECTED)
+    return backfill_calls, worksheet.calls, removed
+
+
+def run(rows: int, rejected_every: int) -> None:
+    data = legacy_sheet(rows, rejected_every)
+    before_backfill, before_delete, removed = measure(UnbatchedSheetsRepository, data)
+    after_backfill, after_delete, _ = measure(StubSheetsRepository, data)
+
+    print(f"rows={rows} rejected={removed}")
+    print(f"metadata backfill: before={before_backfill} calls, after={after_backfill}")
+    print(f"delete_by_status:  before={before_delete} calls, after={after_delete}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rejected-every", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.rejected_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ from ..app.services.storage_service import StorageService
 def main() -> None:
     settings = get_settings()
     storage = StorageService(
-        sheets_repository=SheetsRepository(settings),
+        candidate_repository=SheetsRepository(settings),
         drive_repository=DriveRepository(settings),
         audit_repository=AuditRepository(),
         settings=settings,
@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useEffect, useMemo, useRef, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import api from "../services/api";
 import { getCurrentUser, logout } from "../services/auth";
@@ -9,6 +9,7 @@ import {
   updateCandidateStatus,
   deleteCandidate as removeCandidate,
   deleteCandidatesByStatus,
+  subscribeToCandidateEvents,
 } from "../services/candidates";
 
 const Dashboard = () => {
@@ -18,6 +19,7 @@ const Dashboard = () => {
     interview: [],
     selected: [],
     rejected: [],
+    counts: {},
   });
   const [boardLoading, setBoardLoading] = useState(true);
   const [boardError, setBoardError] = useState(null);
@@ -84,6 +86,53 @@ const Dashboard = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [isAdmin]);
 
+  const liveRefresh = useRef({ timer: null, running: false, again: false });
+
+  useEffect(() => {
+    // Live updates replace polling: candidate events (or a resync after a reconnect) reload the board.
+    // A burst of events (e.g. a bulk import) is coalesced into one reload, and events that arrive
+    // while a reload is in flight trigger a single follow-up reload instead of overlapping ones.
+    const state = liveRefresh.current;
+    const reload = async () => {
+      state.timer = null;
+      if (state.running) {
+        state.again = true;
+        return;
+      }
+      state.running = true;
+      try {
+        await refreshBoard();
+      } finally {
+        state.running = false;
+      }
+      if (state.again) {
+        state.again = false;
+        reload();
+      }
+    };
+    const unsubscribe = subscribeToCandidateEvents(
+      () => {
+        if (!state.timer) {
+          state.timer = setTimeout(reload, 500);
+        }
+      },
+      {
+        onAuthError: (status) => {
+          if (status === 401) {
+            logout();
+            navigate("/login");
+          }
+        },
+      }
+    );
+    return () => {
+      clearTimeout(state.timer);
+      state.timer = null;
+      unsubscribe();
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
   const refreshBoard = async () => {
     setBoardLoading(true);
     setBoardError(null);
@@ -95,6 +144,7 @@ const Dashboard = () => {
         interview: data.interview || [],
         selected: data.selected || [],
         rejected: data.rejected || [],
+        counts: data.counts || {},
       });
     } catch (err) {
       if (err.response && err.response.status === 401) {
@@ -178,7 +228,7 @@ const Dashboard = () => {
   const statusCounts = useMemo(() => {
     const counts = {};
     statusOrder.forEach((status) => {
-      counts[status] = board[status]?.length || 0;
+      counts[status] = board.counts?.[status] ?? (board[status]?.length || 0);
     });
     return counts;
   }, [board, statusOrder]);
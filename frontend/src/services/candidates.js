@@ -1,7 +1,7 @@
-import api from "./api";
+import api, { API_BASE_URL } from "./api";
 
-export const fetchCandidateBoard = async () => {
-  const response = await api.get("/candidates/board");
+export const fetchCandidateBoard = async (perColumnLimit = 100) => {
+  const response = await api.get("/candidates/board", { params: { per_column_limit: perColumnLimit } });
   return response.data;
 };
 
@@ -19,3 +19,62 @@ export const deleteCandidatesByStatus = async (status) => {
   const response = await api.delete("/candidates", { params: { status } });
   return response.data;
 };
+
+// EventSource cannot send the Authorization header, so read the SSE stream with fetch.
+// Reconnects every 5s after network errors; a 401/403 stops the loop and calls onAuthError.
+export const subscribeToCandidateEvents = (onEvent, { onAuthError } = {}) => {
+  const controller = new AbortController();
+  let lastEventId = null;
+
+  const connect = async () => {
+    while (!controller.signal.aborted) {
+      try {
+        const headers = { Authorization: `Bearer ${localStorage.getItem("smarthire_token")}` };
+        if (lastEventId) {
+          headers["Last-Event-ID"] = lastEventId;
+        }
+        const response = await fetch(`${API_BASE_URL}/candidates/stream`, { headers, signal: controller.signal });
+        if (response.status === 401 || response.status === 403) {
+          controller.abort();
+          if (onAuthError) {
+            onAuthError(response.status);
+          }
+          return;
+        }
+        if (!response.ok || !response.body) {
+          throw new Error(`stream failed with ${response.status}`);
+        }
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = "";
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) {
+            break;
+          }
+          buffer += value;
+          const frames = buffer.split("\n\n");
+          buffer = frames.pop();
+          frames.forEach((frame) => {
+            const event = { type: "message", data: "" };
+            frame.split("\n").forEach((line) => {
+              if (line.startsWith("event: ")) event.type = line.slice(7);
+              else if (line.startsWith("id: ")) lastEventId = line.slice(4);
+              else if (line.startsWith("data: ")) event.data += line.slice(6);
+            });
+            if (event.data) {
+              onEvent(event.type, JSON.parse(event.data));
+            }
+          });
+        }
+      } catch (err) {
+        if (controller.signal.aborted) {
+          return;
+        }
+      }
+      await new Promise((resolve) => setTimeout(resolve, 5000));
+    }
+  };
+
+  connect();
+  return () => controller.abort();
+};
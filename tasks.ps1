@@ -1,6 +1,6 @@
 param(
     [Parameter(Position = 0)]
-    [ValidateSet("install", "run-backend", "lint", "format", "test", "download-model")]
+    [ValidateSet("install", "run-backend", "run-worker", "lint", "format", "test", "download-model")]
     [string]$Task = "run-backend"
 )
 
@@ -15,8 +15,10 @@ switch ($Task) {
         }
     }
     "run-backend" {
-        Set-Location backend
-        uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+        uvicorn backend.app.main:app --reload --host 0.0.0.0 --port 8000
+    }
+    "run-worker" {
+        python -m backend.app.workers.runner
     }
     "lint" {
         ruff check backend